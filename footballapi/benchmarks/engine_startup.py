@@ -0,0 +1,66 @@
+"""Benchmark comparing cold start and memory of the odds engine modes.
+
+Every run is a fresh interpreter importing the worker's `engine` module with
+`ENGINE` set and answering one odds request, as a newly scaled worker does.
+Run from the `footballapi` directory:
+
+    ODDS_ENGINE_PATH=../oddscalc/src python -m benchmarks.engine_startup numpy statsmodels [repeats]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from src.config import config
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import numpy as np
+from engine import compute
+imported = time.perf_counter()
+window = np.array([[1, 2, 2, 1], [2, 3, 0, 0], [3, 1, 1, 2], [1, 3, 3, 1], [2, 1, 1, 1]], dtype=np.int32)
+compute("odds", {"fixture": [1, 2], "window": window})
+answered = time.perf_counter()
+print(__import__("json").dumps({
+    "import": imported - start,
+    "first": answered - imported,
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "heavy": sorted(name for name in ("pandas", "statsmodels", "patsy", "scipy") if name in sys.modules),
+}))
+"""
+
+
+def probe(engine: str) -> dict:
+    """Starting an interpreter with the engine and measuring it.
+
+    Args:
+        engine (str): The `ENGINE` of the worker, "numpy" or "statsmodels".
+
+    Returns:
+        dict: The import and first request seconds, the peak RSS in kB and the heavy modules loaded.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=config.ODDS_ENGINE_PATH,
+        env={**os.environ, "ENGINE": engine},
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(engines: list[str], repeats: int) -> None:
+    for engine in engines:
+        runs = [probe(engine) for _ in range(repeats)]
+        median = {key: sorted(run[key] for run in runs)[len(runs) // 2] for key in ("import", "first", "rss")}
+        print(f"{engine:>12}: import {median['import'] * 1000:.0f} ms, "
+              f"first request {median['first'] * 1000:.0f} ms, "
+              f"peak RSS {median['rss'] / 1024:.1f} MB, heavy modules {', '.join(runs[0]['heavy']) or 'none'}")
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[-1]) if sys.argv[-1].isdigit() else 5
+    main([arg for arg in sys.argv[1:] if not arg.isdigit()] or ["numpy", "statsmodels"], repeats)
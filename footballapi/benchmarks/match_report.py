@@ -0,0 +1,93 @@
+"""Benchmark comparing the single-statement match report with the multi-query path.
+
+Run from the `footballapi` directory against a populated database:
+
+    python -m benchmarks.match_report <match_api_id> [repeats]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+from src.container import Container
+from src.db import database
+
+
+async def multi_query_report(match_api_id: int) -> str:
+    """Building the match report the way clients do it today.
+
+    Args:
+        match_api_id (int): The id of a match.
+
+    Returns:
+        str: The encoded report.
+    """
+    match = await Container.match_repository().get_by_match_api_id(match_api_id)
+    teams = Container.team_repository()
+    players = Container.player_repository()
+    home_team = await teams.get_by_team_api_id(match.home_team_api_id)
+    away_team = await teams.get_by_team_api_id(match.away_team_api_id)
+    lineups = {}
+    for side in ("home", "away"):
+        lineups[side] = [
+            await players.get_by_player_api_id(player_api_id)
+            for i in range(1, 12)
+            if (player_api_id := getattr(match, f"{side}_player_{i}")) is not None
+        ]
+
+    return json.dumps({
+        "match": match.model_dump(exclude={"goals", "cards"}),
+        "home_team": home_team.model_dump() if home_team else None,
+        "away_team": away_team.model_dump() if away_team else None,
+        "home_lineup": [player.model_dump() for player in lineups["home"] if player],
+        "away_lineup": [player.model_dump() for player in lineups["away"] if player],
+        "goals": [goal.model_dump() for goal in match.goals],
+        "cards": [card.model_dump() for card in match.cards],
+    })
+
+
+async def single_query_report(match_api_id: int) -> str:
+    """Building the match report with one json_agg statement.
+
+    Args:
+        match_api_id (int): The id of a match.
+
+    Returns:
+        str: The encoded report.
+    """
+    return await Container.match_repository().get_report(match_api_id)
+
+
+async def measure(name: str, func, match_api_id: int, repeats: int) -> None:
+    """Timing a report builder and printing the results.
+
+    Args:
+        name (str): The label of the builder.
+        func: The coroutine function building the report.
+        match_api_id (int): The id of a match.
+        repeats (int): The number of timed runs.
+    """
+    await func(match_api_id)
+    timings = []
+    size = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        size = len(await func(match_api_id))
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(f"{name:>12}: median {timings[len(timings) // 2] * 1000:.2f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95) - 1] * 1000:.2f} ms, {size} bytes")
+
+
+async def main(match_api_id: int, repeats: int) -> None:
+    await database.connect()
+    try:
+        await measure("multi-query", multi_query_report, match_api_id, repeats)
+        await measure("json_agg", single_query_report, match_api_id, repeats)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]), int(sys.argv[2]) if len(sys.argv) > 2 else 100))
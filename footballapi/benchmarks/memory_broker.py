@@ -0,0 +1,261 @@
+"""An in-memory stand-in for the subset of aio-pika the odds RPC uses.
+
+It covers what `src/rabbitmq.py` and `oddscalc/src/main.py` need: the
+default exchange, consistent-hash exchanges, named and exclusive
+(server-named) queues, `x-max-priority` queues, callback consumers and queue iterators,
+`message.process()` acknowledgements, correlation ids, reply_to and
+per-channel prefetch. Patch a module's `connect` with
+`MemoryBroker.connect` to run it without RabbitMQ.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from aio_pika import Message
+
+
+class MemoryMessage:
+    """A delivered message, mirroring `AbstractIncomingMessage`."""
+
+    def __init__(self, message: Message, queue: "MemoryQueue", routing_key: str, no_ack: bool) -> None:
+        self.body = message.body
+        self.content_type = message.content_type
+        self.headers = message.headers
+        self.correlation_id = message.correlation_id
+        self.reply_to = message.reply_to
+        self.type = message.type
+        self.priority = message.priority
+        self.routing_key = routing_key
+        self._message = message
+        self._queue = queue
+        self._channel = queue.channel
+        self._settled = no_ack
+
+    def ack(self) -> None:
+        if not self._settled:
+            self._settled = True
+            self._channel.settle()
+
+    def reject(self, requeue: bool = False) -> None:
+        if not self._settled:
+            self._settled = True
+            self._channel.settle()
+            if requeue:
+                self._queue.put(self._message, self.routing_key)
+
+    @asynccontextmanager
+    async def process(self, requeue: bool = False) -> AsyncIterator["MemoryMessage"]:
+        try:
+            yield self
+        except BaseException:
+            self.reject(requeue=requeue)
+            raise
+        else:
+            self.ack()
+
+
+class MemoryQueue:
+    """A queue holding messages until a consumer of its channel takes them."""
+
+    def __init__(self, name: str, channel: "MemoryChannel", exclusive: bool = False, max_priority: int = 0) -> None:
+        self.name = name
+        self.channel = channel
+        self.exclusive = exclusive
+        self.max_priority = max_priority
+        # (-priority, arrival, message, routing key): higher priorities first, FIFO within one
+        self.messages: asyncio.PriorityQueue[tuple[int, int, Message, str]] = asyncio.PriorityQueue()
+        self._arrivals = itertools.count()
+        self.consumers: list[asyncio.Task] = []
+        self.exchanges: list["MemoryExchange"] = []
+
+    async def bind(self, exchange: "MemoryExchange", routing_key: str = "", **kwargs) -> None:
+        exchange.bind(self, routing_key)
+        self.exchanges.append(exchange)
+
+    def put(self, message: Message, routing_key: str) -> None:
+        priority = min(message.priority or 0, self.max_priority)
+        self.messages.put_nowait((-priority, next(self._arrivals), message, routing_key))
+
+    def delete(self) -> None:
+        for consumer in self.consumers:
+            consumer.cancel()
+        for exchange in self.exchanges:
+            exchange.unbind(self)
+        self.channel.broker.queues.pop(self.name, None)
+
+    async def _deliver(self, no_ack: bool) -> MemoryMessage:
+        if not no_ack:
+            await self.channel.reserve()
+        _, _, message, routing_key = await self.messages.get()
+        return MemoryMessage(message, self, routing_key, no_ack)
+
+    async def consume(self, callback: Callable[[MemoryMessage], Awaitable], no_ack: bool = False) -> str:
+        async def consumer() -> None:
+            while True:
+                await callback(await self._deliver(no_ack))
+
+        self.consumers.append(asyncio.create_task(consumer()))
+        return f"ctag.{len(self.consumers)}"
+
+    @asynccontextmanager
+    async def iterator(self) -> AsyncIterator["MemoryQueueIterator"]:
+        yield MemoryQueueIterator(self)
+
+
+class MemoryQueueIterator:
+    """An async iterator over the deliveries of a queue."""
+
+    def __init__(self, queue: MemoryQueue) -> None:
+        self.queue = queue
+
+    def __aiter__(self) -> "MemoryQueueIterator":
+        return self
+
+    async def __anext__(self) -> MemoryMessage:
+        return await self.queue._deliver(no_ack=False)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class MemoryExchange:
+    """The default exchange, routing by queue name, or a consistent-hash one.
+
+    A consistent-hash exchange places every bound queue on a hash ring as
+    many times as its binding's weight and sends a message to the first
+    queue after the hash of its routing key, like the RabbitMQ plugin.
+    """
+
+    points_per_weight: int = 100
+
+    def __init__(self, broker: "MemoryBroker", name: str = "", type: str = "direct") -> None:
+        self.broker = broker
+        self.name = name
+        self.type = type
+        self.bindings: dict[str, tuple[MemoryQueue, int]] = {}
+        self._ring: list[tuple[int, str]] = []
+
+    def bind(self, queue: MemoryQueue, routing_key: str) -> None:
+        self.bindings[queue.name] = (queue, int(routing_key or 1))
+        self._rebuild()
+
+    def unbind(self, queue: MemoryQueue) -> None:
+        self.bindings.pop(queue.name, None)
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._ring = sorted(
+            (_hash(f"{name}:{point}"), name)
+            for name, (_, weight) in self.bindings.items()
+            for point in range(weight * self.points_per_weight)
+        )
+
+    async def publish(self, message: Message, routing_key: str, **kwargs) -> None:
+        if not self.name:
+            self.broker.route(message, routing_key)
+            return
+        self.broker.published += 1
+        if not self._ring:
+            self.broker.unroutable += 1
+            return
+        index = bisect.bisect(self._ring, (_hash(routing_key), "")) % len(self._ring)
+        queue, _ = self.bindings[self._ring[index][1]]
+        queue.put(message, routing_key)
+
+
+class MemoryChannel:
+    """A channel counting unacknowledged deliveries against its prefetch."""
+
+    def __init__(self, broker: "MemoryBroker") -> None:
+        self.broker = broker
+        self.default_exchange = MemoryExchange(broker)
+        self.prefetch_count = 0
+        self.unacked = 0
+        self._slots: asyncio.Semaphore | None = None
+
+    async def set_qos(self, prefetch_count: int = 0, **kwargs) -> None:
+        self.prefetch_count = prefetch_count
+        self._slots = asyncio.Semaphore(prefetch_count) if prefetch_count else None
+
+    async def reserve(self) -> None:
+        if self._slots is not None:
+            await self._slots.acquire()
+        self.unacked += 1
+
+    def settle(self) -> None:
+        self.unacked -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    async def declare_exchange(self, name: str, type: str = "direct", **kwargs) -> MemoryExchange:
+        if name not in self.broker.exchanges:
+            self.broker.exchanges[name] = MemoryExchange(self.broker, name, type)
+        return self.broker.exchanges[name]
+
+    async def declare_queue(
+            self, name: str | None = None, exclusive: bool = False, arguments: dict | None = None, **kwargs,
+    ) -> MemoryQueue:
+        if not name:
+            name = f"amq.gen-{next(self.broker.names)}"
+        if name not in self.broker.queues:
+            max_priority = (arguments or {}).get("x-max-priority", 0)
+            self.broker.queues[name] = MemoryQueue(name, self, exclusive, max_priority)
+        return self.broker.queues[name]
+
+    async def close(self) -> None:
+        for queue in list(self.broker.queues.values()):
+            if queue.channel is self:
+                if queue.exclusive:
+                    queue.delete()
+                else:
+                    for consumer in queue.consumers:
+                        consumer.cancel()
+
+
+class MemoryConnection:
+    """A connection handing out channels of the broker."""
+
+    def __init__(self, broker: "MemoryBroker") -> None:
+        self.broker = broker
+        self.channels: list[MemoryChannel] = []
+        self.is_closed = False
+
+    async def channel(self) -> MemoryChannel:
+        channel = MemoryChannel(self.broker)
+        self.channels.append(channel)
+        return channel
+
+    async def close(self) -> None:
+        for channel in self.channels:
+            await channel.close()
+        self.is_closed = True
+
+
+class MemoryBroker:
+    """The broker: queues by name and counters of unroutable messages."""
+
+    def __init__(self) -> None:
+        self.queues: dict[str, MemoryQueue] = {}
+        self.exchanges: dict[str, MemoryExchange] = {}
+        self.names = itertools.count()
+        self.published = 0
+        self.unroutable = 0
+
+    async def connect(self, url: str = "", **kwargs) -> MemoryConnection:
+        return MemoryConnection(self)
+
+    def route(self, message: Message, routing_key: str) -> None:
+        self.published += 1
+        if (queue := self.queues.get(routing_key)) is None:
+            self.unroutable += 1
+            return
+        queue.put(message, routing_key)
+
+    def depth(self) -> int:
+        """The number of messages waiting in all queues."""
+        return sum(queue.messages.qsize() for queue in self.queues.values())
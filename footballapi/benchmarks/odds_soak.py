@@ -0,0 +1,102 @@
+"""Soak benchmark of the odds RPC path over the in-memory broker.
+
+The API's `OddsRpcClient` and the oddscalc worker's consumer loop run in
+one event loop, connected through `MemoryBroker` instead of RabbitMQ.
+By default the worker's engine is replaced with an echo, so the numbers
+measure the RPC path itself; `--engine` keeps the real models.
+Run from the `footballapi` directory:
+
+    ODDS_ENGINE_PATH=../oddscalc/src python -m benchmarks.odds_soak [requests] [concurrency] [--engine]
+
+A fraction of the calls is given up on with a short timeout, as a client
+would, to check that abandoned calls don't leak futures.
+"""
+
+import asyncio
+import importlib
+import random
+import resource
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.memory_broker import MemoryBroker
+from src import rabbitmq
+from src.config import config
+from src.rabbitmq import OddsRpcClient
+
+
+def echo(message_type: str | None, data) -> dict:
+    """A stand-in engine returning a fixed reply at once."""
+    return {"home_team": 0.45, "draw": 0.27, "away_team": 0.28}
+
+
+def percentile(timings: list[float], q: float) -> float:
+    return timings[min(len(timings) - 1, int(len(timings) * q))] * 1000
+
+
+async def main(requests: int, concurrency: int, engine: bool, abandon: float = 0.05) -> None:
+    if config.ODDS_ENGINE_PATH not in sys.path:
+        sys.path.append(config.ODDS_ENGINE_PATH or "../oddscalc/src")
+    worker = importlib.import_module("main")
+
+    broker = MemoryBroker()
+    rabbitmq.connect = broker.connect
+    worker.connect = broker.connect
+    if not engine:
+        worker.compute = echo
+
+    worker_task = asyncio.create_task(worker.main())
+    await asyncio.sleep(0.1)
+    client = await OddsRpcClient().connect()
+
+    rng = np.random.default_rng(0)
+    window = np.column_stack([rng.choice(np.arange(1000, 1020), size=(10, 2)), rng.poisson(1.3, size=(10, 2))])
+    payload = {"fixture": window[0, :2].tolist(), "window": window.astype(np.int32)}
+
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: list[float] = []
+    abandoned = 0
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    async def one_call() -> None:
+        nonlocal abandoned
+        async with semaphore:
+            start = time.perf_counter()
+            if random.random() < abandon:
+                try:
+                    await asyncio.wait_for(client.call(payload, message_type="odds"), timeout=0.0001)
+                except asyncio.TimeoutError:
+                    abandoned += 1
+                    return
+            else:
+                await client.call(payload, message_type="odds")
+            timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_call() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    # let replies to abandoned calls arrive
+    await asyncio.sleep(0.5)
+
+    timings.sort()
+    print(f"{len(timings)} completed, {abandoned} abandoned in {elapsed:.2f} s "
+          f"({requests / elapsed:.0f} req/s at concurrency {concurrency})")
+    print(f"latency ms: p50 {percentile(timings, 0.5):.2f}, p95 {percentile(timings, 0.95):.2f}, "
+          f"p99 {percentile(timings, 0.99):.2f}, max {timings[-1] * 1000:.2f}")
+    print(f"leaked futures: {len(client.futures)}, queued messages: {broker.depth()}, "
+          f"unroutable replies: {broker.unroutable}, "
+          f"max RSS growth: {(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024:.1f} MB")
+
+    worker_task.cancel()
+    worker.pool.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    asyncio.run(main(
+        int(arguments[0]) if arguments else 5000,
+        int(arguments[1]) if len(arguments) > 1 else 200,
+        "--engine" in sys.argv,
+    ))
@@ -0,0 +1,88 @@
+"""Benchmark comparing latency and throughput of the odds transports.
+
+Run from the `footballapi` directory with the modes to compare:
+
+    ODDS_ENGINE_PATH=../oddscalc/src python -m benchmarks.odds_transport inprocess unix amqp
+
+`unix` needs a worker started with `TRANSPORT=unix python main.py` and
+`amqp` a broker and a worker; both use the usual settings from the environment.
+"""
+
+import asyncio
+import sys
+import time
+
+import numpy as np
+
+from src.rabbitmq import OddsRpcClient
+from src.transports.inprocess import InProcessOddsTransport
+from src.transports.itransport import IOddsTransport
+from src.transports.unix_socket import UnixSocketOddsTransport
+
+TRANSPORTS = {
+    "amqp": OddsRpcClient,
+    "inprocess": InProcessOddsTransport,
+    "unix": UnixSocketOddsTransport,
+}
+
+
+def synthetic_payload(window: int = 10) -> dict:
+    """Building an odds request with a random training window.
+
+    Args:
+        window (int): The number of previous matches.
+
+    Returns:
+        dict: The payload.
+    """
+    rng = np.random.default_rng(0)
+    teams = rng.choice(np.arange(1000, 1020), size=(window, 2), replace=True)
+    goals = rng.poisson(1.3, size=(window, 2))
+    return {"fixture": teams[0].tolist(), "window": np.column_stack([teams, goals]).astype(np.int32)}
+
+
+async def measure(name: str, transport: IOddsTransport, requests: int, concurrency: int) -> None:
+    """Timing sequential and concurrent calls and printing the results.
+
+    Args:
+        name (str): The label of the transport.
+        transport (IOddsTransport): The connected transport.
+        requests (int): The number of calls of each run.
+        concurrency (int): The number of calls in flight in the throughput run.
+    """
+    payload = synthetic_payload()
+    await transport.call(payload, message_type="odds")
+
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        await transport.call(payload, message_type="odds")
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded_call() -> None:
+        async with semaphore:
+            await transport.call(payload, message_type="odds")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded_call() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:>10}: median {timings[len(timings) // 2] * 1000:.2f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95) - 1] * 1000:.2f} ms, "
+          f"{requests / elapsed:.0f} req/s at concurrency {concurrency}")
+
+
+async def main(modes: list[str], requests: int = 200, concurrency: int = 32) -> None:
+    for mode in modes:
+        transport = await TRANSPORTS[mode]().connect()
+        try:
+            await measure(mode, transport, requests, concurrency)
+        finally:
+            await transport.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:] or ["inprocess"]))
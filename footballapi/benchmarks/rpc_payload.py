@@ -0,0 +1,80 @@
+"""Benchmark comparing the legacy JSON odds payload with the msgpack one.
+
+Synthetic `Match` rows are used, so no database or broker is needed.
+Run from the `footballapi` directory:
+
+    python -m benchmarks.rpc_payload [window] [repeats]
+"""
+
+import json
+import random
+import sys
+import time
+
+import numpy as np
+import simplejson
+
+from src.db import match_table
+from src.utils.rpc_codec import decode, encode
+
+
+def synthetic_rows(count: int) -> list[dict]:
+    """Building match rows with every column of `match_table` filled.
+
+    Args:
+        count (int): The number of rows.
+
+    Returns:
+        list[dict]: The rows.
+    """
+    return [
+        {column.name: random.randint(1, 100000) for column in match_table.columns}
+        for _ in range(count)
+    ]
+
+
+def measure(name: str, func, repeats: int) -> None:
+    """Timing a round trip and printing the results.
+
+    Args:
+        name (str): The label of the format.
+        func: The function encoding and decoding, returning the request size.
+        repeats (int): The number of timed runs.
+    """
+    size = func()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    elapsed = (time.perf_counter() - start) / repeats
+    print(f"{name:>8}: {elapsed * 1e6:.1f} us per round trip, {size} bytes per request")
+
+
+def main(window: int, repeats: int) -> None:
+    rows = synthetic_rows(window + 1)
+    reply = {"home_team": 0.45, "draw": 0.27, "away_team": 0.28}
+
+    def legacy() -> int:
+        body = simplejson.dumps(rows, use_decimal=True).encode()
+        json.loads(body.decode())
+        json.loads(str(reply).replace("'", '"'))
+        return len(body)
+
+    def compact() -> int:
+        body = encode({
+            "fixture": [rows[0]["home_team_api_id"], rows[0]["away_team_api_id"]],
+            "window": np.array(
+                [[row["home_team_api_id"], row["away_team_api_id"], row["home_team_goal"], row["away_team_goal"]]
+                 for row in rows[1:]],
+                dtype=np.int32,
+            ),
+        })
+        decode(body)
+        decode(encode(reply))
+        return len(body)
+
+    measure("json", legacy, repeats)
+    measure("msgpack", compact, repeats)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10, int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
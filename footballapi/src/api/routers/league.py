@@ -1,13 +1,15 @@
 """A module containing league endpoints."""
 
+from datetime import date as Date
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 
 from src.container import Container
 from src.infrastructure.dto.leaguedto import LeagueDTO
 from src.infrastructure.services.ileague import ILeagueService
+from src.infrastructure.services.isimulation import ISimulationService
 
 router = APIRouter()
 
@@ -128,3 +130,91 @@ async def stats(
         return stats_dict
 
     raise HTTPException(status_code=404, detail="League not found")
+
+
+@router.get("/elo/{league_id}", response_model=dict, status_code=200)
+@inject
+async def get_elo(
+        league_id: int,
+        date: Date | None = None,
+        service: ILeagueService = Depends(Provide[Container.league_service]),
+) -> dict:
+    """An endpoint for getting Elo ratings of a league's teams as of a date.
+
+    Args:
+        league_id (int): The id of the league.
+        date (Date | None): The as-of date "YYYY-MM-DD", the latest ratings by default.
+        service (ILeagueService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if the league has no match played by the date.
+
+    Returns:
+        dict: The teams of the league's current season ordered by rating.
+    """
+
+    if elo := await service.get_elo(league_id, date):
+        return elo
+
+    raise HTTPException(status_code=404, detail="League not found")
+
+
+@router.get("/standings/{league_id}/{season}", response_model=dict, status_code=200)
+@inject
+async def get_standings(
+        league_id: int,
+        season: str = Path(pattern=r"^\d{4}-\d{4}$"),
+        stage: int | None = Query(None, ge=1),
+        service: ILeagueService = Depends(Provide[Container.league_service]),
+) -> dict:
+    """An endpoint for getting the standings of a league season after a stage.
+
+    Args:
+        league_id (int): The id of the league.
+        season (str): The season in the format "YYYY-YYYY".
+        stage (int | None): The stage, the last played one by default.
+        service (ILeagueService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if there is no such league season or stage.
+
+    Returns:
+        dict: The table with points, goals and W/D/L, split into home and away.
+    """
+
+    if standings := await service.get_standings(league_id, season.replace("-", "/"), stage):
+        return standings
+
+    raise HTTPException(status_code=404, detail="Standings not found")
+
+
+@router.get("/simulate/{league_id}/{season}", response_model=dict, status_code=200)
+@inject
+async def simulate(
+        league_id: int,
+        season: str = Path(pattern=r"^\d{4}-\d{4}$"),
+        after_stage: int = Query(..., ge=1),
+        n: int = Query(10000, ge=100, le=100000),
+        service: ISimulationService = Depends(Provide[Container.simulation_service]),
+) -> dict:
+    """An endpoint for simulating the rest of a league season.
+
+    Args:
+        league_id (int): The id of the league.
+        season (str): The season in the format "YYYY-YYYY".
+        after_stage (int): The last stage treated as played.
+        n (int): The number of simulated seasons.
+        service (ISimulationService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if nothing was played in the season by the stage.
+
+    Returns:
+        dict: Expected points, title, relegation and finishing position
+            probabilities of every team.
+    """
+
+    if result := await service.simulate(league_id, season.replace("-", "/"), after_stage, n):
+        return result
+
+    raise HTTPException(status_code=404, detail="Season not found")
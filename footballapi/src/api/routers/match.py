@@ -3,11 +3,15 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from src.container import Container
+from src.infrastructure.dto.lineup_attributesdto import LineupAttributesDTO
+from src.infrastructure.dto.lineup_strengthdto import LineupStrengthDTO
+from src.infrastructure.dto.match_featuresdto import MatchFeaturesDTO
 from src.infrastructure.dto.matchdto import MatchDTO
 from src.infrastructure.services.imatch import IMatchService
+from src.infrastructure.services.imatch_features import IMatchFeaturesService
 
 router = APIRouter()
 
@@ -159,3 +163,112 @@ async def get_by_team_api_id(
         return matches
 
     raise HTTPException(status_code=404, detail="Matches not found")
+
+
+@router.get("/report/{match_api_id}", status_code=200)
+@inject
+async def get_report(
+        match_api_id: int,
+        service: IMatchService = Depends(Provide[Container.match_service]),
+) -> Response:
+    """An endpoint for getting a full match report by match_api_id.
+
+    The report contains the match, both teams, both lineups and the goals
+    and cards of the match. It is passed through to the client as produced
+    by the database.
+
+    Args:
+        match_api_id (int): Match api id.
+        service (IMatchService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if there is no match with such match_api_id.
+
+    Returns:
+        Response: The match report JSON.
+    """
+
+    if report := await service.get_report(match_api_id=match_api_id):
+        return Response(content=report, media_type="application/json")
+
+    raise HTTPException(status_code=404, detail="Match not found")
+
+
+@router.get("/lineup_attributes/{match_api_id}", response_model=LineupAttributesDTO, status_code=200)
+@inject
+async def get_lineup_attributes(
+        match_api_id: int,
+        service: IMatchService = Depends(Provide[Container.match_service]),
+) -> dict:
+    """An endpoint for getting lineup player attributes as of the match date.
+
+    Args:
+        match_api_id (int): Match api id.
+        service (IMatchService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if there is no match with such match_api_id.
+
+    Returns:
+        dict: Attributes of the home and away lineups, ordered by position.
+    """
+
+    if lineup := await service.get_lineup_attributes(match_api_id=match_api_id):
+        return lineup.model_dump()
+
+    raise HTTPException(status_code=404, detail="Match not found")
+
+
+@router.get("/lineup_strength/{match_api_id}", response_model=LineupStrengthDTO, status_code=200)
+@inject
+async def get_lineup_strength(
+        match_api_id: int,
+        service: IMatchService = Depends(Provide[Container.match_service]),
+) -> dict:
+    """An endpoint for getting the rating aggregates of both starting lineups.
+
+    The aggregates are precomputed by `src.infrastructure.jobs.lineup_strength`.
+
+    Args:
+        match_api_id (int): Match api id.
+        service (IMatchService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if the lineup strength of the match wasn't computed.
+
+    Returns:
+        dict: The mean, min, max and count of known ratings of each lineup.
+    """
+
+    if strength := await service.get_lineup_strength(match_api_id=match_api_id):
+        return strength.model_dump()
+
+    raise HTTPException(status_code=404, detail="Lineup strength not found")
+
+
+@router.get("/features/{match_api_id}", response_model=MatchFeaturesDTO, status_code=200)
+@inject
+async def get_features(
+        match_api_id: int,
+        service: IMatchFeaturesService = Depends(Provide[Container.match_features_service]),
+) -> dict:
+    """An endpoint for getting the materialized features of a match.
+
+    The features are computed by the feature store job, see
+    `src.infrastructure.jobs.features`.
+
+    Args:
+        match_api_id (int): Match api id.
+        service (IMatchFeaturesService): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if the features of the match were not materialized.
+
+    Returns:
+        dict: The features of the match.
+    """
+
+    if features := await service.get_by_match_api_id(match_api_id=match_api_id):
+        return features.model_dump()
+
+    raise HTTPException(status_code=404, detail="Match features not found")
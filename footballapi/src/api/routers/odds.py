@@ -1,24 +1,85 @@
+from datetime import date
 from typing import Iterable
 
-import simplejson as json
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 
 from src.container import Container
 from src.infrastructure.dto.oddsdto import OddsDTO
+from src.infrastructure.indexes.goal_model import GoalModelKind
 from src.infrastructure.services.iodds import IOddsService
 
 router = APIRouter()
 
 
+@router.get("/fixture", response_model=OddsDTO, status_code=200)
+@inject
+async def get_fixture_odds(home: int = Query(...),
+                           away: int = Query(...),
+                           league: int = Query(...),
+                           as_of: date | None = Query(None),
+                           model: GoalModelKind = Query("poisson"),
+                           service: IOddsService = Depends(Provide[Container.odds_service]), ) -> dict:
+    """An endpoint for getting win likelihood of a hypothetical fixture.
+
+        Args:
+            home (int): The team_api_id of the home team.
+            away (int): The team_api_id of the away team.
+            league (int): The id of the league whose model prices the fixture.
+            as_of (date | None): Only matches before this date are used, all if None.
+            model (GoalModelKind): The goal model, "poisson" fitted on the latest season
+                or "dixon_coles" fitted on the whole league history with time decay.
+            service (IOddsService): The injected service dependency.
+
+        Raises:
+            HTTPException: 404 if the league has no model for the teams.
+
+        Returns:
+            dict: The predicted odds.
+    """
+    if result := await service.get_fixture_odds(home, away, league, as_of, model):
+        return result
+
+    raise HTTPException(status_code=404, detail="No model for these teams")
+
+
+@router.post("/batch", response_model=dict[int, OddsDTO], status_code=200)
+@inject
+async def get_batch_odds(match_api_ids: list[int] = Body(..., embed=True, min_length=1, max_length=500),
+                         service: IOddsService = Depends(Provide[Container.odds_service]), ) -> dict:
+    """An endpoint for getting win likelihood of many matches, e.g. a whole matchday, at once.
+        The prices are the ones `/odds/{match_api_id}` gives. Matches which
+        can't be priced, e.g. those without played matches before them in
+        the season, are absent from the reply.
+
+        Args:
+            match_api_ids (list[int]): The match_api_ids of the matches.
+            service (IOddsService): The injected service dependency.
+
+        Raises:
+            HTTPException: 404 if none of the matches could be priced.
+            OddsRequestShed: If the workers are busy with interactive requests, answered with 503.
+
+        Returns:
+            dict: The odds keyed by match_api_id.
+    """
+    if result := await service.get_batch_odds(match_api_ids):
+        return result
+
+    raise HTTPException(status_code=404, detail="No such matches")
+
+
 @router.get("/{match_api_id}", response_model=OddsDTO, status_code=200)
 @inject
 async def get_odds(match_api_id: int,
+                   model: GoalModelKind | None = Query(None),
                    service: IOddsService = Depends(Provide[Container.odds_service]), ) -> Iterable:
     """An endpoint for getting win likelihood of a match by its match_api_id.
 
         Args:
             match_api_id (int): The match_api_id of the match.
+            model (GoalModelKind | None): The league's goal model as of the match date,
+                instead of the model fitted on the previous 10 matches.
             service (IOddsService): The injected service dependency.
 
         Raises:
@@ -27,17 +88,12 @@ async def get_odds(match_api_id: int,
         Returns:
             dict: The requested team attributes.
     """
-    previous_matches = await service.get_previous_matches(match_api_id)
-    if previous_matches is None:
+    if model is not None:
+        if result := await service.get_model_odds(match_api_id, model):
+            return result
         raise HTTPException(status_code=404, detail="No such match")
-    # print(previous_matches_dict)
-    previous_matches_dict = [dict(record) for record in previous_matches]
-    data_json = json.dumps(previous_matches_dict, use_decimal=True)
 
-    if result := await Container.rpc_client().call(data_json):
+    if result := await service.get_odds(match_api_id):
         return result
 
-    # if temp := await service.get_previous_matches(match_api_id):
-    #     return temp
-
-    #raise HTTPException(status_code=404, detail="No such match")
+    raise HTTPException(status_code=404, detail="No such match")
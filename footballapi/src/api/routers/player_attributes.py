@@ -1,12 +1,51 @@
+import json
+from typing import AsyncIterator, Literal
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from src.container import Container
+from src.db import player_rating_columns, player_skill_columns
 from src.infrastructure.dto.player_attributesdto import PlayerAttributesDTO
 from src.infrastructure.services.iplayer_attributes import IPlayerAttributesService
 
 router = APIRouter()
 
+HISTORY_ATTRIBUTES = (*player_rating_columns, *player_skill_columns)
+
+
+def _parse_attrs(attrs: str, allowed: tuple[str, ...] = HISTORY_ATTRIBUTES) -> list[str]:
+    """A function parsing a comma separated list of attribute columns.
+
+    Args:
+        attrs (str): The comma separated attribute names.
+        allowed (tuple[str, ...]): The attribute names accepted.
+
+    Raises:
+        HTTPException: 400 if any of the attributes is unknown.
+
+    Returns:
+        list[str]: The attribute names.
+    """
+    names = [name.strip() for name in attrs.split(",") if name.strip()]
+    if unknown := [name for name in names if name not in allowed]:
+        raise HTTPException(status_code=400, detail=f"Unknown attributes: {', '.join(unknown)}")
+    return names
+
+
+async def _ndjson(histories: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """A function encoding histories as newline delimited JSON.
+
+    Args:
+        histories (AsyncIterator[dict]): The player histories.
+
+    Yields:
+        str: One JSON encoded history per line.
+    """
+    async for history in histories:
+        yield json.dumps(history) + "\n"
+
 
 @router.get("/player_api_id/{player_api_id}", response_model=PlayerAttributesDTO, status_code=200)
 @inject
@@ -30,3 +69,93 @@ async def get_by_player_api_id(player_api_id: int,
 
     raise HTTPException(status_code=404, detail="No such player")
 
+
+@router.get("/history", status_code=200)
+@inject
+async def get_histories(player_api_ids: str,
+                        attrs: str = ",".join(player_rating_columns),
+                        resolution: Literal["raw", "month", "season"] = "raw",
+                        service: IPlayerAttributesService = Depends(
+                            Provide[Container.player_attributes_service]), ) -> StreamingResponse:
+    """An endpoint streaming attribute histories of many players.
+
+        Args:
+            player_api_ids (str): Comma separated player_api_ids of the players.
+            attrs (str): Comma separated attribute columns.
+            resolution (str): "raw" rows, or averages per "month" or "season".
+            service (IPlayerAttributesService): The injected service dependency.
+
+        Raises:
+            HTTPException: 400 if the player ids or attributes are invalid.
+
+        Returns:
+            StreamingResponse: Newline delimited JSON, one columnar history per player.
+    """
+    try:
+        ids = [int(player_api_id) for player_api_id in player_api_ids.split(",") if player_api_id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid player_api_ids")
+
+    histories = service.get_history(ids, _parse_attrs(attrs) or player_rating_columns, resolution)
+    return StreamingResponse(_ndjson(histories), media_type="application/x-ndjson")
+
+
+@router.get("/history/{player_api_id}", response_model=dict, status_code=200)
+@inject
+async def get_history(player_api_id: int,
+                      attrs: str = ",".join(player_rating_columns),
+                      resolution: Literal["raw", "month", "season"] = "raw",
+                      service: IPlayerAttributesService = Depends(
+                          Provide[Container.player_attributes_service]), ) -> dict:
+    """An endpoint for getting the attribute history of a player.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            attrs (str): Comma separated attribute columns.
+            resolution (str): "raw" rows, or averages per "month" or "season".
+            service (IPlayerAttributesService): The injected service dependency.
+
+        Raises:
+            HTTPException: 400 if any of the attributes is unknown.
+            HTTPException: 404 if there is no player with such player_api_id.
+
+        Returns:
+            dict: The dates and the requested attributes as parallel arrays.
+    """
+    if history := await service.get_player_history(
+            player_api_id, _parse_attrs(attrs) or player_rating_columns, resolution,
+    ):
+        return history
+
+    raise HTTPException(status_code=404, detail="No such player")
+
+
+@router.get("/similar/{player_api_id}", response_model=list[dict], status_code=200)
+@inject
+async def get_similar(player_api_id: int,
+                      k: int = Query(10, ge=1, le=100),
+                      attrs: str = "",
+                      metric: Literal["cosine", "euclidean"] = "cosine",
+                      service: IPlayerAttributesService = Depends(
+                          Provide[Container.player_attributes_service]), ) -> list:
+    """An endpoint for getting players with the most similar current skills.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            k (int): The number of similar players.
+            attrs (str): Comma separated skills to compare, all by default.
+            metric (str): "cosine" similarity or "euclidean" distance.
+            service (IPlayerAttributesService): The injected service dependency.
+
+        Raises:
+            HTTPException: 400 if any of the skills is unknown.
+            HTTPException: 404 if there is no player with such player_api_id.
+
+        Returns:
+            list: The most similar players with their scores, best first.
+    """
+    skills = _parse_attrs(attrs, player_skill_columns) or None
+    if (similar := await service.get_similar(player_api_id, k, skills, metric)) is not None:
+        return similar
+
+    raise HTTPException(status_code=404, detail="No such player")
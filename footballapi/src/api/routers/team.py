@@ -1,9 +1,10 @@
 """A module containing team endpoints."""
 
+from datetime import date
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.container import Container
 from src.infrastructure.dto.teamdto import TeamDTO
@@ -123,3 +124,57 @@ async def get_stats(
         return stats
 
     raise HTTPException(status_code=404, detail="Team not found")
+
+
+@router.get("/elo/{team_api_id}", response_model=dict, status_code=200)
+@inject
+async def get_elo(
+        team_api_id: int,
+        service: ITeamService = Depends(Provide[Container.team_service]),
+) -> dict:
+    """An endpoint for getting the Elo rating of a team and its history.
+
+    Args:
+        team_api_id (int): The team_api_id of the team.
+        service (ITeamService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if the team has not played any match.
+
+    Returns:
+        dict: The current rating and the rating after every match.
+    """
+
+    if elo := await service.get_elo(team_api_id):
+        return elo
+
+    raise HTTPException(status_code=404, detail="Team not found")
+
+
+@router.get("/form/{team_api_id}", response_model=dict, status_code=200)
+@inject
+async def get_form(
+        team_api_id: int,
+        n: int = Query(5, ge=1),
+        as_of: date | None = Query(None),
+        service: ITeamService = Depends(Provide[Container.team_service]),
+) -> dict:
+    """An endpoint for getting the last results of a team.
+
+    Args:
+        team_api_id (int): The team_api_id of the team.
+        n (int): The number of results.
+        as_of (date | None): Only matches before this date are used, all if None.
+        service (ITeamService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if the team has not played any match.
+
+    Returns:
+        dict: The results, latest first, with their totals and form string.
+    """
+
+    if form := await service.get_form(team_api_id, n, as_of):
+        return form
+
+    raise HTTPException(status_code=404, detail="Team not found")
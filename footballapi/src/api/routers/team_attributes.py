@@ -1,5 +1,8 @@
+from datetime import date as Date
+from typing import Literal
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.container import Container
 from src.infrastructure.dto.team_attributesdto import TeamAttributesDTO
@@ -29,3 +32,32 @@ async def get_by_team_api_id(team_api_id: int,
 
     raise HTTPException(status_code=404, detail="No such team")
 
+
+@router.get("/similar/{team_api_id}", response_model=list[dict], status_code=200)
+@inject
+async def get_similar(team_api_id: int,
+                      date: Date | None = None,
+                      k: int = Query(10, ge=1, le=100),
+                      metric: Literal["cosine", "euclidean"] = "euclidean",
+                      service: ITeamAttributesService = Depends(Provide[Container.team_attributes_service]), ) -> list:
+    """An endpoint for getting teams with the most similar tactical profile.
+
+        Every team is compared by its latest attributes on or before the date.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+            date (Date | None): The as-of date "YYYY-MM-DD", the newest attributes by default.
+            k (int): The number of similar teams.
+            metric (str): "cosine" similarity or "euclidean" distance.
+            service (ITeamAttributesService): The injected service dependency.
+
+        Raises:
+            HTTPException: 404 if the team has no attributes before the date.
+
+        Returns:
+            list: The most similar teams with their snapshot dates and scores, best first.
+    """
+    if (similar := await service.get_similar(team_api_id, date, k, metric)) is not None:
+        return similar
+
+    raise HTTPException(status_code=404, detail="No such team")
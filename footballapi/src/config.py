@@ -1,6 +1,7 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from datetime import date
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,6 +20,31 @@ class AppConfig(BaseConfig):
     RABBITMQ_PORT: Optional[str] = None
     RABBITMQ_DEFAULT_USER: Optional[str] = None
     RABBITMQ_DEFAULT_PASS: Optional[str] = None
+    INDEX_REFRESH_INTERVAL: float = 60.0
+    ODDS_TRANSPORT: Literal["amqp", "inprocess", "unix"] = "amqp"
+    ODDS_EXCHANGE: Optional[str] = "odds.shards"
+    ODDS_PRIORITY: int = 5
+    ODDS_BATCH_PRIORITY: int = 2
+    ODDS_SHED_IN_FLIGHT: int = 32
+    ODDS_SHED_LATENCY: float = 1.0
+    ODDS_RPC_TIMEOUT: float = 30.0
+    ODDS_BREAKER_FAILURE_RATE: float = 0.5
+    ODDS_BREAKER_SLOW_CALL: float = 2.0
+    ODDS_BREAKER_WINDOW: int = 20
+    ODDS_BREAKER_MIN_CALLS: int = 10
+    ODDS_BREAKER_OPEN_FOR: float = 15.0
+    ODDS_BREAKER_PROBES: int = 1
+    ODDS_CACHE_SIZE: int = 4096
+    ODDS_PRECOMPUTE_DATES: int = 1
+    ODDS_PRECOMPUTE_INTERVAL: float = 600.0
+    ODDS_PRECOMPUTE_FROM: Optional[date] = None
+    ODDS_PRECOMPUTE_PRIORITY: int = 1
+    ODDS_PRECOMPUTE_CONCURRENCY: int = 4
+    ODDS_SOCKET_PATH: str = "/tmp/oddscalc.sock"
+    ODDS_ENGINE_PATH: Optional[str] = None
+    ODDS_ENGINE_WORKERS: Optional[int] = None
+    ODDS_DECAY_RATE: float = 0.0019
+    FEATURE_STORE_PATH: str = "/features/match_features.npz"
 
 
 config = AppConfig()
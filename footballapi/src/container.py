@@ -1,30 +1,43 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Factory, Selector, Singleton
 
+from src.config import config
 from src.infrastructure.repositories.carddb import CardRepository
 from src.infrastructure.repositories.countrydb import \
     CountryRepository
 from src.infrastructure.repositories.goaldb import GoalRepository
 from src.infrastructure.repositories.leaguedb import LeagueRepository
+from src.infrastructure.repositories.match_featuresdb import MatchFeaturesRepository
 from src.infrastructure.repositories.matchdb import MatchRepository
 from src.infrastructure.repositories.oddsdb import OddsRepository
 from src.infrastructure.repositories.player_attributesdb import PlayerAttributesRepository
 from src.infrastructure.repositories.playerdb import PlayerRepository
 from src.infrastructure.repositories.team_attributesdb import TeamAttributesRepository
 from src.infrastructure.repositories.teamdb import TeamRepository
+from src.infrastructure.indexes.elo import EloEngine
+from src.infrastructure.indexes.match_history import MatchHistory
+from src.infrastructure.indexes.player_similarity import PlayerSimilarityIndex
+from src.infrastructure.indexes.standings import StandingsIndex
+from src.infrastructure.indexes.team_form import TeamFormIndex
+from src.infrastructure.indexes.team_similarity import TeamSimilarityIndex
 from src.infrastructure.services.card import CardService
 from src.infrastructure.services.country import CountryService
 from src.infrastructure.services.goal import GoalService
 from src.infrastructure.services.league import LeagueService
 from src.infrastructure.services.match import MatchService
+from src.infrastructure.services.match_features import MatchFeaturesService
 from src.infrastructure.services.odds import OddsService
 from src.infrastructure.services.player import PlayerService
 from src.infrastructure.services.player_attributes import PlayerAttributesService
+from src.infrastructure.services.simulation import SimulationService
 from src.infrastructure.services.team import TeamService
 from src.infrastructure.services.team_attributes import TeamAttributesService
 from src.rabbitmq import OddsRpcClient
+from src.transports.inprocess import InProcessOddsTransport
+from src.transports.unix_socket import UnixSocketOddsTransport
+from src.utils.cache import LRUCache
 
 
 class Container(DeclarativeContainer):
@@ -34,12 +47,27 @@ class Container(DeclarativeContainer):
     card_repository = Singleton(CardRepository)
     goal_repository = Singleton(GoalRepository)
     match_repository = Singleton(MatchRepository)
+    match_features_repository = Singleton(MatchFeaturesRepository)
     odds_repository = Singleton(OddsRepository)
     player_repository = Singleton(PlayerRepository)
     player_attributes_repository = Singleton(PlayerAttributesRepository)
     team_repository = Singleton(TeamRepository)
     team_attributes_repository = Singleton(TeamAttributesRepository)
-    rpc_client = Singleton(OddsRpcClient)
+    rpc_client = Selector(
+        lambda: config.ODDS_TRANSPORT,
+        amqp=Singleton(OddsRpcClient),
+        inprocess=Singleton(InProcessOddsTransport),
+        unix=Singleton(UnixSocketOddsTransport),
+    )
+    simulation_cache = Singleton(LRUCache, maxsize=256)
+    odds_model_cache = Singleton(LRUCache, maxsize=512)
+    odds_cache = Singleton(LRUCache, maxsize=config.ODDS_CACHE_SIZE)
+    match_history = Singleton(MatchHistory)
+    elo_engine = Singleton(EloEngine, history=match_history)
+    standings_index = Singleton(StandingsIndex, history=match_history)
+    team_form_index = Singleton(TeamFormIndex, history=match_history)
+    player_similarity_index = Singleton(PlayerSimilarityIndex)
+    team_similarity_index = Singleton(TeamSimilarityIndex)
 
     country_service = Factory(
         CountryService,
@@ -48,7 +76,9 @@ class Container(DeclarativeContainer):
 
     league_service = Factory(
         LeagueService,
-        repository=league_repository
+        repository=league_repository,
+        elo=elo_engine,
+        standings=standings_index,
     )
 
     card_service = Factory(
@@ -66,6 +96,11 @@ class Container(DeclarativeContainer):
         repository=match_repository
     )
 
+    match_features_service = Factory(
+        MatchFeaturesService,
+        repository=match_features_repository,
+    )
+
     player_service = Factory(
         PlayerService,
         repository=player_repository
@@ -73,20 +108,35 @@ class Container(DeclarativeContainer):
 
     player_attributes_service = Factory(
         PlayerAttributesService,
-        repository=player_attributes_repository
+        repository=player_attributes_repository,
+        similarity_index=player_similarity_index,
     )
 
     team_service = Factory(
         TeamService,
-        repository=team_repository
+        repository=team_repository,
+        elo=elo_engine,
+        form=team_form_index,
     )
 
     team_attributes_service = Factory(
         TeamAttributesService,
-        repository=team_attributes_repository
+        repository=team_attributes_repository,
+        similarity_index=team_similarity_index,
     )
 
     odds_service = Factory(
         OddsService,
-        repository=odds_repository
+        repository=odds_repository,
+        rpc_client=rpc_client,
+        history=match_history,
+        models=odds_model_cache,
+        odds=odds_cache,
+    )
+
+    simulation_service = Factory(
+        SimulationService,
+        history=match_history,
+        rpc_client=rpc_client,
+        cache=simulation_cache,
     )
@@ -103,3 +103,52 @@ class IMatchRepository(ABC):
             Iterable[Any]: Matches with a certain player in the field.
         """
 
+    @abstractmethod
+    async def get_report(self, match_api_id: int) -> str | None:
+        """The abstract getting a full match report by a provided match_api_id.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            str | None: The match with its teams, lineups, goals and cards
+                as an already encoded JSON document.
+        """
+
+    @abstractmethod
+    async def get_lineup_attributes(self, match_api_id: int) -> Any | None:
+        """The abstract getting attributes of a match lineup as of the match date.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: Attributes of every lineup player at the match date.
+        """
+
+    @abstractmethod
+    async def get_lineup_strength(self, match_api_id: int) -> Any | None:
+        """The abstract getting the rating aggregates of a match's starting lineups.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: The lineup rating aggregates, None if they weren't computed.
+        """
+
+    @abstractmethod
+    async def get_lineups(self) -> Iterable[Any]:
+        """The abstract getting the starting lineups of all matches.
+
+        Returns:
+            Iterable[Any]: The match_api_id and the 22 lineup player_api_ids of every match.
+        """
+
+    @abstractmethod
+    async def replace_lineup_strength(self, records: Iterable[tuple]) -> None:
+        """The abstract replacing the lineup rating aggregates of all matches.
+
+        Args:
+            records (Iterable[tuple]): The rows, in the column order of the table.
+        """
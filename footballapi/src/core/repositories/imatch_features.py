@@ -0,0 +1,27 @@
+"""Module containing match features repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+
+class IMatchFeaturesRepository(ABC):
+    """An abstract class representing protocol of match features repository."""
+
+    @abstractmethod
+    async def get_by_match_api_id(self, match_api_id: int) -> Any | None:
+        """The abstract getting the materialized features of a match.
+
+        Args:
+            match_api_id (int): The match_api_id of the match.
+
+        Returns:
+            Any | None: The features of the match.
+        """
+
+    @abstractmethod
+    async def replace_all(self, records: Iterable[tuple]) -> None:
+        """The abstract replacing all materialized features.
+
+        Args:
+            records (Iterable[tuple]): The rows, in the column order of the table.
+        """
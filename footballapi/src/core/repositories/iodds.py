@@ -1,7 +1,7 @@
 """Module containing odds repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
 
 class IOddsRepository(ABC):
@@ -19,3 +19,35 @@ class IOddsRepository(ABC):
             Iterable[Any]: Matches.
         """
 
+    @abstractmethod
+    async def get_batch_windows(self, match_api_ids: Iterable[int]) -> list[tuple[list[Any], list[Any]]]:
+        """The abstract getting fixtures grouped by league, season and date
+        together with one shared training window per group.
+
+        Args:
+            match_api_ids (Iterable[int]): match_api_ids of the matches of which we are predicting odds
+
+        Returns:
+            list[tuple[list[Any], list[Any]]]: Pairs of fixtures and their training window.
+        """
+
+    @abstractmethod
+    async def get_upcoming_windows(self, start: str, dates: int) -> Iterable[Any]:
+        """The abstract getting the matches on the next dates together with
+        their training windows.
+
+        Args:
+            start (str): The first date, "YYYY-MM-DD".
+            dates (int): The number of match dates.
+
+        Returns:
+            Iterable[Any]: Matches with the window columns as arrays, newest first.
+        """
+
+    @abstractmethod
+    def stream_played_matches(self) -> AsyncIterator[Any]:
+        """The abstract streaming all played matches in date order.
+
+        Returns:
+            AsyncIterator[Any]: Matches with their league, season, date, teams and goals.
+        """
@@ -1,7 +1,7 @@
 """Module containing player attributes repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
 
 class IPlayerAttributesRepository(ABC):
@@ -18,3 +18,46 @@ class IPlayerAttributesRepository(ABC):
             Any | None: The players attributes.
         """
 
+    @abstractmethod
+    def get_history(
+            self,
+            player_api_ids: Iterable[int],
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> AsyncIterator[dict]:
+        """The abstract streaming attribute histories of players.
+
+        Args:
+            player_api_ids (Iterable[int]): The player_api_ids of the players.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            AsyncIterator[dict]: Columnar histories, one per player.
+        """
+
+    @abstractmethod
+    async def get_player_history(
+            self,
+            player_api_id: int,
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> dict | None:
+        """The abstract getting the attribute history of a player.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            dict | None: The columnar history, None if the player has no attributes.
+        """
+
+    @abstractmethod
+    async def get_rating_history(self) -> Iterable[Any]:
+        """The abstract getting the overall rating history of all players.
+
+        Returns:
+            Iterable[Any]: The player_api_id, date and overall_rating of every rating.
+        """
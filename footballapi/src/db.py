@@ -24,6 +24,9 @@ ORDER BY
 
 
 import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable
 
 import databases
 import sqlalchemy
@@ -36,6 +39,8 @@ from asyncpg.exceptions import (  # type: ignore
 
 from src.config import config
 
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
 metadata = sqlalchemy.MetaData()
 
 card_table = sqlalchemy.Table(
@@ -171,6 +176,14 @@ player_attributes_table = sqlalchemy.Table(
     sqlalchemy.Column('gk_reflexes', sqlalchemy.Integer)
 )
 
+player_rating_columns = ("overall_rating", "potential")
+
+player_skill_columns = tuple(
+    column.name for column in player_attributes_table.columns
+    if isinstance(column.type, sqlalchemy.Integer)
+    and column.name not in ("id", "player_fifa_api_id", "player_api_id", *player_rating_columns)
+)
+
 team_table = sqlalchemy.Table(
     "Team",
     metadata,
@@ -210,6 +223,69 @@ team_attributes_table = sqlalchemy.Table(
     sqlalchemy.Column('defenceDefenderLineClass', sqlalchemy.String)
 )
 
+player_attributes_latest_table = sqlalchemy.Table(
+    "Player_Attributes_Latest",
+    metadata,
+    *[
+        sqlalchemy.Column(column.name, column.type, primary_key=column.name == "player_api_id")
+        for column in player_attributes_table.columns
+    ]
+)
+
+team_attributes_latest_table = sqlalchemy.Table(
+    "Team_Attributes_Latest",
+    metadata,
+    *[
+        sqlalchemy.Column(column.name, column.type, primary_key=column.name == "team_api_id")
+        for column in team_attributes_table.columns
+    ]
+)
+
+team_tactic_columns = tuple(
+    column.name for column in team_attributes_table.columns
+    if isinstance(column.type, sqlalchemy.Integer)
+    and column.name not in ("id", "team_fifa_api_id", "team_api_id")
+)
+
+match_feature_columns = (
+    "home_form",
+    "away_form",
+    "home_goals_for",
+    "home_goals_against",
+    "away_goals_for",
+    "away_goals_against",
+    "home_rating",
+    "away_rating",
+    "home_rest_days",
+    "away_rest_days",
+)
+
+match_features_table = sqlalchemy.Table(
+    "Match_Features",
+    metadata,
+    sqlalchemy.Column("match_api_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("league_id", sqlalchemy.Integer),
+    sqlalchemy.Column("season", sqlalchemy.String),
+    sqlalchemy.Column("date", sqlalchemy.String),
+    *[sqlalchemy.Column(name, sqlalchemy.Float) for name in match_feature_columns],
+)
+
+lineup_strength_columns = tuple(
+    f"{side}_{aggregate}"
+    for side in ("home", "away")
+    for aggregate in ("rating_mean", "rating_min", "rating_max", "rated")
+)
+
+lineup_strength_table = sqlalchemy.Table(
+    "Lineup_Strength",
+    metadata,
+    sqlalchemy.Column("match_api_id", sqlalchemy.Integer, primary_key=True),
+    *[
+        sqlalchemy.Column(name, sqlalchemy.Integer if name.endswith("rated") else sqlalchemy.Float)
+        for name in lineup_strength_columns
+    ],
+)
+
 db_uri = (
     f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
     f"@{config.DB_HOST}/{config.DB_NAME}"
@@ -252,3 +328,63 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
+
+
+async def run_migrations() -> None:
+    """Function applying pending SQL migrations.
+
+    Files from the migrations directory are applied in name order, each in
+    its own transaction, and recorded in the "Schema_Migrations" table.
+    """
+    async with driver_connection() as connection:
+        await connection.execute(
+            'CREATE TABLE IF NOT EXISTS "Schema_Migrations" ('
+            'name TEXT PRIMARY KEY, applied_at TIMESTAMP NOT NULL DEFAULT now())'
+        )
+        applied = {
+            record["name"]
+            for record in await connection.fetch('SELECT name FROM "Schema_Migrations"')
+        }
+        for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
+            if path.name in applied:
+                continue
+            async with connection.transaction():
+                await connection.execute(path.read_text())
+                await connection.execute(
+                    'INSERT INTO "Schema_Migrations" (name) VALUES ($1)', path.name
+                )
+            print(f"Applied migration {path.name}")
+
+
+@asynccontextmanager
+async def driver_connection() -> AsyncIterator[Any]:
+    """Function providing an asyncpg connection for writes that have to stay.
+
+    The engine is used instead of `database`, since the latter rolls back
+    everything on disconnect.
+
+    Yields:
+        Any: The asyncpg connection.
+    """
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        yield raw_connection.driver_connection
+
+
+async def replace_table(table: sqlalchemy.Table, records: Iterable[tuple]) -> None:
+    """Function replacing all rows of a table in one transaction.
+
+    The rows are bulk loaded with COPY.
+
+    Args:
+        table (sqlalchemy.Table): The table.
+        records (Iterable[tuple]): The rows, in the column order of the table.
+    """
+    async with driver_connection() as connection:
+        async with connection.transaction():
+            await connection.execute(f'TRUNCATE "{table.name}"')
+            await connection.copy_records_to_table(
+                table.name,
+                records=list(records),
+                columns=[column.name for column in table.columns],
+            )
@@ -0,0 +1,52 @@
+"""A module containing DTO models for output lineup attributes."""
+from typing import Iterable, Optional, Self
+
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict
+
+from src.infrastructure.dto.player_attributesdto import PlayerAttributesDTO
+
+
+class LineupAttributesDTO(BaseModel):
+    """A model representing DTO for lineup attributes as of a match date."""
+    match_api_id: int
+    date: str
+    home: list[Optional[PlayerAttributesDTO]]
+    away: list[Optional[PlayerAttributesDTO]]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        arbitrary_types_allowed=True,
+    )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> Self | None:
+        """A method for preparing DTO instance based on lineup DB records.
+
+        Every record describes one lineup slot, ordered by side and position.
+        Slots without a player or without attributes before the match
+        are kept as None, so the list index is the lineup position.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            LineupAttributesDTO: The final DTO instance.
+        """
+        records = [dict(record) for record in records]
+        if not records:
+            return None
+
+        lineups = {"home": [], "away": []}
+        for record in records:
+            lineups[record.get("side")].append(
+                PlayerAttributesDTO.from_record(record) if record.get("id") is not None else None
+            )
+
+        return cls(
+            match_api_id=records[0].get("match_api_id"),
+            date=records[0].get("match_date"),
+            home=lineups["home"],
+            away=lineups["away"],
+        )
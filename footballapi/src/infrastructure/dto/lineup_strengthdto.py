@@ -0,0 +1,46 @@
+"""A module containing DTO model for output lineup strength."""
+from typing import Optional, Self
+
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict
+
+
+class LineupStrengthDTO(BaseModel):
+    """A model representing DTO for the rating aggregates of both starting lineups.
+
+    The ratings are the players' overall ratings as of the match date;
+    `rated` counts the lineup players with such a rating.
+    """
+    match_api_id: int
+    home_rating_mean: Optional[float] = None
+    home_rating_min: Optional[float] = None
+    home_rating_max: Optional[float] = None
+    home_rated: int = 0
+    away_rating_mean: Optional[float] = None
+    away_rating_min: Optional[float] = None
+    away_rating_max: Optional[float] = None
+    away_rated: int = 0
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        arbitrary_types_allowed=True,
+    )
+
+    @classmethod
+    def from_record(cls, record: Record) -> Self | None:
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record, possibly a match record joined with the aggregates.
+
+        Returns:
+            LineupStrengthDTO: The final DTO instance, None if the aggregates weren't computed.
+        """
+        if record is None:
+            return None
+        record_dict = dict(record)
+        if record_dict.get("home_rated") is None:
+            return None
+
+        return cls(**record_dict)
@@ -0,0 +1,47 @@
+"""A module containing DTO model for output match features."""
+from typing import Optional, Self
+
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict
+
+
+class MatchFeaturesDTO(BaseModel):
+    """A model representing DTO for the materialized features of a match.
+
+    Every feature only uses what was known before the match date and is
+    None when there was nothing to compute it from.
+    """
+    match_api_id: int
+    league_id: int
+    season: str
+    date: str
+    home_form: Optional[float] = None
+    away_form: Optional[float] = None
+    home_goals_for: Optional[float] = None
+    home_goals_against: Optional[float] = None
+    away_goals_for: Optional[float] = None
+    away_goals_against: Optional[float] = None
+    home_rating: Optional[float] = None
+    away_rating: Optional[float] = None
+    home_rest_days: Optional[float] = None
+    away_rest_days: Optional[float] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+        arbitrary_types_allowed=True,
+    )
+
+    @classmethod
+    def from_record(cls, record: Record) -> Self | None:
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            MatchFeaturesDTO: The final DTO instance.
+        """
+        if record is None:
+            return None
+        return cls(**dict(record))
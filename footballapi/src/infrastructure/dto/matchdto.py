@@ -9,6 +9,7 @@ from src.core.repositories.icard import ICardRepository
 from src.core.repositories.igoal import IGoalRepository
 from src.infrastructure.dto.carddto import CardDTO
 from src.infrastructure.dto.goaldto import GoalDTO
+from src.infrastructure.dto.lineup_strengthdto import LineupStrengthDTO
 
 
 class MatchDTO(BaseModel):
@@ -48,6 +49,7 @@ class MatchDTO(BaseModel):
     away_player_11: Optional[int] = None
     goals: Optional[Iterable[GoalDTO]] = None
     cards: Optional[Iterable[CardDTO]] = None
+    lineup_strength: Optional[LineupStrengthDTO] = None
     # B365H: Optional[float] = None
     # B365D: Optional[float] = None
     # B365A: Optional[float] = None
@@ -110,6 +112,7 @@ class MatchDTO(BaseModel):
             away_player_11=record_dict.get("away_player_11"),
             goals=await goal_repo_interface.get_by_match(record_dict.get("match_api_id")),
             cards=await card_repo_interface.get_by_match(record_dict.get("match_api_id")),
+            lineup_strength=LineupStrengthDTO.from_record(record),
 
 
         )
@@ -9,6 +9,7 @@ class OddsDTO(BaseModel):
     home_team: float
     draw: float
     away_team: float
+    stale: bool = False
     model_config = ConfigDict(
         from_attributes=True,
         extra="ignore",
@@ -29,5 +30,6 @@ class OddsDTO(BaseModel):
         return cls(
             home_team=json.get("home_team"),
             draw=json.get("draw"),
-            away_team=json.get("away_team")
+            away_team=json.get("away_team"),
+            stale=json.get("stale", False),
         )
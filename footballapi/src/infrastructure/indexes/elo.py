@@ -0,0 +1,190 @@
+"""Module containing the incremental Elo rating engine."""
+
+import numpy as np
+
+from src.infrastructure.indexes.match_history import MatchHistory
+
+
+class EloEngine:
+    """A class rating every team with Elo over the whole match history.
+
+    Matches are processed in date order, one vectorized batch per date.
+    For every processed match the ratings of both teams after the match
+    are kept, which makes any historical rating an array lookup.
+    """
+
+    initial_rating: float = 1500.0
+    k_factor: float = 20.0
+    home_advantage: float = 100.0
+
+    def __init__(self, history: MatchHistory) -> None:
+        """The initializer of the engine.
+
+        Args:
+            history (MatchHistory): The match history, followed for new results.
+        """
+        self._history = history
+        self._team_rows: dict[int, int] = {}
+        self.ratings = np.empty(0, dtype=np.float64)
+        self.rows = np.empty(0, dtype=np.int64)
+        self.home_rating = np.empty(0, dtype=np.float32)
+        self.away_rating = np.empty(0, dtype=np.float32)
+        self._processed = 0
+        history.subscribe(self._on_history_changed)
+
+    def _on_history_changed(self, first_changed: int) -> None:
+        """Catching up with the history, incrementally when possible.
+
+        New matches are only appended to the ratings when they are played
+        after every match processed so far. A late result for an already
+        processed date invalidates the later ratings, so those are rebuilt.
+
+        Args:
+            first_changed (int): The first history row that changed.
+        """
+        history = self._history
+        last_processed = self.rows[-1] if len(self.rows) else None
+        if (
+            last_processed is None
+            or first_changed <= last_processed
+            or history.date[first_changed] <= history.date[last_processed]
+        ):
+            self._reset()
+        self._process(first_changed if len(self.rows) else 0)
+
+    def _reset(self) -> None:
+        """Dropping every rating."""
+        self._team_rows = {}
+        self.ratings = np.empty(0, dtype=np.float64)
+        self.rows = np.empty(0, dtype=np.int64)
+        self.home_rating = np.empty(0, dtype=np.float32)
+        self.away_rating = np.empty(0, dtype=np.float32)
+
+    def _team_indices(self, team_api_ids: np.ndarray) -> np.ndarray:
+        """Mapping team_api_ids to rating slots, adding unseen teams.
+
+        Args:
+            team_api_ids (np.ndarray): The team_api_ids.
+
+        Returns:
+            np.ndarray: The rating slot of every team.
+        """
+        for team_api_id in np.unique(team_api_ids):
+            if int(team_api_id) not in self._team_rows:
+                self._team_rows[int(team_api_id)] = len(self._team_rows)
+        if len(self._team_rows) > len(self.ratings):
+            self.ratings = np.concatenate([
+                self.ratings, np.full(len(self._team_rows) - len(self.ratings), self.initial_rating)
+            ])
+        return np.asarray([self._team_rows[int(team_api_id)] for team_api_id in team_api_ids], dtype=np.int64)
+
+    def _process(self, start: int) -> None:
+        """Rating the played matches from a history row onwards.
+
+        Args:
+            start (int): The first history row to process.
+        """
+        history = self._history
+        rows = start + np.flatnonzero(history.played[start:])
+        if not len(rows):
+            return
+
+        home = self._team_indices(history.home_team_api_id[rows])
+        away = self._team_indices(history.away_team_api_id[rows])
+        goal_difference = history.home_team_goal[rows].astype(np.int64) - history.away_team_goal[rows]
+        score = np.where(goal_difference > 0, 1.0, np.where(goal_difference < 0, 0.0, 0.5))
+        margin = np.log1p(np.abs(goal_difference)) + 1
+
+        home_rating = np.empty(len(rows), dtype=np.float64)
+        away_rating = np.empty(len(rows), dtype=np.float64)
+        dates = history.date[rows]
+        bounds = np.flatnonzero(np.diff(dates.astype(np.int64))) + 1
+        for batch in np.split(np.arange(len(rows)), bounds):
+            batch_home, batch_away = home[batch], away[batch]
+            expected = 1 / (1 + 10 ** (
+                (self.ratings[batch_away] - self.ratings[batch_home] - self.home_advantage) / 400
+            ))
+            delta = self.k_factor * margin[batch] * (score[batch] - expected)
+            np.add.at(self.ratings, batch_home, delta)
+            np.add.at(self.ratings, batch_away, -delta)
+            home_rating[batch] = self.ratings[batch_home]
+            away_rating[batch] = self.ratings[batch_away]
+
+        self.rows = np.concatenate([self.rows, rows])
+        self.home_rating = np.concatenate([self.home_rating, home_rating.astype(np.float32)])
+        self.away_rating = np.concatenate([self.away_rating, away_rating.astype(np.float32)])
+
+    def team(self, team_api_id: int) -> dict | None:
+        """Getting the current rating and the rating history of a team.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+
+        Returns:
+            dict | None: The rating and the rating after every match,
+                or None if the team has not played.
+        """
+        if team_api_id not in self._team_rows:
+            return None
+
+        history = self._history
+        home = history.home_team_api_id[self.rows] == team_api_id
+        away = history.away_team_api_id[self.rows] == team_api_id
+        played = home | away
+        ratings = np.where(home, self.home_rating, self.away_rating)[played]
+
+        return {
+            "team_api_id": team_api_id,
+            "rating": float(self.ratings[self._team_rows[team_api_id]]),
+            "history": {
+                "date": history.date[self.rows[played]].astype(str).tolist(),
+                "match_api_id": history.match_api_id[self.rows[played]].tolist(),
+                "rating": np.round(ratings, 2).tolist(),
+            },
+        }
+
+    def league(self, league_id: int, date: np.datetime64 | None = None) -> dict | None:
+        """Getting the ratings of a league's teams as of a date.
+
+        The teams are the ones of the league's latest season started by the date.
+
+        Args:
+            league_id (int): The id of the league.
+            date (np.datetime64 | None): The as-of date, now if None.
+
+        Returns:
+            dict | None: The season and the teams ordered by rating,
+                or None if the league has no rated match by the date.
+        """
+        history = self._history
+        dates = history.date[self.rows]
+        processed = len(self.rows) if date is None else int(np.searchsorted(dates, date, side="right"))
+        rows = self.rows[:processed]
+        in_league = history.league_id[rows] == league_id
+        if not in_league.any():
+            return None
+
+        season = history.season[rows][in_league].max()
+        in_season = in_league & (history.season[rows] == season)
+        league_teams = np.union1d(history.home_team_api_id[rows][in_season], history.away_team_api_id[rows][in_season])
+
+        teams = np.concatenate([history.home_team_api_id[rows], history.away_team_api_id[rows]])
+        ratings = np.concatenate([self.home_rating[:processed], self.away_rating[:processed]])
+        order = np.concatenate([np.arange(processed), np.arange(processed)])
+        latest_first = np.argsort(order, kind="stable")[::-1]
+        team_api_ids, first = np.unique(teams[latest_first], return_index=True)
+        latest_ratings = ratings[latest_first][first]
+
+        selected = np.isin(team_api_ids, league_teams)
+        team_api_ids, latest_ratings = team_api_ids[selected], latest_ratings[selected]
+        ranking = np.argsort(-latest_ratings, kind="stable")
+
+        return {
+            "league_id": league_id,
+            "season": f"{season}/{season + 1}",
+            "date": str(dates[processed - 1]),
+            "ratings": [
+                {"team_api_id": int(team_api_ids[i]), "rating": round(float(latest_ratings[i]), 2)}
+                for i in ranking
+            ],
+        }
@@ -0,0 +1,86 @@
+"""Module containing the Poisson goal model evaluated from fitted coefficients."""
+
+from typing import Literal
+
+import numpy as np
+
+GoalModelKind = Literal["poisson", "dixon_coles"]
+
+
+class GoalModel:
+    """A class evaluating the odds worker's goal models in-process.
+
+    The worker fits the model and returns its coefficients under their
+    formula names, so pricing a fixture is a dot product and two Poisson
+    distributions instead of a fit or a round trip. Dixon-Coles models
+    also carry "rho", which adjusts the probabilities of low scores.
+    """
+
+    max_goals: int = 10
+
+    def __init__(self, teams: list[int], params: dict[str, float]) -> None:
+        """The initializer of the model.
+
+        Args:
+            teams (list[int]): The teams seen in the training window.
+            params (dict[str, float]): The fitted coefficients by formula name.
+        """
+        self.teams = frozenset(teams)
+        self.params = params
+        goals = np.arange(self.max_goals + 1)
+        self._goals = goals
+        self._log_factorials = np.cumsum(np.log(np.maximum(goals, 1)))
+
+    def __contains__(self, team_api_id: int) -> bool:
+        return team_api_id in self.teams
+
+    def rate(self, team_api_id: int, opponent_api_id: int, home: bool) -> float:
+        """Getting the expected goals of a team against an opponent.
+
+        Args:
+            team_api_id (int): The id of the scoring team.
+            opponent_api_id (int): The id of the opponent.
+            home (bool): Whether the scoring team plays at home.
+
+        Returns:
+            float: The expected number of goals.
+        """
+        params = self.params
+        return float(np.exp(
+            params.get("Intercept", 0.0)
+            + params.get("home", 0.0) * home
+            + params.get("team", 0.0) * team_api_id
+            + params.get(f"team[T.{team_api_id}]", 0.0)
+            + params.get("opponent", 0.0) * opponent_api_id
+            + params.get(f"opponent[T.{opponent_api_id}]", 0.0)
+        ))
+
+    def odds(self, home_team_api_id: int, away_team_api_id: int) -> dict:
+        """Getting the home win, draw and away win probabilities of a fixture.
+
+        Args:
+            home_team_api_id (int): The id of the home team.
+            away_team_api_id (int): The id of the away team.
+
+        Returns:
+            dict: The probabilities, shaped like the worker's replies.
+        """
+        home_pmf = self._pmf(self.rate(home_team_api_id, away_team_api_id, True))
+        away_pmf = self._pmf(self.rate(away_team_api_id, home_team_api_id, False))
+        scores = np.outer(home_pmf, away_pmf)
+        if rho := self.params.get("rho"):
+            home_rate = self.rate(home_team_api_id, away_team_api_id, True)
+            away_rate = self.rate(away_team_api_id, home_team_api_id, False)
+            scores[0, 0] *= 1 - home_rate * away_rate * rho
+            scores[0, 1] *= 1 + home_rate * rho
+            scores[1, 0] *= 1 + away_rate * rho
+            scores[1, 1] *= 1 - rho
+        return {
+            "home_team": float(np.tril(scores, -1).sum()),
+            "draw": float(np.trace(scores)),
+            "away_team": float(np.triu(scores, 1).sum()),
+        }
+
+    def _pmf(self, rate: float) -> np.ndarray:
+        """Getting the Poisson probabilities of 0 to `max_goals` goals."""
+        return np.exp(self._goals * np.log(rate) - rate - self._log_factorials)
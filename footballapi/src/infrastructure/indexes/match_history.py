@@ -0,0 +1,135 @@
+"""Module containing the in-memory columnar match history."""
+
+from typing import Callable, Iterable
+
+import numpy as np
+from sqlalchemy import and_, or_, select
+
+from src.db import database, match_table
+
+MatchHistoryListener = Callable[[int], None]
+
+
+def season_start(season: str) -> int:
+    """Converting a season like "2008/2009" or "2008-2009" to its start year.
+
+    Args:
+        season (str): The season.
+
+    Returns:
+        int: The first year of the season.
+    """
+    return int(season[:4])
+
+
+class MatchHistory:
+    """A class keeping the result columns of every match as NumPy arrays.
+
+    Rows are sorted by date (and id within a date). Seasons are stored as
+    their start year and missing goals as -1. Listeners are called with
+    the first row that changed whenever matches are merged in, new ones
+    or fixtures whose result has since been recorded.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the empty history."""
+        self.id = np.empty(0, dtype=np.int64)
+        self.match_api_id = np.empty(0, dtype=np.int64)
+        self.league_id = np.empty(0, dtype=np.int64)
+        self.season = np.empty(0, dtype=np.int16)
+        self.stage = np.empty(0, dtype=np.int16)
+        self.date = np.empty(0, dtype="datetime64[D]")
+        self.home_team_api_id = np.empty(0, dtype=np.int64)
+        self.away_team_api_id = np.empty(0, dtype=np.int64)
+        self.home_team_goal = np.empty(0, dtype=np.int16)
+        self.away_team_goal = np.empty(0, dtype=np.int16)
+        self._listeners: list[MatchHistoryListener] = []
+        self._watermark = 0
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @property
+    def played(self) -> np.ndarray:
+        """A mask of matches with a known result."""
+        return (self.home_team_goal >= 0) & (self.away_team_goal >= 0)
+
+    def subscribe(self, listener: MatchHistoryListener) -> None:
+        """Registering a callback run after new matches are merged in.
+
+        Args:
+            listener (MatchHistoryListener): The callback, given the first changed row.
+        """
+        self._listeners.append(listener)
+
+    async def refresh(self) -> None:
+        """Loading matches added since the last refresh and the results
+        recorded since then into the rows of unplayed fixtures."""
+        loaded = match_table.c.id > self._watermark
+        if len(unplayed := self.id[~self.played]):
+            loaded = or_(loaded, and_(
+                match_table.c.id.in_(unplayed.tolist()),
+                match_table.c.home_team_goal.is_not(None),
+                match_table.c.away_team_goal.is_not(None),
+            ))
+        query = select(
+            match_table.c.id,
+            match_table.c.match_api_id,
+            match_table.c.league_id,
+            match_table.c.season,
+            match_table.c.stage,
+            match_table.c.date,
+            match_table.c.home_team_api_id,
+            match_table.c.away_team_api_id,
+            match_table.c.home_team_goal,
+            match_table.c.away_team_goal,
+        ).where(loaded).order_by(match_table.c.id)
+
+        if records := await database.fetch_all(query):
+            self.merge(records)
+            self._watermark = max(self._watermark, records[-1]["id"])
+
+    def merge(self, records: Iterable) -> None:
+        """Merging match records into the sorted arrays and notifying listeners.
+        Records of matches already kept replace their rows.
+
+        Args:
+            records (Iterable): Records with the columns of `match_table` kept here.
+        """
+        records = list(records)
+        if not records:
+            return
+
+        def column(name: str, dtype, default=None) -> np.ndarray:
+            return np.asarray(
+                [default if record[name] is None else record[name] for record in records], dtype=dtype
+            )
+
+        new = {
+            "id": column("id", np.int64),
+            "match_api_id": column("match_api_id", np.int64),
+            "league_id": column("league_id", np.int64),
+            "season": np.asarray([season_start(record["season"]) for record in records], dtype=np.int16),
+            "stage": column("stage", np.int16),
+            "date": np.asarray([str(record["date"])[:10] for record in records], dtype="datetime64[D]"),
+            "home_team_api_id": column("home_team_api_id", np.int64),
+            "away_team_api_id": column("away_team_api_id", np.int64),
+            "home_team_goal": column("home_team_goal", np.int16, -1),
+            "away_team_goal": column("away_team_goal", np.int16, -1),
+        }
+        previous_id = self.id
+        kept = ~np.isin(previous_id, new["id"])
+        merged = {name: np.concatenate([getattr(self, name)[kept], values]) for name, values in new.items()}
+        order = np.lexsort((merged["id"], merged["date"]))
+        for name, values in merged.items():
+            setattr(self, name, values[order])
+
+        # rows are never dropped, so the previous rows are a prefix of the length
+        moved = np.flatnonzero(self.id[:len(previous_id)] != previous_id)
+        replaced = np.flatnonzero(np.isin(self.id[:len(previous_id)], new["id"]))
+        first_changed = min(
+            int(moved[0]) if len(moved) else len(previous_id),
+            int(replaced[0]) if len(replaced) else len(previous_id),
+        )
+        for listener in self._listeners:
+            listener(first_changed)
@@ -0,0 +1,75 @@
+"""Module containing vectorized nearest neighbour search helpers."""
+
+import numpy as np
+
+
+def zscore(raw: np.ndarray) -> np.ndarray:
+    """Normalizing every column to zero mean and unit variance.
+
+    Missing values (NaN) end up at the column mean.
+
+    Args:
+        raw (np.ndarray): The raw (rows, columns) matrix.
+
+    Returns:
+        np.ndarray: The normalized float32 matrix.
+    """
+    if not len(raw):
+        return raw.astype(np.float32)
+    mean = np.nanmean(raw, axis=0)
+    std = np.nanstd(raw, axis=0)
+    std[~(std > 0)] = 1
+    vectors = (raw - np.nan_to_num(mean)) / std
+    vectors[np.isnan(vectors)] = 0
+    return vectors.astype(np.float32)
+
+
+def nearest(
+        matrix: np.ndarray,
+        queries: np.ndarray,
+        candidates: np.ndarray,
+        k: int,
+        metric: str = "cosine",
+) -> tuple[np.ndarray, np.ndarray]:
+    """Finding the k nearest candidate rows of every query row.
+
+    All queries are scored against all candidates with one matrix product,
+    the top k are selected with `argpartition` and only those are sorted.
+    A query row is never returned as its own neighbour.
+
+    Args:
+        matrix (np.ndarray): The (rows, columns) vectors.
+        queries (np.ndarray): Row numbers of the query vectors.
+        candidates (np.ndarray): Row numbers of the vectors to search.
+        k (int): The number of neighbours per query.
+        metric (str): "cosine" similarity or "euclidean" distance.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Row numbers of the neighbours and their
+            scores, both (queries, k) and ordered best first.
+    """
+    k = min(k, len(candidates) - np.isin(queries, candidates).astype(int).max(initial=0))
+    if k <= 0:
+        empty = np.empty((len(queries), 0))
+        return empty.astype(np.int64), empty
+
+    query_vectors = matrix[queries]
+    candidate_vectors = matrix[candidates]
+    if metric == "euclidean":
+        squared = np.einsum("ij,ij->i", candidate_vectors, candidate_vectors)
+        query_squared = np.einsum("ij,ij->i", query_vectors, query_vectors)
+        distances = query_squared[:, None] + squared[None, :] - 2 * query_vectors @ candidate_vectors.T
+        scores = np.sqrt(np.maximum(distances, 0))
+        keys = scores.copy()
+    else:
+        candidate_norms = np.linalg.norm(candidate_vectors, axis=1)
+        query_norms = np.linalg.norm(query_vectors, axis=1)
+        candidate_norms[candidate_norms == 0] = 1
+        query_norms[query_norms == 0] = 1
+        scores = (query_vectors / query_norms[:, None]) @ (candidate_vectors / candidate_norms[:, None]).T
+        keys = -scores
+
+    keys[queries[:, None] == candidates[None, :]] = np.inf
+    top = np.argpartition(keys, k - 1, axis=1)[:, :k]
+    top = np.take_along_axis(top, np.take_along_axis(keys, top, axis=1).argsort(axis=1), axis=1)
+    return candidates[top], np.take_along_axis(scores, top, axis=1)
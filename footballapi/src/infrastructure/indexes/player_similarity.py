@@ -0,0 +1,134 @@
+"""Module containing the in-memory player similarity index."""
+
+from typing import Iterable
+
+import numpy as np
+from sqlalchemy import func, select
+
+from src.db import (
+    database,
+    player_attributes_latest_table,
+    player_attributes_table,
+    player_skill_columns,
+    player_table,
+)
+from src.infrastructure.indexes.nearest import nearest, zscore
+
+
+class PlayerSimilarityIndex:
+    """A class keeping the latest skill vectors of every player in memory.
+
+    Skills are z-score normalized per column and missing values are imputed
+    with the column mean, so every player is a dense row of `vectors`.
+    """
+
+    columns: tuple[str, ...] = player_skill_columns
+
+    def __init__(self) -> None:
+        """The initializer of the empty index."""
+        self.player_api_ids = np.empty(0, dtype=np.int64)
+        self.player_names: list[str | None] = []
+        self.vectors = np.empty((0, len(self.columns)), dtype=np.float32)
+        self._raw = np.empty((0, len(self.columns)), dtype=np.float32)
+        self._positions: dict[int, int] = {}
+        self._watermark = 0
+
+    async def refresh(self) -> None:
+        """Loading the latest attributes of players changed since the last refresh.
+
+        The first refresh loads every player. Later ones only reload players
+        with attribute rows newer than the highest "Player_Attributes" id seen.
+        """
+        last_id = await database.fetch_val(select(func.max(player_attributes_table.c.id)))
+        if last_id is None or last_id == self._watermark:
+            return
+
+        latest = player_attributes_latest_table
+        query = select(
+            latest.c.player_api_id,
+            player_table.c.player_name,
+            *[latest.c[column] for column in self.columns],
+        ).select_from(
+            latest.outerjoin(player_table, latest.c.player_api_id == player_table.c.player_api_id)
+        )
+        if self._watermark:
+            query = query.where(latest.c.player_api_id.in_(
+                select(player_attributes_table.c.player_api_id).where(
+                    player_attributes_table.c.id > self._watermark
+                )
+            ))
+
+        self._apply(await database.fetch_all(query))
+        self._watermark = last_id
+
+    def _apply(self, records: Iterable) -> None:
+        """Upserting player rows and renormalizing the vectors.
+
+        Args:
+            records (Iterable): Records with the player_api_id, the name and the skills.
+        """
+        raw = self._raw
+        ids = list(self.player_api_ids)
+        names = list(self.player_names)
+        appended = []
+        for record in records:
+            values = [np.nan if record[column] is None else record[column] for column in self.columns]
+            if (position := self._positions.get(record["player_api_id"])) is not None:
+                raw[position] = values
+                names[position] = record["player_name"]
+            else:
+                self._positions[record["player_api_id"]] = len(ids)
+                ids.append(record["player_api_id"])
+                names.append(record["player_name"])
+                appended.append(values)
+
+        if appended:
+            raw = np.vstack([raw, np.asarray(appended, dtype=np.float32)])
+
+        self._raw = raw
+        self.player_api_ids = np.asarray(ids, dtype=np.int64)
+        self.player_names = names
+        self.vectors = zscore(raw)
+
+    def similar(
+            self,
+            player_api_ids: Iterable[int],
+            k: int = 10,
+            attrs: Iterable[str] | None = None,
+            metric: str = "cosine",
+    ) -> list[list[dict]] | None:
+        """Finding the k nearest players of every queried player.
+
+        All queries are scored against all players in one batch.
+
+        Args:
+            player_api_ids (Iterable[int]): The players to find neighbours for.
+            k (int): The number of neighbours per player.
+            attrs (Iterable[str] | None): The skills to compare, all by default.
+            metric (str): "cosine" similarity or "euclidean" distance.
+
+        Returns:
+            list[list[dict]] | None: The neighbours of every queried player,
+                best first, or None if any of the players is not indexed.
+        """
+        try:
+            rows = np.asarray([self._positions[player_api_id] for player_api_id in player_api_ids])
+        except KeyError:
+            return None
+
+        columns = [self.columns.index(attr) for attr in attrs] if attrs else slice(None)
+        neighbours, scores = nearest(
+            self.vectors[:, columns], rows, np.arange(len(self.vectors)), k, metric
+        )
+
+        return [
+            [
+                {
+                    "player_api_id": int(self.player_api_ids[neighbour]),
+                    "player_name": self.player_names[neighbour],
+                    "score": float(score),
+                }
+                for neighbour, score in zip(row_neighbours, row_scores)
+            ]
+            for row_neighbours, row_scores in zip(neighbours, scores)
+        ]
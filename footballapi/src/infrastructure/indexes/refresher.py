@@ -0,0 +1,41 @@
+"""Module keeping the in-memory indexes in sync with the database."""
+
+import asyncio
+import logging
+from typing import Iterable, Protocol
+
+
+class RefreshableIndex(Protocol):
+    """A protocol of in-memory indexes built from the database."""
+
+    async def refresh(self) -> None:
+        """Loading rows ingested since the previous refresh."""
+
+
+async def refresh_all(indexes: Iterable[RefreshableIndex]) -> None:
+    """Refreshing every index once, in order.
+
+    Args:
+        indexes (Iterable[RefreshableIndex]): The indexes to refresh.
+    """
+    for index in indexes:
+        await index.refresh()
+
+
+async def refresh_periodically(indexes: Iterable[RefreshableIndex], interval: float) -> None:
+    """Refreshing the indexes every `interval` seconds until cancelled.
+
+    A failed refresh is logged and retried on the next tick, so a database
+    hiccup never stops the indexes from catching up.
+
+    Args:
+        indexes (Iterable[RefreshableIndex]): The indexes to refresh.
+        interval (float): The delay between two refreshes in seconds.
+    """
+    indexes = list(indexes)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_all(indexes)
+        except Exception:
+            logging.exception("Index refresh failed")
@@ -0,0 +1,179 @@
+"""Module containing the precomputed per-stage league standings."""
+
+import numpy as np
+
+from src.infrastructure.indexes.match_history import MatchHistory
+
+SIDE_FIELDS = ("played", "won", "drawn", "lost", "goals_for", "goals_against", "points")
+
+
+class SeasonStandings:
+    """A class holding cumulative standings of one league season after every stage.
+
+    `table[stage - 1, team, side, field]` is the running total of a `SIDE_FIELDS`
+    field after the stage, with side 0 for home and 1 for away matches.
+    """
+
+    def __init__(self, team_api_ids: np.ndarray, table: np.ndarray) -> None:
+        """The initializer of the season standings.
+
+        Args:
+            team_api_ids (np.ndarray): The teams of the season.
+            table (np.ndarray): The (stages, teams, 2, fields) cumulative table.
+        """
+        self.team_api_ids = team_api_ids
+        self.table = table
+
+    @classmethod
+    def build(
+            cls,
+            stages: np.ndarray,
+            home: np.ndarray,
+            away: np.ndarray,
+            home_goals: np.ndarray,
+            away_goals: np.ndarray,
+    ) -> "SeasonStandings":
+        """Computing the standings after every stage in one pass.
+
+        Per-stage increments of every team are scattered into one array,
+        which is then summed cumulatively over the stages.
+
+        Args:
+            stages (np.ndarray): The stage of every played match.
+            home (np.ndarray): The home team_api_id of every played match.
+            away (np.ndarray): The away team_api_id of every played match.
+            home_goals (np.ndarray): The home goals of every played match.
+            away_goals (np.ndarray): The away goals of every played match.
+
+        Returns:
+            SeasonStandings: The cumulative standings.
+        """
+        team_api_ids, teams = np.unique(np.concatenate([home, away]), return_inverse=True)
+        home_teams, away_teams = teams[:len(home)], teams[len(home):]
+        stage_rows = stages.astype(np.int64) - 1
+
+        increments = np.zeros((int(stages.max()), len(team_api_ids), 2, len(SIDE_FIELDS)), dtype=np.int16)
+        for side, team_rows, goals_for, goals_against in (
+                (0, home_teams, home_goals, away_goals),
+                (1, away_teams, away_goals, home_goals),
+        ):
+            won = goals_for > goals_against
+            drawn = goals_for == goals_against
+            values = np.stack([
+                np.ones_like(goals_for),
+                won,
+                drawn,
+                goals_for < goals_against,
+                goals_for,
+                goals_against,
+                3 * won + drawn,
+            ], axis=1).astype(np.int16)
+            np.add.at(increments, (stage_rows, team_rows, side), values)
+
+        return cls(team_api_ids, np.cumsum(increments, axis=0, dtype=np.int16))
+
+    @property
+    def stages(self) -> int:
+        """The number of stages with a played match."""
+        return len(self.table)
+
+    def after(self, stage: int) -> list[dict]:
+        """Ranking the teams after a stage.
+
+        Teams are ordered by points, goal difference and goals scored.
+
+        Args:
+            stage (int): The stage, starting from 1.
+
+        Returns:
+            list[dict]: The standings table.
+        """
+        sides = self.table[stage - 1].astype(np.int64)
+        total = sides.sum(axis=1)
+        fields = {name: i for i, name in enumerate(SIDE_FIELDS)}
+        points = total[:, fields["points"]]
+        goals_for = total[:, fields["goals_for"]]
+        goal_difference = goals_for - total[:, fields["goals_against"]]
+        ranking = np.lexsort((-goals_for, -goal_difference, -points))
+
+        def row(values: np.ndarray) -> dict:
+            return {name: int(values[i]) for name, i in fields.items()}
+
+        return [
+            {
+                "position": position,
+                "team_api_id": int(self.team_api_ids[team]),
+                **row(total[team]),
+                "goal_difference": int(goal_difference[team]),
+                "home": row(sides[team, 0]),
+                "away": row(sides[team, 1]),
+            }
+            for position, team in enumerate(ranking, start=1)
+        ]
+
+
+class StandingsIndex:
+    """A class keeping the per-stage standings of every league season.
+
+    Standings of the league seasons touched by new matches are recomputed
+    whenever the match history changes.
+    """
+
+    def __init__(self, history: MatchHistory) -> None:
+        """The initializer of the index.
+
+        Args:
+            history (MatchHistory): The match history, followed for new results.
+        """
+        self._history = history
+        self._seasons: dict[tuple[int, int], SeasonStandings] = {}
+        history.subscribe(self._on_history_changed)
+
+    def _on_history_changed(self, first_changed: int) -> None:
+        """Recomputing the league seasons with changed matches.
+
+        Args:
+            first_changed (int): The first history row that changed.
+        """
+        history = self._history
+        played = history.played
+        changed = {
+            (int(league_id), int(season))
+            for league_id, season in zip(history.league_id[first_changed:], history.season[first_changed:])
+        }
+        for league_id, season in changed:
+            rows = np.flatnonzero((history.league_id == league_id) & (history.season == season) & played)
+            if not len(rows):
+                self._seasons.pop((league_id, season), None)
+                continue
+            self._seasons[(league_id, season)] = SeasonStandings.build(
+                history.stage[rows],
+                history.home_team_api_id[rows],
+                history.away_team_api_id[rows],
+                history.home_team_goal[rows],
+                history.away_team_goal[rows],
+            )
+
+    def standings(self, league_id: int, season: int, stage: int | None = None) -> dict | None:
+        """Getting the standings of a league season after a stage.
+
+        Args:
+            league_id (int): The id of the league.
+            season (int): The start year of the season.
+            stage (int | None): The stage, the last played one if None.
+
+        Returns:
+            dict | None: The standings, or None if there is no such season or stage.
+        """
+        if (standings := self._seasons.get((league_id, season))) is None:
+            return None
+        stage = standings.stages if stage is None else stage
+        if not 1 <= stage <= standings.stages:
+            return None
+
+        return {
+            "league_id": league_id,
+            "season": f"{season}/{season + 1}",
+            "stage": stage,
+            "table": standings.after(stage),
+        }
@@ -0,0 +1,120 @@
+"""Module containing the per-team result arrays answering form queries."""
+
+from datetime import date
+
+import numpy as np
+
+from src.infrastructure.indexes.match_history import MatchHistory
+
+RESULTS = np.array(["L", "D", "W"])
+
+
+class TeamFormIndex:
+    """A class keeping every team's played matches as compact date-sorted arrays.
+
+    The rows of a team are contiguous, from `offsets[slot]` to
+    `offsets[slot + 1]`, so its last n results before a date are a binary
+    search and a slice. The arrays are rebuilt whenever the match history
+    changes.
+    """
+
+    def __init__(self, history: MatchHistory) -> None:
+        """The initializer of the index.
+
+        Args:
+            history (MatchHistory): The match history, followed for new results.
+        """
+        self._history = history
+        self.team_api_ids = np.empty(0, dtype=np.int64)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.date = np.empty(0, dtype="datetime64[D]")
+        self.match_api_id = np.empty(0, dtype=np.int64)
+        self.opponent = np.empty(0, dtype=np.int64)
+        self.home = np.empty(0, dtype=bool)
+        self.goals_for = np.empty(0, dtype=np.int16)
+        self.goals_against = np.empty(0, dtype=np.int16)
+        self.result = np.empty(0, dtype=np.int8)
+        history.subscribe(self._on_history_changed)
+
+    def _on_history_changed(self, first_changed: int) -> None:
+        """Rebuilding the per-team arrays from the played matches.
+
+        Args:
+            first_changed (int): The first history row that changed.
+        """
+        history = self._history
+        rows = np.flatnonzero(history.played)
+        rows = np.concatenate([rows, rows])
+        home = np.arange(len(rows)) < len(rows) // 2
+        team = np.where(home, history.home_team_api_id[rows], history.away_team_api_id[rows])
+        goals_for = np.where(home, history.home_team_goal[rows], history.away_team_goal[rows])
+        goals_against = np.where(home, history.away_team_goal[rows], history.home_team_goal[rows])
+
+        # history rows are in date order, so the row orders a team's matches
+        order = np.lexsort((rows, team))
+        team = team[order]
+        self.team_api_ids, counts = np.unique(team, return_counts=True)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.date = history.date[rows[order]]
+        self.match_api_id = history.match_api_id[rows[order]]
+        self.opponent = np.where(home, history.away_team_api_id[rows], history.home_team_api_id[rows])[order]
+        self.home = home[order]
+        self.goals_for = goals_for[order]
+        self.goals_against = goals_against[order]
+        self.result = (np.sign(self.goals_for - self.goals_against) + 1).astype(np.int8)
+
+    def form(self, team_api_id: int, n: int, as_of: date | None = None) -> dict | None:
+        """Getting the last results of a team.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+            n (int): The number of results.
+            as_of (date | None): Only matches before this date are used, all if None.
+
+        Returns:
+            dict | None: The results, latest first, and their totals, or None if the team has not played.
+        """
+        slot = int(np.searchsorted(self.team_api_ids, team_api_id))
+        if slot == len(self.team_api_ids) or self.team_api_ids[slot] != team_api_id:
+            return None
+        start, end = int(self.offsets[slot]), int(self.offsets[slot + 1])
+        if as_of is not None:
+            end = start + int(np.searchsorted(self.date[start:end], np.datetime64(as_of, "D")))
+        rows = slice(max(start, end - n), end)
+
+        result = self.result[rows][::-1]
+        goals_for = self.goals_for[rows][::-1]
+        goals_against = self.goals_against[rows][::-1]
+        won, drawn = int(np.sum(result == 2)), int(np.sum(result == 1))
+        return {
+            "team_api_id": team_api_id,
+            "as_of": None if as_of is None else as_of.isoformat(),
+            "form": "".join(RESULTS[result]),
+            "played": len(result),
+            "won": won,
+            "drawn": drawn,
+            "lost": len(result) - won - drawn,
+            "goals_for": int(goals_for.sum()),
+            "goals_against": int(goals_against.sum()),
+            "points": 3 * won + drawn,
+            "matches": [
+                {
+                    "match_api_id": match_api_id,
+                    "date": str(match_date),
+                    "opponent_team_api_id": opponent,
+                    "home": home,
+                    "goals_for": scored,
+                    "goals_against": conceded,
+                    "result": str(RESULTS[outcome]),
+                }
+                for match_api_id, match_date, opponent, home, scored, conceded, outcome in zip(
+                    self.match_api_id[rows][::-1].tolist(),
+                    self.date[rows][::-1],
+                    self.opponent[rows][::-1].tolist(),
+                    self.home[rows][::-1].tolist(),
+                    goals_for.tolist(),
+                    goals_against.tolist(),
+                    result.tolist(),
+                )
+            ],
+        }
@@ -0,0 +1,131 @@
+"""Module containing the in-memory team tactical similarity index."""
+
+from typing import Iterable
+
+import numpy as np
+from sqlalchemy import select
+
+from src.db import database, team_attributes_table, team_table, team_tactic_columns
+from src.infrastructure.indexes.nearest import nearest, zscore
+
+
+class TeamSimilarityIndex:
+    """A class keeping every tactical snapshot of every team in memory.
+
+    Snapshots are sorted by team and date, so the snapshot of each team
+    as of any date is found with one vectorized pass over the segments.
+    """
+
+    columns: tuple[str, ...] = team_tactic_columns
+
+    def __init__(self) -> None:
+        """The initializer of the empty index."""
+        self.team_api_ids = np.empty(0, dtype=np.int64)
+        self.dates = np.empty(0, dtype="datetime64[D]")
+        self.vectors = np.empty((0, len(self.columns)), dtype=np.float32)
+        self.team_names: dict[int, str | None] = {}
+        self._raw = np.empty((0, len(self.columns)), dtype=np.float32)
+        self._segment_starts = np.empty(0, dtype=np.int64)
+        self._watermark = 0
+
+    async def refresh(self) -> None:
+        """Loading attribute rows added since the last refresh.
+
+        New snapshots are merged into the sorted arrays and the vectors are
+        renormalized, so the index never has to be rebuilt from scratch.
+        """
+        query = select(
+            team_attributes_table.c.id,
+            team_attributes_table.c.team_api_id,
+            team_attributes_table.c.date,
+            team_table.c.team_long_name,
+            *[team_attributes_table.c[column] for column in self.columns],
+        ).select_from(
+            team_attributes_table.outerjoin(
+                team_table, team_attributes_table.c.team_api_id == team_table.c.team_api_id
+            )
+        ).where(team_attributes_table.c.id > self._watermark)
+
+        if records := await database.fetch_all(query):
+            self._apply(records)
+            self._watermark = max(record["id"] for record in records)
+
+    def _apply(self, records: Iterable) -> None:
+        """Merging new snapshots into the sorted arrays.
+
+        Args:
+            records (Iterable): Records with the team, the date and the tactics.
+        """
+        records = list(records)
+        team_api_ids = np.concatenate([
+            self.team_api_ids, np.asarray([record["team_api_id"] for record in records], dtype=np.int64)
+        ])
+        dates = np.concatenate([
+            self.dates, np.asarray([record["date"][:10] for record in records], dtype="datetime64[D]")
+        ])
+        raw = np.vstack([self._raw, np.asarray(
+            [[np.nan if record[column] is None else record[column] for column in self.columns]
+             for record in records],
+            dtype=np.float32,
+        )])
+        self.team_names.update({record["team_api_id"]: record["team_long_name"] for record in records})
+
+        order = np.lexsort((dates, team_api_ids))
+        self.team_api_ids = team_api_ids[order]
+        self.dates = dates[order]
+        self._raw = raw[order]
+        self.vectors = zscore(self._raw)
+        self._segment_starts = np.flatnonzero(np.diff(self.team_api_ids, prepend=-1))
+
+    def snapshot_rows(self, date: np.datetime64 | None = None) -> np.ndarray:
+        """Finding the row of every team's latest snapshot on or before a date.
+
+        Args:
+            date (np.datetime64 | None): The as-of date, the newest snapshots if None.
+
+        Returns:
+            np.ndarray: Row numbers, one per team with a snapshot before the date.
+        """
+        if not len(self._segment_starts):
+            return np.empty(0, dtype=np.int64)
+        if date is None:
+            return np.append(self._segment_starts[1:], len(self.dates)) - 1
+
+        counts = np.add.reduceat((self.dates <= date).astype(np.int64), self._segment_starts)
+        return (self._segment_starts + counts - 1)[counts > 0]
+
+    def similar(
+            self,
+            team_api_id: int,
+            date: np.datetime64 | None = None,
+            k: int = 10,
+            metric: str = "euclidean",
+    ) -> list[dict] | None:
+        """Finding the teams with the most similar tactics as of a date.
+
+        Args:
+            team_api_id (int): The team to find neighbours for.
+            date (np.datetime64 | None): The as-of date, the newest snapshots if None.
+            k (int): The number of neighbours.
+            metric (str): "cosine" similarity or "euclidean" distance.
+
+        Returns:
+            list[dict] | None: The neighbours, best first, or None if the team
+                has no snapshot before the date.
+        """
+        rows = self.snapshot_rows(date)
+        query = rows[self.team_api_ids[rows] == team_api_id]
+        if not len(query):
+            return None
+
+        neighbours, scores = nearest(self.vectors, query, rows, k, metric)
+
+        return [
+            {
+                "team_api_id": int(self.team_api_ids[neighbour]),
+                "team_long_name": self.team_names.get(int(self.team_api_ids[neighbour])),
+                "date": str(self.dates[neighbour]),
+                "score": float(score),
+            }
+            for neighbour, score in zip(neighbours[0], scores[0])
+        ]
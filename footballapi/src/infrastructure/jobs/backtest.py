@@ -0,0 +1,212 @@
+"""Module running the walk-forward backtest of the odds model.
+
+Every played match is priced by a model fitted on the 10 previous matches
+of its league and season, the window `/odds/{match_api_id}` uses, and the
+prediction is scored against the result. Run from the `footballapi`
+directory against a populated database, with the worker's engine:
+
+    ODDS_ENGINE_PATH=../oddscalc/src python -m src.infrastructure.jobs.backtest report.csv [min_window]
+
+Matches with fewer than `min_window` (10 by default) previous matches are
+skipped. A `.parquet` report needs pyarrow, anything else is written as CSV.
+"""
+
+import asyncio
+import csv
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, AsyncIterator
+
+import numpy as np
+
+from src.config import config
+from src.container import Container
+from src.core.repositories.iodds import IOddsRepository
+from src.db import database
+
+WINDOW = 10
+CHUNK = 256
+COLUMNS = (
+    "match_api_id", "league_id", "season", "date", "window",
+    "home_team", "draw", "away_team", "outcome", "log_loss", "brier", "fit_ms",
+)
+
+
+def _engine_path(path: str | None) -> None:
+    """Making the worker's engine importable in a pool process.
+
+    Args:
+        path (str | None): The engine directory, already importable if None.
+    """
+    if path and path not in sys.path:
+        sys.path.append(path)
+
+
+def score_chunk(league_id: int, chunk: list[tuple[Any, np.ndarray]]) -> list[tuple]:
+    """Fitting, pricing and scoring consecutive matches of one league.
+
+    Runs in a pool process and uses the worker's goal model, so the engine
+    chosen by `ENGINE` is the one measured.
+
+    Args:
+        league_id (int): The id of the league.
+        chunk (list[tuple[Any, np.ndarray]]): The matches with their training windows.
+
+    Returns:
+        list[tuple]: The report rows, in `COLUMNS` order.
+    """
+    from model import fit_poisson_model, goal_rates, outcome_probabilities
+
+    rows = []
+    for match, window in chunk:
+        match_api_id, season, match_date, home, away, home_goals, away_goals = match
+        started = time.perf_counter()
+        params = fit_poisson_model(window)
+        fit_ms = (time.perf_counter() - started) * 1000
+
+        home_avg, away_avg = goal_rates(params, [home], [away])
+        probabilities = np.concatenate(outcome_probabilities(home_avg, away_avg, max_goals=10))
+        outcome = 0 if home_goals > away_goals else 1 if home_goals == away_goals else 2
+        observed = np.eye(3)[outcome]
+        rows.append((
+            match_api_id, league_id, season, match_date, len(window), *probabilities.tolist(), outcome,
+            float(-np.log(max(probabilities[outcome], 1e-15))),
+            float(np.sum((probabilities - observed) ** 2)),
+            fit_ms,
+        ))
+    return rows
+
+
+async def walk_forward(
+        matches: AsyncIterator[Any],
+        pool: Executor,
+        min_window: int = 1,
+) -> list[tuple]:
+    """Building the training window of every match and scoring them in the pool.
+
+    The windows follow `get_previous_matches`: the latest 10 matches of the
+    league and season played on an earlier date. Matches are sent to the
+    pool in chunks per league while the stream is still read.
+
+    Args:
+        matches (AsyncIterator[Any]): The played matches in date order.
+        pool (Executor): The process pool scoring the chunks.
+        min_window (int): The matches with fewer previous ones are skipped.
+
+    Returns:
+        list[tuple]: The report rows, in `COLUMNS` order.
+    """
+    previous: dict[tuple, deque] = defaultdict(lambda: deque(maxlen=WINDOW))
+    same_day: dict[tuple, list] = defaultdict(list)
+    last_date: dict[tuple, str] = {}
+    chunks: dict[int, list] = defaultdict(list)
+    futures: list[Future] = []
+    loop = asyncio.get_running_loop()
+
+    async for match in matches:
+        key = (match.league_id, match.season)
+        day = match.date[:10]
+        if last_date.get(key) != day:
+            # matches of the same day don't see each other's results
+            previous[key].extend(same_day.pop(key, []))
+            last_date[key] = day
+        result = (match.home_team_api_id, match.away_team_api_id, match.home_team_goal, match.away_team_goal)
+        same_day[key].append(result)
+
+        if len(previous[key]) < max(min_window, 1):
+            continue
+        chunk = chunks[match.league_id]
+        chunk.append((
+            (match.match_api_id, match.season, day, *result),
+            np.array(previous[key], dtype=np.int32),
+        ))
+        if len(chunk) >= CHUNK:
+            futures.append(loop.run_in_executor(pool, score_chunk, match.league_id, chunks.pop(match.league_id)))
+
+    futures.extend(loop.run_in_executor(pool, score_chunk, league_id, chunk) for league_id, chunk in chunks.items())
+    return [row for rows in await asyncio.gather(*futures) for row in rows]
+
+
+def write_report(path: str, rows: list[tuple]) -> None:
+    """Writing the report rows as Parquet or CSV, by the file extension.
+
+    Args:
+        path (str): The report file.
+        rows (list[tuple]): The report rows, in `COLUMNS` order.
+    """
+    if path.endswith(".parquet"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = list(zip(*rows)) if rows else [[] for _ in COLUMNS]
+        pq.write_table(pa.table(dict(zip(COLUMNS, map(list, columns)))), path)
+        return
+
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+
+
+def summarize(rows: list[tuple], elapsed: float) -> str:
+    """Summarizing the scores and fit timings of a backtest.
+
+    Args:
+        rows (list[tuple]): The report rows, in `COLUMNS` order.
+        elapsed (float): The wall time of the backtest in seconds.
+
+    Returns:
+        str: The summary, overall and per league.
+    """
+    if not rows:
+        return "No matches scored"
+    league = np.array([row[1] for row in rows])
+    log_loss = np.array([row[9] for row in rows])
+    brier = np.array([row[10] for row in rows])
+    fit_ms = np.array([row[11] for row in rows])
+    lines = [
+        f"{len(rows)} matches in {elapsed:.1f} s: log-loss {log_loss.mean():.4f}, Brier {brier.mean():.4f}, "
+        f"fit p50 {np.percentile(fit_ms, 50):.2f} ms, p95 {np.percentile(fit_ms, 95):.2f} ms",
+    ]
+    for league_id in np.unique(league):
+        rows_of = league == league_id
+        lines.append(f"  league {league_id}: {rows_of.sum()} matches, "
+                     f"log-loss {log_loss[rows_of].mean():.4f}, Brier {brier[rows_of].mean():.4f}")
+    return "\n".join(lines)
+
+
+async def backtest(repository: IOddsRepository, path: str, min_window: int = 1) -> str:
+    """Running the walk-forward backtest and writing its report.
+
+    Args:
+        repository (IOddsRepository): The odds repository streaming the matches.
+        path (str): The report file.
+        min_window (int): The matches with fewer previous ones are skipped.
+
+    Returns:
+        str: The summary of the scores.
+    """
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+            max_workers=config.ODDS_ENGINE_WORKERS,
+            initializer=_engine_path,
+            initargs=(config.ODDS_ENGINE_PATH,),
+    ) as pool:
+        rows = await walk_forward(repository.stream_played_matches(), pool, min_window)
+    rows.sort(key=lambda row: (row[3], row[0]))
+    write_report(path, rows)
+    return summarize(rows, time.perf_counter() - started)
+
+
+async def main(path: str, min_window: int) -> None:
+    await database.connect()
+    try:
+        print(await backtest(Container.odds_repository(), path, min_window))
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else WINDOW))
@@ -0,0 +1,318 @@
+"""Module building the per-match feature store.
+
+Features of every match are computed from what was known before its date:
+
+    form             points per match over the team's last 5 matches of the league season
+    goals_for/against  the home team's mean goals at home, and the away team's
+                     away, in the league season so far
+    rating           the mean overall rating of the starting lineup as of the match date
+    rest_days        days since the team's previous match
+
+They are computed with NumPy over the whole match history at once and
+written both to the "Match_Features" table and to an `.npz` file of
+columns sorted by match_api_id at `FEATURE_STORE_PATH`, for offline use.
+Run from the `footballapi` directory:
+
+    python -m src.infrastructure.jobs.features
+"""
+
+import asyncio
+import os
+from typing import Any, Iterable
+
+import numpy as np
+
+from src.config import config
+from src.container import Container
+from src.core.repositories.imatch import IMatchRepository
+from src.core.repositories.imatch_features import IMatchFeaturesRepository
+from src.core.repositories.iplayer_attributes import IPlayerAttributesRepository
+from src.db import database, match_feature_columns
+from src.infrastructure.indexes.match_history import MatchHistory
+
+FORM_MATCHES = 5
+# a key of (player, day) fits in an int64 as player * DAYS + day
+DAYS = 1 << 20
+
+
+def previous_sums(
+        segments: np.ndarray,
+        values: np.ndarray,
+        weights: np.ndarray,
+        window: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Summing the values of the rows before every row of its segment.
+
+    Args:
+        segments (np.ndarray): The segment of every row, rows sorted by segment and then time.
+        values (np.ndarray): The values summed.
+        weights (np.ndarray): 1 for rows which count, 0 for the others.
+        window (int | None): Only the last `window` rows before are summed, all if None.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The sums of the weighted values and of the weights.
+    """
+    position = np.arange(len(segments))
+    boundary = np.r_[True, segments[1:] != segments[:-1]]
+    start = np.flatnonzero(boundary)[np.cumsum(boundary) - 1]
+    first = start if window is None else np.maximum(start, position - window)
+    value_sums = np.r_[0, np.cumsum(values * weights)]
+    weight_sums = np.r_[0, np.cumsum(weights)]
+    return value_sums[position] - value_sums[first], weight_sums[position] - weight_sums[first]
+
+
+def _segments(*keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Ordering rows by the keys, the last one first, and numbering the segments they form.
+
+    Args:
+        *keys (np.ndarray): The sort keys, as for `np.lexsort`; all but the first one identify a segment.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The order of the rows and the segment of every ordered row.
+    """
+    order = np.lexsort(keys)
+    changed = np.zeros(len(order), dtype=bool)
+    for key in keys[1:]:
+        changed[1:] |= key[order][1:] != key[order][:-1]
+    return order, np.cumsum(changed)
+
+
+def _mean(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    return np.divide(sums, counts, out=np.full(len(sums), np.nan), where=counts > 0)
+
+
+def lineup_players(match_api_ids: np.ndarray, lineups: Iterable[Any]) -> np.ndarray:
+    """Aligning the starting lineups with matches.
+
+    Args:
+        match_api_ids (np.ndarray): The match_api_ids of the matches.
+        lineups (Iterable[Any]): The match_api_id and 22 lineup player_api_ids of the matches.
+
+    Returns:
+        np.ndarray: The (matches, 22) player_api_ids, home first, -1 for unknown players.
+    """
+    players = np.full((len(match_api_ids), 22), -1, dtype=np.int64)
+    lineups = list(lineups)
+    if not lineups:
+        return players
+
+    lineup_ids = np.asarray([record[0] for record in lineups], dtype=np.int64)
+    lineup_players = np.asarray(
+        [[-1 if player is None else player for player in tuple(record)[1:]] for record in lineups],
+        dtype=np.int64,
+    ).reshape(-1, 22)
+    by_id = np.argsort(lineup_ids)
+    lineup_ids, lineup_players = lineup_ids[by_id], lineup_players[by_id]
+    rows = np.minimum(np.searchsorted(lineup_ids, match_api_ids), len(lineup_ids) - 1)
+    matched = lineup_ids[rows] == match_api_ids
+    players[matched] = lineup_players[rows[matched]]
+    return players
+
+
+def lineup_ratings(
+        players: np.ndarray,
+        dates: np.ndarray,
+        rating_players: np.ndarray,
+        rating_dates: np.ndarray,
+        ratings: np.ndarray,
+) -> np.ndarray:
+    """Looking the latest rating of lineup players up as of the match dates.
+
+    Args:
+        players (np.ndarray): The (matches, slots) player_api_ids, -1 for empty slots.
+        dates (np.ndarray): The match dates.
+        rating_players (np.ndarray): The player_api_id of every rating.
+        rating_dates (np.ndarray): The date of every rating.
+        ratings (np.ndarray): The overall ratings.
+
+    Returns:
+        np.ndarray: The (matches, slots) ratings, NaN where unknown.
+    """
+    if not len(ratings):
+        return np.full(players.shape, np.nan)
+
+    known, player_index = np.unique(rating_players, return_inverse=True)
+    keys = player_index * DAYS + rating_dates.astype(np.int64)
+    order = np.argsort(keys, kind="stable")
+    keys, ratings = keys[order], ratings[order].astype(np.float64)
+
+    slot = np.minimum(np.searchsorted(known, players), len(known) - 1)
+    latest = np.searchsorted(keys, slot * DAYS + dates.astype(np.int64)[:, None], side="right") - 1
+    found = (known[slot] == players) & (latest >= 0) & (keys[np.maximum(latest, 0)] // DAYS == slot)
+    return np.where(found, ratings[np.maximum(latest, 0)], np.nan)
+
+
+def rating_columns(rating_history: Iterable[Any]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Turning rating records into the columns `lineup_ratings` takes.
+
+    Args:
+        rating_history (Iterable[Any]): The player_api_id, date and overall_rating of the ratings.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The player_api_ids, dates and ratings.
+    """
+    rating_history = list(rating_history)
+    return (
+        np.asarray([record[0] for record in rating_history], dtype=np.int64),
+        np.asarray([str(record[1])[:10] for record in rating_history], dtype="datetime64[D]"),
+        np.asarray([record[2] for record in rating_history], dtype=np.float64),
+    )
+
+
+def compute_match_features(
+        history: MatchHistory,
+        lineups: Iterable[Any],
+        rating_history: Iterable[Any],
+) -> dict[str, np.ndarray]:
+    """Computing the features of every match in the history.
+
+    Args:
+        history (MatchHistory): The match history.
+        lineups (Iterable[Any]): The match_api_id and 22 lineup player_api_ids of the matches.
+        rating_history (Iterable[Any]): The player_api_id, date and overall_rating of the ratings.
+
+    Returns:
+        dict[str, np.ndarray]: The columns, the match columns of the history and the features.
+    """
+    n = len(history)
+    match_rows = np.arange(n)
+    played = history.played.astype(np.int64)
+
+    # one row per team and match
+    team = np.concatenate([history.home_team_api_id, history.away_team_api_id])
+    home = np.concatenate([np.ones(n, dtype=bool), np.zeros(n, dtype=bool)])
+    goals_for = np.concatenate([history.home_team_goal, history.away_team_goal]).astype(np.int64)
+    goals_against = np.concatenate([history.away_team_goal, history.home_team_goal]).astype(np.int64)
+    points = 3 * (goals_for > goals_against) + (goals_for == goals_against)
+    weight = np.concatenate([played, played])
+    row = np.concatenate([match_rows, match_rows])
+    league = np.concatenate([history.league_id, history.league_id])
+    season = np.concatenate([history.season, history.season])
+    days = np.concatenate([history.date, history.date]).astype(np.int64)
+
+    features = {name: np.full(2 * n, np.nan) for name in ("form", "goals_for", "goals_against", "rest_days")}
+
+    # the rows are in date order, so the row number orders matches in time
+    order, segments = _segments(row, team, season, league)
+    sums, counts = previous_sums(segments, points[order], weight[order], FORM_MATCHES)
+    features["form"][order] = _mean(sums, counts)
+
+    for side in (home, ~home):
+        rows = np.flatnonzero(side)
+        order, segments = _segments(row[rows], team[rows], season[rows], league[rows])
+        ordered = rows[order]
+        for name, values in (("goals_for", goals_for), ("goals_against", goals_against)):
+            sums, counts = previous_sums(segments, values[ordered], weight[ordered])
+            features[name][ordered] = _mean(sums, counts)
+
+    order, segments = _segments(row, team)
+    ordered_days = days[order]
+    rest = np.r_[np.nan, np.diff(ordered_days)].astype(np.float64)
+    rest[np.r_[True, segments[1:] != segments[:-1]]] = np.nan
+    features["rest_days"][order] = rest
+
+    slot_ratings = lineup_ratings(
+        lineup_players(history.match_api_id, lineups), history.date, *rating_columns(rating_history),
+    )
+    known = ~np.isnan(slot_ratings)
+    rating_sums = np.where(known, slot_ratings, 0.0)
+
+    columns = {
+        "match_api_id": history.match_api_id,
+        "league_id": history.league_id,
+        "season": history.season,
+        "date": history.date,
+        "home_rating": _mean(rating_sums[:, :11].sum(axis=1), known[:, :11].sum(axis=1)),
+        "away_rating": _mean(rating_sums[:, 11:].sum(axis=1), known[:, 11:].sum(axis=1)),
+    }
+    for name, values in features.items():
+        columns[f"home_{name}"], columns[f"away_{name}"] = values[:n], values[n:]
+    by_id = np.argsort(history.match_api_id, kind="stable")
+    return {name: columns[name][by_id] for name in ("match_api_id", "league_id", "season", "date", *match_feature_columns)}
+
+
+def write_feature_store(path: str, columns: dict[str, np.ndarray]) -> None:
+    """Writing the feature columns to an `.npz` file, replacing it atomically.
+
+    Args:
+        path (str): The file.
+        columns (dict[str, np.ndarray]): The columns sorted by match_api_id.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(f"{path}.tmp", "wb") as file:
+        np.savez(file, **columns)
+    os.replace(f"{path}.tmp", path)
+
+
+def _records(columns: dict[str, np.ndarray]) -> list[tuple]:
+    """Turning the feature columns into table rows, NaN as NULL.
+
+    Args:
+        columns (dict[str, np.ndarray]): The columns sorted by match_api_id.
+
+    Returns:
+        list[tuple]: The rows, in the column order of the table.
+    """
+    features = [
+        [None if np.isnan(value) else value for value in columns[name].tolist()]
+        for name in match_feature_columns
+    ]
+    return [
+        (match_api_id, league_id, f"{season}/{season + 1}", str(date), *values)
+        for match_api_id, league_id, season, date, *values in zip(
+            columns["match_api_id"].tolist(),
+            columns["league_id"].tolist(),
+            columns["season"].tolist(),
+            columns["date"].astype(str).tolist(),
+            *features,
+        )
+    ]
+
+
+async def build_feature_store(
+        repository: IMatchFeaturesRepository,
+        matches: IMatchRepository,
+        player_attributes: IPlayerAttributesRepository,
+        history: MatchHistory,
+        path: str,
+) -> int:
+    """Computing the features of every match and materializing them.
+
+    Args:
+        repository (IMatchFeaturesRepository): The match features repository.
+        matches (IMatchRepository): The match repository reading the lineups.
+        player_attributes (IPlayerAttributesRepository): The repository reading the rating history.
+        history (MatchHistory): The match history, refreshed first.
+        path (str): The `.npz` file.
+
+    Returns:
+        int: The number of matches.
+    """
+    await history.refresh()
+    columns = compute_match_features(
+        history, await matches.get_lineups(), await player_attributes.get_rating_history(),
+    )
+    await repository.replace_all(_records(columns))
+    write_feature_store(path, columns)
+    return len(columns["match_api_id"])
+
+
+async def main() -> None:
+    await database.connect()
+    try:
+        count = await build_feature_store(
+            Container.match_features_repository(),
+            Container.match_repository(),
+            Container.player_attributes_repository(),
+            Container.match_history(),
+            config.FEATURE_STORE_PATH,
+        )
+        print(f"Materialized features of {count} matches")
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
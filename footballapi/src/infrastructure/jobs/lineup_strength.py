@@ -0,0 +1,101 @@
+"""Module precomputing the rating aggregates of every starting lineup.
+
+The overall rating of each of the 22 lineup players as of the match date
+is found for all matches at once, by binary search in the rating history
+sorted by (player, date), and the mean, min, max and count of known ratings
+per side are stored in "Lineup_Strength". Run from the `footballapi`
+directory:
+
+    python -m src.infrastructure.jobs.lineup_strength
+"""
+
+import asyncio
+from typing import Any, Iterable
+
+import numpy as np
+
+from src.container import Container
+from src.core.repositories.imatch import IMatchRepository
+from src.core.repositories.iplayer_attributes import IPlayerAttributesRepository
+from src.db import database
+from src.infrastructure.indexes.match_history import MatchHistory
+from src.infrastructure.jobs.features import lineup_players, lineup_ratings, rating_columns
+
+
+def compute_lineup_strength(
+        history: MatchHistory,
+        lineups: Iterable[Any],
+        rating_history: Iterable[Any],
+) -> list[tuple]:
+    """Aggregating the as-of ratings of both lineups of every match in the history.
+
+    Args:
+        history (MatchHistory): The match history.
+        lineups (Iterable[Any]): The match_api_id and 22 lineup player_api_ids of the matches.
+        rating_history (Iterable[Any]): The player_api_id, date and overall_rating of the ratings.
+
+    Returns:
+        list[tuple]: The rows of "Lineup_Strength", None for the aggregates of unrated lineups.
+    """
+    ratings = lineup_ratings(
+        lineup_players(history.match_api_id, lineups), history.date, *rating_columns(rating_history),
+    )
+    sides = []
+    for side in (ratings[:, :11], ratings[:, 11:]):
+        known = ~np.isnan(side)
+        rated = known.sum(axis=1)
+        sides.append((
+            np.where(rated > 0, np.where(known, side, 0.0).sum(axis=1) / np.maximum(rated, 1), np.nan),
+            np.where(known, side, np.inf).min(axis=1),
+            np.where(known, side, -np.inf).max(axis=1),
+            rated,
+        ))
+
+    rows = []
+    for row, match_api_id in enumerate(history.match_api_id.tolist()):
+        record = [match_api_id]
+        for mean, low, high, rated in sides:
+            count = int(rated[row])
+            record.extend(
+                (float(mean[row]), float(low[row]), float(high[row]), count) if count else (None, None, None, 0)
+            )
+        rows.append(tuple(record))
+    return rows
+
+
+async def build_lineup_strength(
+        repository: IMatchRepository,
+        player_attributes: IPlayerAttributesRepository,
+        history: MatchHistory,
+) -> int:
+    """Computing the lineup strength of every match and storing it.
+
+    Args:
+        repository (IMatchRepository): The match repository reading the lineups and storing the aggregates.
+        player_attributes (IPlayerAttributesRepository): The repository reading the rating history.
+        history (MatchHistory): The match history, refreshed first.
+
+    Returns:
+        int: The number of matches.
+    """
+    await history.refresh()
+    rows = compute_lineup_strength(
+        history, await repository.get_lineups(), await player_attributes.get_rating_history(),
+    )
+    await repository.replace_lineup_strength(rows)
+    return len(rows)
+
+
+async def main() -> None:
+    await database.connect()
+    try:
+        count = await build_lineup_strength(
+            Container.match_repository(), Container.player_attributes_repository(), Container.match_history(),
+        )
+        print(f"Stored the lineup strength of {count} matches")
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,32 @@
+"""Module computing odds ahead of the requests."""
+
+import asyncio
+import logging
+from datetime import date
+from typing import Callable
+
+from src.infrastructure.services.iodds import IOddsService
+
+
+async def precompute_periodically(
+        service: Callable[[], IOddsService],
+        dates: int,
+        interval: float,
+        start: date | None = None,
+) -> None:
+    """Pricing the matches on the next `dates` match dates every `interval`
+    seconds until cancelled, so requests before kickoff hit the odds cache.
+
+    Args:
+        service (Callable[[], IOddsService]): The provider of the odds service.
+        dates (int): The number of match dates priced ahead.
+        interval (float): The delay between two runs in seconds.
+        start (date | None): A fixed first date, e.g. to replay a past season; today if None.
+    """
+    while True:
+        try:
+            count = await service().precompute_upcoming(start or date.today(), dates)
+            logging.info("Precomputed odds of %d matches", count)
+        except Exception:
+            logging.exception("Odds precompute failed")
+        await asyncio.sleep(interval)
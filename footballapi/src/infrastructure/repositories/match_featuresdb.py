@@ -0,0 +1,31 @@
+"""Module containing match features repository implementation."""
+
+from typing import Any, Iterable
+
+from src.core.repositories.imatch_features import IMatchFeaturesRepository
+from src.db import database, match_features_table, replace_table
+
+
+class MatchFeaturesRepository(IMatchFeaturesRepository):
+    """A class implementing database protocol of match features repository."""
+
+    async def get_by_match_api_id(self, match_api_id: int) -> Any | None:
+        """The method getting the materialized features of a match.
+
+        Args:
+            match_api_id (int): The match_api_id of the match.
+
+        Returns:
+            Any | None: The features of the match.
+        """
+
+        query = match_features_table.select().where(match_features_table.c.match_api_id == match_api_id)
+        return await database.fetch_one(query)
+
+    async def replace_all(self, records: Iterable[tuple]) -> None:
+        """The method replacing all materialized features in one transaction.
+
+        Args:
+            records (Iterable[tuple]): The rows, in the column order of the table.
+        """
+        await replace_table(match_features_table, records)
@@ -2,12 +2,96 @@
 
 from typing import Any, Iterable
 
-from sqlalchemy import or_
+from sqlalchemy import or_, select, text
 
 from src.core.repositories.imatch import IMatchRepository
-from src.db import match_table, database
+from src.db import database, lineup_strength_columns, lineup_strength_table, match_table, replace_table
+from src.infrastructure.dto.lineup_attributesdto import LineupAttributesDTO
+from src.infrastructure.dto.lineup_strengthdto import LineupStrengthDTO
 from src.infrastructure.dto.matchdto import MatchDTO
 
+_HOME_LINEUP = ", ".join(f"m.home_player_{i}" for i in range(1, 12))
+_AWAY_LINEUP = ", ".join(f"m.away_player_{i}" for i in range(1, 12))
+
+# matches come with their precomputed lineup strength, if any
+MATCH_QUERY = select(
+    match_table,
+    *[lineup_strength_table.c[name] for name in lineup_strength_columns],
+).select_from(
+    match_table.outerjoin(
+        lineup_strength_table,
+        lineup_strength_table.c.match_api_id == match_table.c.match_api_id,
+    )
+)
+
+MATCH_REPORT_QUERY = text(f"""
+    SELECT json_build_object(
+        'match', row_to_json(m),
+        'home_team', row_to_json(ht),
+        'away_team', row_to_json(at),
+        'home_lineup', COALESCE(hl.players, '[]'::json),
+        'away_lineup', COALESCE(al.players, '[]'::json),
+        'goals', COALESCE(g.goals, '[]'::json),
+        'cards', COALESCE(c.cards, '[]'::json)
+    )
+    FROM "Match" m
+    LEFT JOIN "Team" ht ON ht.team_api_id = m.home_team_api_id
+    LEFT JOIN "Team" at ON at.team_api_id = m.away_team_api_id
+    LEFT JOIN LATERAL (
+        SELECT json_agg(row_to_json(p) ORDER BY l.position) AS players
+        FROM unnest(ARRAY[{_HOME_LINEUP}]) WITH ORDINALITY AS l(player_api_id, position)
+        JOIN "Player" p ON p.player_api_id = l.player_api_id
+    ) hl ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT json_agg(row_to_json(p) ORDER BY l.position) AS players
+        FROM unnest(ARRAY[{_AWAY_LINEUP}]) WITH ORDINALITY AS l(player_api_id, position)
+        JOIN "Player" p ON p.player_api_id = l.player_api_id
+    ) al ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT json_agg(json_build_object(
+            'id', gl.id,
+            'match_id', gl.match_id,
+            'scorer', row_to_json(s),
+            'assister', row_to_json(a),
+            'elapsed', gl.elapsed,
+            'team', gl.team,
+            'goal_type', gl.goal_type
+        ) ORDER BY gl.elapsed) AS goals
+        FROM "Goal" gl
+        LEFT JOIN "Player" s ON s.player_api_id = gl.scorer
+        LEFT JOIN "Player" a ON a.player_api_id = gl.assister
+        WHERE gl.match_id = m.match_api_id
+    ) g ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT json_agg(row_to_json(cd) ORDER BY cd.elapsed) AS cards
+        FROM "Card" cd
+        WHERE cd.match_id = m.match_api_id
+    ) c ON TRUE
+    WHERE m.match_api_id = :match_api_id
+""")
+
+LINEUP_ATTRIBUTES_QUERY = text(f"""
+    SELECT m.match_api_id, m.date AS match_date, l.side, l.position, pa.*
+    FROM "Match" m
+    CROSS JOIN LATERAL (
+        SELECT 'home' AS side, h.position, h.player_api_id
+        FROM unnest(ARRAY[{_HOME_LINEUP}]) WITH ORDINALITY AS h(player_api_id, position)
+        UNION ALL
+        SELECT 'away' AS side, a.position, a.player_api_id
+        FROM unnest(ARRAY[{_AWAY_LINEUP}]) WITH ORDINALITY AS a(player_api_id, position)
+    ) l
+    LEFT JOIN LATERAL (
+        SELECT *
+        FROM "Player_Attributes" attrs
+        WHERE attrs.player_api_id = l.player_api_id
+          AND attrs.date <= m.date
+        ORDER BY attrs.date DESC
+        LIMIT 1
+    ) pa ON TRUE
+    WHERE m.match_api_id = :match_api_id
+    ORDER BY l.side DESC, l.position
+""")
+
 
 class MatchRepository(IMatchRepository):
     """A class implementing database protocol of match repository."""
@@ -20,7 +104,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select()  # .limit(3)
+        query = MATCH_QUERY
         matches = await database.fetch_all(query)
 
         return [await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
@@ -37,7 +121,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select().where(match_table.c.league_id == league_id)
+        query = MATCH_QUERY.where(match_table.c.league_id == league_id)
         matches = await database.fetch_all(query)
 
         return [await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
@@ -54,7 +138,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select().where(match_table.c.season == season)
+        query = MATCH_QUERY.where(match_table.c.season == season)
         matches = await database.fetch_all(query)
 
         return [await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
@@ -71,7 +155,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select().where(match_table.c.date == date)
+        query = MATCH_QUERY.where(match_table.c.date == date)
         matches = await database.fetch_all(query)
 
         return [await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
@@ -88,7 +172,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select().where(match_table.c.match_api_id == match_api_id)
+        query = MATCH_QUERY.where(match_table.c.match_api_id == match_api_id)
         match = await database.fetch_one(query)
 
         return await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
@@ -105,7 +189,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select().where(
+        query = MATCH_QUERY.where(
             or_(
                 match_table.c.home_team_api_id == team_api_id,
                 match_table.c.away_team_api_id == team_api_id
@@ -127,7 +211,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select().where(match_table.c.home_team_api_id == home_team_api_id)
+        query = MATCH_QUERY.where(match_table.c.home_team_api_id == home_team_api_id)
         matches = await database.fetch_all(query)
 
         return [await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
@@ -144,7 +228,7 @@ class MatchRepository(IMatchRepository):
         """
         from src.container import Container
 
-        query = match_table.select().where(match_table.c.away_team_api_id == away_team_api_id)
+        query = MATCH_QUERY.where(match_table.c.away_team_api_id == away_team_api_id)
         matches = await database.fetch_all(query)
 
         return [await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
@@ -165,8 +249,70 @@ class MatchRepository(IMatchRepository):
         away_player_cols = [match_table.c[f"away_player_{i}"] for i in range(1, 12)]
         all_player_cols = home_player_cols + away_player_cols
 
-        query = match_table.select().where(or_(*[col == player_api_id for col in all_player_cols]))
+        query = MATCH_QUERY.where(or_(*[col == player_api_id for col in all_player_cols]))
         matches = await database.fetch_all(query)
 
         return [await MatchDTO.from_record(record=match, card_repo_interface=Container.card_repository(),
                                            goal_repo_interface=Container.goal_repository()) for match in matches]
+
+    async def get_report(self, match_api_id: int) -> str | None:
+        """The abstract getting a full match report by a provided match_api_id.
+
+        The whole document is assembled by Postgres in a single statement,
+        so it is returned as JSON text and never decoded in Python.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            str | None: The match report as an encoded JSON document.
+        """
+        return await database.fetch_val(MATCH_REPORT_QUERY, values={"match_api_id": match_api_id})
+
+    async def get_lineup_attributes(self, match_api_id: int) -> Any | None:
+        """The abstract getting attributes of a match lineup as of the match date.
+
+        All 22 as-of lookups run in one statement, each one served by
+        the (player_api_id, date) index of "Player_Attributes".
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: Attributes of every lineup player at the match date.
+        """
+        records = await database.fetch_all(LINEUP_ATTRIBUTES_QUERY, values={"match_api_id": match_api_id})
+        return LineupAttributesDTO.from_records(records)
+
+    async def get_lineup_strength(self, match_api_id: int) -> Any | None:
+        """The method getting the rating aggregates of a match's starting lineups.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: The lineup rating aggregates, None if they weren't computed.
+        """
+        query = lineup_strength_table.select().where(lineup_strength_table.c.match_api_id == match_api_id)
+        return LineupStrengthDTO.from_record(await database.fetch_one(query))
+
+    async def get_lineups(self) -> Iterable[Any]:
+        """The method getting the starting lineups of all matches.
+
+        Returns:
+            Iterable[Any]: The match_api_id and the 22 lineup player_api_ids of every match.
+        """
+
+        query = select(
+            match_table.c.match_api_id,
+            *[match_table.c[f"{side}_player_{i}"] for side in ("home", "away") for i in range(1, 12)],
+        )
+        return await database.fetch_all(query)
+
+    async def replace_lineup_strength(self, records: Iterable[tuple]) -> None:
+        """The method replacing the lineup rating aggregates of all matches in one transaction.
+
+        Args:
+            records (Iterable[tuple]): The rows, in the column order of the table.
+        """
+        await replace_table(lineup_strength_table, records)
@@ -1,20 +1,57 @@
 """Module containing odds repository implementations."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
-from sqlalchemy import Date, cast
+from sqlalchemy import Date, cast, select, text
 
 from src.core.repositories.iodds import IOddsRepository
 from src.db import match_table, database
 
 
+UPCOMING_WINDOWS_QUERY = text("""
+    WITH days AS (
+        SELECT DISTINCT substr(date, 1, 10) AS day
+        FROM "Match"
+        WHERE date >= :start
+        ORDER BY day
+        LIMIT :dates
+    )
+    SELECT m.match_api_id, m.league_id, m.home_team_api_id, m.away_team_api_id,
+           w.home_team_api_id AS window_home, w.away_team_api_id AS window_away,
+           w.home_team_goal AS window_home_goal, w.away_team_goal AS window_away_goal
+    FROM "Match" m
+    JOIN days ON substr(m.date, 1, 10) = days.day
+    CROSS JOIN LATERAL (
+        SELECT array_agg(p.home_team_api_id ORDER BY p.date DESC, p.match_api_id DESC) AS home_team_api_id,
+               array_agg(p.away_team_api_id ORDER BY p.date DESC, p.match_api_id DESC) AS away_team_api_id,
+               array_agg(p.home_team_goal ORDER BY p.date DESC, p.match_api_id DESC) AS home_team_goal,
+               array_agg(p.away_team_goal ORDER BY p.date DESC, p.match_api_id DESC) AS away_team_goal
+        FROM (
+            SELECT *
+            FROM "Match" previous
+            WHERE previous.league_id = m.league_id
+              AND previous.season = m.season
+              AND previous.date < m.date
+              AND previous.home_team_goal IS NOT NULL
+              AND previous.away_team_goal IS NOT NULL
+            ORDER BY previous.date DESC, previous.match_api_id DESC
+            LIMIT 10
+        ) p
+    ) w
+    ORDER BY m.date, m.match_api_id
+""")
+
+
 class OddsRepository(IOddsRepository):
     """A class representing protocol of odds repository."""
 
     async def get_previous_matches(self, match_api_id: int) -> Iterable[Any] | None:
         """The abstract getting previous 11 matches
         in a league in the same season. Used for predicting winning odds.
+        Only played matches make the previous 10, as the worker packs goals
+        into integers, and ties on the date go by match_api_id, so the
+        window is the one `get_upcoming_windows` finds.
 
         Args:
             match_api_id (int): match_api_id of the match of which we are predicting odds
@@ -35,9 +72,93 @@ class OddsRepository(IOddsRepository):
         query_previous_matches = match_table.select().filter(
             match_table.c.league_id == league_id,
             match_table.c.season == season,
-            match_table.c.date < current_match.date
-        ).order_by(match_table.c.date.desc()).limit(10)
+            match_table.c.date < current_match.date,
+            match_table.c.home_team_goal.is_not(None),
+            match_table.c.away_team_goal.is_not(None),
+        ).order_by(match_table.c.date.desc(), match_table.c.match_api_id.desc()).limit(10)
 
         result = await database.fetch_all(query_previous_matches)
         result.insert(0, current_match)
         return result
+
+    async def get_batch_windows(self, match_api_ids: Iterable[int]) -> list[tuple[list[Any], list[Any]]]:
+        """The method getting fixtures grouped by league, season and date
+        together with one shared training window per group: the previous 10
+        played matches of the season, the window `get_previous_matches` finds
+        for each of the fixtures.
+
+        Args:
+            match_api_ids (Iterable[int]): match_api_ids of the matches of which we are predicting odds
+
+        Returns:
+            list[tuple[list[Any], list[Any]]]: Pairs of fixtures and their training window.
+        """
+
+        query_fixtures = select(
+            match_table.c.match_api_id,
+            match_table.c.league_id,
+            match_table.c.season,
+            match_table.c.date,
+            match_table.c.home_team_api_id,
+            match_table.c.away_team_api_id,
+        ).where(match_table.c.match_api_id.in_(list(match_api_ids)))
+        groups: dict[tuple, list[Any]] = {}
+        for fixture in await database.fetch_all(query_fixtures):
+            groups.setdefault((fixture.league_id, fixture.season, fixture.date), []).append(fixture)
+
+        result = []
+        for (league_id, season, match_date), fixtures in groups.items():
+            query_window = select(
+                match_table.c.home_team_api_id,
+                match_table.c.away_team_api_id,
+                match_table.c.home_team_goal,
+                match_table.c.away_team_goal,
+            ).filter(
+                match_table.c.league_id == league_id,
+                match_table.c.season == season,
+                match_table.c.date < match_date,
+                match_table.c.home_team_goal.is_not(None),
+                match_table.c.away_team_goal.is_not(None),
+            ).order_by(match_table.c.date.desc(), match_table.c.match_api_id.desc()).limit(10)
+            result.append((fixtures, await database.fetch_all(query_window)))
+        return result
+
+    async def get_upcoming_windows(self, start: str, dates: int) -> Iterable[Any]:
+        """The method getting the matches on the next dates together with
+        their training windows, the same previous 10 matches in the league
+        and season `get_previous_matches` finds, in one statement.
+
+        Args:
+            start (str): The first date, "YYYY-MM-DD".
+            dates (int): The number of match dates.
+
+        Returns:
+            Iterable[Any]: Matches with the window columns as arrays, newest first.
+        """
+
+        return await database.fetch_all(UPCOMING_WINDOWS_QUERY, values={"start": start, "dates": dates})
+
+    async def stream_played_matches(self) -> AsyncIterator[Any]:
+        """The method streaming all played matches in date order, without
+        loading the whole table at once.
+
+        Returns:
+            AsyncIterator[Any]: Matches with their league, season, date, teams and goals.
+        """
+
+        query = select(
+            match_table.c.match_api_id,
+            match_table.c.league_id,
+            match_table.c.season,
+            match_table.c.date,
+            match_table.c.home_team_api_id,
+            match_table.c.away_team_api_id,
+            match_table.c.home_team_goal,
+            match_table.c.away_team_goal,
+        ).where(
+            match_table.c.home_team_goal.is_not(None),
+            match_table.c.away_team_goal.is_not(None),
+        ).order_by(match_table.c.date, match_table.c.match_api_id)
+
+        async for record in database.iterate(query):
+            yield record
@@ -1,11 +1,83 @@
 """Module containing Player Attributes repository implementation."""
 
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
+
+from sqlalchemy import Float, Integer, Select, TIMESTAMP, case, cast, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 from src.core.repositories.iplayer_attributes import IPlayerAttributesRepository
-from src.db import database, player_attributes_table
+from src.db import database, player_attributes_latest_table, player_attributes_table
 from src.infrastructure.dto.player_attributesdto import PlayerAttributesDTO
 
+# players read per query when streaming histories
+HISTORY_BATCH = 100
+
+
+def _history_query(player_api_ids: list[int], attrs: list[str], resolution: str) -> Select:
+    """Building the query of columnar attribute histories.
+
+    Downsampling and the pivot into per-column arrays both happen in SQL,
+    so every row already is a complete columnar history.
+
+    Args:
+        player_api_ids (list[int]): The player_api_ids of the players.
+        attrs (list[str]): The attribute columns to return.
+        resolution (str): One of "raw", "month" or "season".
+
+    Returns:
+        Select: One row per player, ordered by player_api_id.
+    """
+    timestamp = cast(player_attributes_table.c.date, TIMESTAMP)
+    if resolution == "month":
+        bucket = func.to_char(func.date_trunc("month", timestamp), "YYYY-MM-DD")
+    elif resolution == "season":
+        year = cast(func.extract("year", timestamp), Integer)
+        season_start = case((func.extract("month", timestamp) >= 7, year), else_=year - 1)
+        bucket = func.concat(season_start, "/", season_start + 1)
+    else:
+        bucket = player_attributes_table.c.date
+
+    bucketed = select(
+        player_attributes_table.c.player_api_id,
+        bucket.label("bucket"),
+        *[player_attributes_table.c[attr] for attr in attrs],
+    ).where(
+        player_attributes_table.c.player_api_id.in_(player_api_ids)
+    ).subquery()
+
+    if resolution == "raw":
+        samples = bucketed
+    else:
+        samples = select(
+            bucketed.c.player_api_id,
+            bucketed.c.bucket,
+            *[cast(func.round(func.avg(bucketed.c[attr]), 2), Float).label(attr) for attr in attrs],
+        ).group_by(bucketed.c.player_api_id, bucketed.c.bucket).subquery()
+
+    return select(
+        samples.c.player_api_id,
+        func.array_agg(aggregate_order_by(samples.c.bucket, samples.c.bucket)).label("date"),
+        *[
+            func.array_agg(aggregate_order_by(samples.c[attr], samples.c.bucket)).label(attr)
+            for attr in attrs
+        ],
+    ).group_by(samples.c.player_api_id).order_by(samples.c.player_api_id)
+
+
+def _history(record: Any, resolution: str) -> dict:
+    """Turning a row of `_history_query` into a history.
+
+    Args:
+        record (Any): The row of a player.
+        resolution (str): The resolution the row was downsampled to.
+
+    Returns:
+        dict: The columnar history with its resolution.
+    """
+    history = dict(record)
+    history["resolution"] = resolution
+    return history
+
 
 class PlayerAttributesRepository(IPlayerAttributesRepository):
     """A class implementing database protocol of Player Attributes repository."""
@@ -19,6 +91,69 @@ class PlayerAttributesRepository(IPlayerAttributesRepository):
         Returns:
             Any | None: The players attributes.
         """
-        query = player_attributes_table.select().where(player_attributes_table.c.player_api_id == player_api_id).order_by(player_attributes_table.c.date.desc())
+        query = player_attributes_latest_table.select().where(
+            player_attributes_latest_table.c.player_api_id == player_api_id
+        )
         result = await database.fetch_one(query)
         return PlayerAttributesDTO.from_record(result)
+
+    async def get_history(
+            self,
+            player_api_ids: Iterable[int],
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> AsyncIterator[dict]:
+        """The abstract streaming attribute histories of players.
+
+        Players are read in batches of `HISTORY_BATCH` with `fetch_all`, so
+        no cursor holds the shared connection while a client reads the stream.
+
+        Args:
+            player_api_ids (Iterable[int]): The player_api_ids of the players.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            AsyncIterator[dict]: Columnar histories, one per player.
+        """
+        attrs = list(attrs)
+        player_api_ids = sorted(set(player_api_ids))
+        for first in range(0, len(player_api_ids), HISTORY_BATCH):
+            query = _history_query(player_api_ids[first:first + HISTORY_BATCH], attrs, resolution)
+            for record in await database.fetch_all(query):
+                yield _history(record, resolution)
+
+    async def get_player_history(
+            self,
+            player_api_id: int,
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> dict | None:
+        """The abstract getting the attribute history of a player.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            dict | None: The columnar history, None if the player has no attributes.
+        """
+        record = await database.fetch_one(_history_query([player_api_id], list(attrs), resolution))
+        return None if record is None else _history(record, resolution)
+
+    async def get_rating_history(self) -> Iterable[Any]:
+        """The method getting the overall rating history of all players.
+
+        Returns:
+            Iterable[Any]: The player_api_id, date and overall_rating of every rating.
+        """
+        query = select(
+            player_attributes_table.c.player_api_id,
+            player_attributes_table.c.date,
+            player_attributes_table.c.overall_rating,
+        ).where(
+            player_attributes_table.c.player_api_id.is_not(None),
+            player_attributes_table.c.overall_rating.is_not(None),
+        )
+        return await database.fetch_all(query)
@@ -3,7 +3,7 @@
 from typing import Any
 
 from src.core.repositories.iteam_attributes import ITeamAttributesRepository
-from src.db import database, team_attributes_table
+from src.db import database, team_attributes_latest_table
 from src.infrastructure.dto.team_attributesdto import TeamAttributesDTO
 
 
@@ -19,6 +19,8 @@ class TeamAttributesRepository(ITeamAttributesRepository):
         Returns:
             Any | None: The teams attributes.
         """
-        query = team_attributes_table.select().where(team_attributes_table.c.team_api_id == team_api_id).order_by(team_attributes_table.c.date.desc())
+        query = team_attributes_latest_table.select().where(
+            team_attributes_latest_table.c.team_api_id == team_api_id
+        )
         result = await database.fetch_one(query)
         return TeamAttributesDTO.from_record(result)
@@ -1,6 +1,7 @@
 """Module containing league service abstractions."""
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Any, Iterable
 
 
@@ -58,3 +59,28 @@ class ILeagueService(ABC):
         Returns:
             Any | None: The requested stats.
         """
+
+    @abstractmethod
+    async def get_elo(self, league_id: int, date: date | None) -> Any | None:
+        """The abstract getting Elo ratings of a league's teams as of a date.
+
+        Args:
+            league_id (int): The id of the league.
+            date (date | None): The as-of date, the latest ratings if None.
+
+        Returns:
+            Any | None: The teams of the league ordered by rating.
+        """
+
+    @abstractmethod
+    async def get_standings(self, league_id: int, season: str, stage: int | None) -> Any | None:
+        """The abstract getting the standings of a league season after a stage.
+
+        Args:
+            league_id (int): The id of the league.
+            season (str): The season in the format "YYYY/YYYY".
+            stage (int | None): The stage, the last played one if None.
+
+        Returns:
+            Any | None: The standings table.
+        """
@@ -123,4 +123,37 @@ class IMatchService(ABC):
 
         Returns:
             Iterable[Any]: Matches with a certain player in the field away.
-        """
\ No newline at end of file
+        """
+
+    @abstractmethod
+    async def get_report(self, match_api_id: int) -> str | None:
+        """The abstract getting a full match report by a provided match_api_id.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            str | None: The match report as an encoded JSON document.
+        """
+
+    @abstractmethod
+    async def get_lineup_attributes(self, match_api_id: int) -> Any | None:
+        """The abstract getting attributes of a match lineup as of the match date.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: Attributes of every lineup player at the match date.
+        """
+
+    @abstractmethod
+    async def get_lineup_strength(self, match_api_id: int) -> Any | None:
+        """The abstract getting the rating aggregates of a match's starting lineups.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: The lineup rating aggregates, None if they weren't computed.
+        """
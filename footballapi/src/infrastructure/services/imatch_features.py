@@ -0,0 +1,19 @@
+"""Module containing match features service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IMatchFeaturesService(ABC):
+    """An abstract class representing protocol of match features service."""
+
+    @abstractmethod
+    async def get_by_match_api_id(self, match_api_id: int) -> Any | None:
+        """The abstract getting the materialized features of a match.
+
+        Args:
+            match_api_id (int): The match_api_id of the match.
+
+        Returns:
+            Any | None: The features of the match.
+        """
@@ -1,8 +1,11 @@
 """Module containing odds service abstractions."""
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Any, Iterable
 
+from src.infrastructure.indexes.goal_model import GoalModelKind
+
 
 class IOddsService(ABC):
     """An abstract class representing protocol of odds services."""
@@ -18,3 +21,76 @@ class IOddsService(ABC):
         Returns:
             Iterable[Any]: Matches.
         """
+
+    @abstractmethod
+    async def get_odds(self, match_api_id: int) -> dict | None:
+        """The abstract getting win likelihood of a match from the model
+        fitted on the previous matches in the league and season.
+
+        Args:
+            match_api_id (int): match_api_id of the match of which we are predicting odds
+
+        Returns:
+            dict | None: The odds, None if there is no such match.
+        """
+
+    @abstractmethod
+    async def get_batch_odds(self, match_api_ids: Iterable[int]) -> dict[int, dict]:
+        """The abstract getting win likelihood of many matches at once,
+        fitting the odds model once per league, season and date.
+
+        Args:
+            match_api_ids (Iterable[int]): match_api_ids of the matches of which we are predicting odds
+
+        Returns:
+            dict[int, dict]: Odds keyed by match_api_id.
+        """
+
+    @abstractmethod
+    async def get_fixture_odds(
+            self,
+            home_team_api_id: int,
+            away_team_api_id: int,
+            league_id: int,
+            as_of: date | None = None,
+            kind: GoalModelKind = "poisson",
+    ) -> dict | None:
+        """The abstract getting win likelihood of a hypothetical fixture
+        from the league's goal model as of a date.
+
+        Args:
+            home_team_api_id (int): The id of the home team.
+            away_team_api_id (int): The id of the away team.
+            league_id (int): The id of the league whose model prices the fixture.
+            as_of (date | None): Only matches before this date are used, all if None.
+            kind (GoalModelKind): The goal model pricing the fixture.
+
+        Returns:
+            dict | None: The odds, None if the league has no model for the teams.
+        """
+
+    @abstractmethod
+    async def get_model_odds(self, match_api_id: int, kind: GoalModelKind) -> dict | None:
+        """The abstract getting win likelihood of a match from the league's
+        model as of the match date.
+
+        Args:
+            match_api_id (int): match_api_id of the match of which we are predicting odds
+            kind (GoalModelKind): The goal model pricing the match.
+
+        Returns:
+            dict | None: The odds, None if there is no such match or model.
+        """
+
+    @abstractmethod
+    async def precompute_upcoming(self, start: date, dates: int) -> int:
+        """The abstract computing the odds of the matches on the next dates
+        ahead of the requests, into the odds cache.
+
+        Args:
+            start (date): The first date.
+            dates (int): The number of match dates.
+
+        Returns:
+            int: The number of matches priced.
+        """
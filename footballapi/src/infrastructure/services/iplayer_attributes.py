@@ -1,7 +1,7 @@
 """Module containing Player Attributes service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
 
 class IPlayerAttributesService(ABC):
@@ -18,3 +18,58 @@ class IPlayerAttributesService(ABC):
             Any | None: The players attributes.
         """
 
+    @abstractmethod
+    def get_history(
+            self,
+            player_api_ids: Iterable[int],
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> AsyncIterator[dict]:
+        """The abstract streaming attribute histories of players.
+
+        Args:
+            player_api_ids (Iterable[int]): The player_api_ids of the players.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            AsyncIterator[dict]: Columnar histories, one per player.
+        """
+
+    @abstractmethod
+    async def get_player_history(
+            self,
+            player_api_id: int,
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> dict | None:
+        """The abstract getting the attribute history of a player.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            dict | None: The columnar history, None if the player has no attributes.
+        """
+
+    @abstractmethod
+    async def get_similar(
+            self,
+            player_api_id: int,
+            k: int,
+            attrs: Iterable[str] | None,
+            metric: str,
+    ) -> Iterable[Any] | None:
+        """The abstract getting players with the most similar skills.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            k (int): The number of similar players.
+            attrs (Iterable[str] | None): The skills to compare, all by default.
+            metric (str): "cosine" similarity or "euclidean" distance.
+
+        Returns:
+            Iterable[Any] | None: The most similar players, best first.
+        """
@@ -0,0 +1,22 @@
+"""Module containing season simulation service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ISimulationService(ABC):
+    """An abstract class representing protocol of season simulation service."""
+
+    @abstractmethod
+    async def simulate(self, league_id: int, season: str, after_stage: int, n: int) -> Any | None:
+        """The abstract simulating the rest of a league season.
+
+        Args:
+            league_id (int): The id of the league.
+            season (str): The season in the format "YYYY/YYYY".
+            after_stage (int): The last stage treated as played.
+            n (int): The number of simulated seasons.
+
+        Returns:
+            Any | None: Title, relegation and finishing position probabilities.
+        """
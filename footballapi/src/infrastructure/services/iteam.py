@@ -1,6 +1,7 @@
 """Module containing team service abstractions."""
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Any, Iterable
 
 
@@ -58,3 +59,27 @@ class ITeamService(ABC):
         Returns:
             Any | None: The requested stats.
         """
+
+    @abstractmethod
+    async def get_elo(self, team_api_id: int) -> Any | None:
+        """The abstract getting the Elo rating history of a team.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+
+        Returns:
+            Any | None: The current rating and the rating after every match.
+        """
+
+    @abstractmethod
+    async def get_form(self, team_api_id: int, n: int, as_of: date | None = None) -> Any | None:
+        """The abstract getting the last results of a team.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+            n (int): The number of results.
+            as_of (date | None): Only matches before this date are used, all if None.
+
+        Returns:
+            Any | None: The results, latest first, and their totals.
+        """
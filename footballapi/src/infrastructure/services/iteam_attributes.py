@@ -1,7 +1,8 @@
 """Module containing Team Attributes service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import date
+from typing import Any, Iterable
 
 
 class ITeamAttributesService(ABC):
@@ -17,3 +18,23 @@ class ITeamAttributesService(ABC):
         Returns:
             Any | None: The player's attributes.
         """
+
+    @abstractmethod
+    async def get_similar(
+            self,
+            team_api_id: int,
+            date: date | None,
+            k: int,
+            metric: str,
+    ) -> Iterable[Any] | None:
+        """The abstract getting teams with the most similar tactics as of a date.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+            date (date | None): The as-of date, the newest attributes if None.
+            k (int): The number of similar teams.
+            metric (str): "cosine" similarity or "euclidean" distance.
+
+        Returns:
+            Iterable[Any] | None: The most similar teams, best first.
+        """
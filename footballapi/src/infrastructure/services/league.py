@@ -1,8 +1,14 @@
 """Module containing league service implementations."""
 
+from datetime import date
 from typing import Any, Iterable
 
+import numpy as np
+
 from src.core.repositories.ileague import ILeagueRepository
+from src.infrastructure.indexes.elo import EloEngine
+from src.infrastructure.indexes.match_history import season_start
+from src.infrastructure.indexes.standings import StandingsIndex
 from src.infrastructure.services.ileague import ILeagueService
 
 
@@ -10,14 +16,20 @@ class LeagueService(ILeagueService):
     """A class implementing protocol of league service."""
 
     _repository: ILeagueRepository
+    _elo: EloEngine
+    _standings: StandingsIndex
 
-    def __init__(self, repository: ILeagueRepository):
+    def __init__(self, repository: ILeagueRepository, elo: EloEngine, standings: StandingsIndex):
         """The initializer of the `card service`.
 
             Args:
                 repository (ILeagueService): The reference to the repository.
+                elo (EloEngine): The reference to the Elo engine.
+                standings (StandingsIndex): The reference to the standings index.
             """
         self._repository = repository
+        self._elo = elo
+        self._standings = standings
 
     async def get_all_leagues(self) -> Iterable[Any]:
         """The abstract getting all leagues from the data storage.
@@ -69,4 +81,29 @@ class LeagueService(ILeagueService):
         Returns:
             Any | None: The requested stats.
         """
-        return await self._repository.stats(id)
\ No newline at end of file
+        return await self._repository.stats(id)
+
+    async def get_elo(self, league_id: int, date: date | None) -> Any | None:
+        """The abstract getting Elo ratings of a league's teams as of a date.
+
+        Args:
+            league_id (int): The id of the league.
+            date (date | None): The as-of date, the latest ratings if None.
+
+        Returns:
+            Any | None: The teams of the league ordered by rating.
+        """
+        return self._elo.league(league_id, np.datetime64(date) if date else None)
+
+    async def get_standings(self, league_id: int, season: str, stage: int | None) -> Any | None:
+        """The abstract getting the standings of a league season after a stage.
+
+        Args:
+            league_id (int): The id of the league.
+            season (str): The season in the format "YYYY/YYYY".
+            stage (int | None): The stage, the last played one if None.
+
+        Returns:
+            Any | None: The standings table.
+        """
+        return self._standings.standings(league_id, season_start(season), stage)
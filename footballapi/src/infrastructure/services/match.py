@@ -133,4 +133,37 @@ class MatchService(IMatchService):
 
         Returns:
             Iterable[Any]: Matches with a certain player in the field away.
-        """
\ No newline at end of file
+        """
+
+    async def get_report(self, match_api_id: int) -> str | None:
+        """The abstract getting a full match report by a provided match_api_id.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            str | None: The match report as an encoded JSON document.
+        """
+        return await self._repository.get_report(match_api_id)
+
+    async def get_lineup_attributes(self, match_api_id: int) -> Any | None:
+        """The abstract getting attributes of a match lineup as of the match date.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: Attributes of every lineup player at the match date.
+        """
+        return await self._repository.get_lineup_attributes(match_api_id)
+
+    async def get_lineup_strength(self, match_api_id: int) -> Any | None:
+        """The abstract getting the rating aggregates of a match's starting lineups.
+
+        Args:
+            match_api_id (int): The id of a match.
+
+        Returns:
+            Any | None: The lineup rating aggregates, None if they weren't computed.
+        """
+        return await self._repository.get_lineup_strength(match_api_id)
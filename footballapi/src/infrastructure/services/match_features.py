@@ -0,0 +1,32 @@
+"""Module containing match features service implementation."""
+
+from typing import Any
+
+from src.core.repositories.imatch_features import IMatchFeaturesRepository
+from src.infrastructure.dto.match_featuresdto import MatchFeaturesDTO
+from src.infrastructure.services.imatch_features import IMatchFeaturesService
+
+
+class MatchFeaturesService(IMatchFeaturesService):
+    """A class implementing protocol of match features service."""
+
+    _repository: IMatchFeaturesRepository
+
+    def __init__(self, repository: IMatchFeaturesRepository) -> None:
+        """The initializer of the `match features service`.
+
+        Args:
+            repository (IMatchFeaturesRepository): The reference to the repository.
+        """
+        self._repository = repository
+
+    async def get_by_match_api_id(self, match_api_id: int) -> Any | None:
+        """The method getting the materialized features of a match.
+
+        Args:
+            match_api_id (int): The match_api_id of the match.
+
+        Returns:
+            Any | None: The features of the match.
+        """
+        return MatchFeaturesDTO.from_record(await self._repository.get_by_match_api_id(match_api_id))
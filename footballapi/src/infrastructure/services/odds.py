@@ -1,24 +1,56 @@
 """Module containing odds service implementation."""
 
+import asyncio
+import hashlib
+import logging
+from datetime import date
 from typing import Any, Iterable
 
+import numpy as np
+
+from src.config import config
 from src.core.repositories.iodds import IOddsRepository
+from src.infrastructure.indexes.goal_model import GoalModel, GoalModelKind
+from src.infrastructure.indexes.match_history import MatchHistory
 from src.infrastructure.services.iodds import IOddsService
+from src.transports.admission import OddsRequestShed
+from src.transports.breaker import OddsUnavailable
+from src.transports.itransport import IOddsTransport
+from src.utils.cache import LRUCache
 
 
 class OddsService(IOddsService):
     """A class implementing the odds service."""
 
     _repository: IOddsRepository
+    _rpc_client: IOddsTransport
+    _history: MatchHistory
+    _models: LRUCache
+    _odds: LRUCache
 
-    def __init__(self, repository: IOddsRepository):
+    def __init__(
+            self,
+            repository: IOddsRepository,
+            rpc_client: IOddsTransport,
+            history: MatchHistory,
+            models: LRUCache,
+            odds: LRUCache,
+    ):
         """The initializer of the `odds service`.
 
         Args:
             repository (IOddsRepository): The reference to the repository.
+            rpc_client (IOddsTransport): The reference to the odds transport.
+            history (MatchHistory): The reference to the match history.
+            models (LRUCache): The reference to the fitted goal models cache.
+            odds (LRUCache): The reference to the match odds cache.
         """
 
         self._repository = repository
+        self._rpc_client = rpc_client
+        self._history = history
+        self._models = models
+        self._odds = odds
 
     async def get_previous_matches(self, match_api_id: int) -> Iterable[Any]:
         """The abstract getting previous 10 matches
@@ -31,3 +63,302 @@ class OddsService(IOddsService):
             Iterable[Any]: Matches.
         """
         return await self._repository.get_previous_matches(match_api_id)
+
+    async def get_odds(self, match_api_id: int) -> dict | None:
+        """The method getting win likelihood of a match from the model
+        fitted on the previous matches in the league and season. Only the
+        teams and goals of the matches are sent to the worker. While the
+        worker is unavailable the league's last fitted model answers,
+        with the odds marked stale. Odds are cached by the match and its
+        training window, so new or corrected results price it again.
+
+        Args:
+            match_api_id (int): match_api_id of the match of which we are predicting odds
+
+        Raises:
+            OddsUnavailable: If the worker is unavailable and there is no model to fall back on.
+
+        Returns:
+            dict | None: The odds, None if there is no such match.
+        """
+        previous_matches = await self.get_previous_matches(match_api_id)
+        if previous_matches is None:
+            return None
+        current_match, *window = previous_matches
+        window = _window_array(window)
+        key = _odds_key(match_api_id, window)
+        if (odds := self._odds.get(key)) is not None:
+            return odds
+
+        try:
+            odds = await self._rpc_client.call({
+                "fixture": [current_match.home_team_api_id, current_match.away_team_api_id],
+                "window": window,
+            }, message_type="odds", shard_key=str(current_match.league_id))
+        except OddsUnavailable:
+            if odds := self._stale_odds(
+                    current_match.home_team_api_id, current_match.away_team_api_id,
+                    current_match.league_id, "poisson"):
+                return odds
+            raise
+        if odds:
+            self._odds.put(key, odds)
+        return odds
+
+    async def precompute_upcoming(self, start: date, dates: int) -> int:
+        """The method computing the odds of the matches on the next dates
+        ahead of the requests, into the odds cache. The training windows
+        come from one statement and the requests go to the worker at a
+        priority below the interactive ones.
+
+        Args:
+            start (date): The first date.
+            dates (int): The number of match dates.
+
+        Returns:
+            int: The number of matches priced.
+        """
+        matches = await self._repository.get_upcoming_windows(start.isoformat(), dates)
+        semaphore = asyncio.Semaphore(config.ODDS_PRECOMPUTE_CONCURRENCY)
+
+        async def precompute(match: Any) -> bool:
+            if match.window_home is None:
+                return False
+            async with semaphore:
+                try:
+                    window = np.column_stack([
+                        match.window_home, match.window_away, match.window_home_goal, match.window_away_goal,
+                    ]).astype(np.int32)
+                    odds = await self._rpc_client.call({
+                        "fixture": [match.home_team_api_id, match.away_team_api_id],
+                        "window": window,
+                    }, message_type="odds", shard_key=str(match.league_id),
+                        priority=config.ODDS_PRECOMPUTE_PRIORITY)
+                except (OddsRequestShed, OddsUnavailable):
+                    return False
+                except Exception:
+                    logging.exception("Precomputing odds of match %s failed", match.match_api_id)
+                    return False
+            if odds:
+                self._odds.put(_odds_key(match.match_api_id, window), odds)
+            return bool(odds)
+
+        return sum(await asyncio.gather(*(precompute(match) for match in matches)))
+
+    async def get_batch_odds(self, match_api_ids: Iterable[int]) -> dict[int, dict]:
+        """The method getting win likelihood of many matches at once.
+        Fixtures of a league and season on one date share the training
+        window `get_odds` uses, so the prices are the same and go through
+        the same odds cache. The uncached fixtures of every window are sent
+        to the worker as one message, at the background
+        `ODDS_BATCH_PRIORITY`, so bulk requests are shed rather than delay
+        interactive ones. Fixtures without played matches before them in
+        the season can't be priced and are left out.
+
+        Args:
+            match_api_ids (Iterable[int]): match_api_ids of the matches of which we are predicting odds
+
+        Returns:
+            dict[int, dict]: Odds keyed by match_api_id.
+        """
+        result = {}
+        requests = []
+        for fixtures, window in await self._repository.get_batch_windows(match_api_ids):
+            window = _window_array(window)
+            if not len(window):
+                continue
+            pending = []
+            for fixture in fixtures:
+                if (odds := self._odds.get(_odds_key(fixture.match_api_id, window))) is not None:
+                    result[fixture.match_api_id] = odds
+                else:
+                    pending.append(fixture)
+            if pending:
+                requests.append((pending, window))
+
+        replies = await asyncio.gather(*(
+            self._rpc_client.call({
+                "window": window,
+                "fixtures": np.array(
+                    [[fixture.match_api_id, fixture.home_team_api_id, fixture.away_team_api_id]
+                     for fixture in fixtures],
+                    dtype=np.int32,
+                ),
+            }, message_type="batch", shard_key=str(fixtures[0].league_id),
+                priority=config.ODDS_BATCH_PRIORITY)
+            for fixtures, window in requests
+        ))
+        for (_, window), reply in zip(requests, replies):
+            for match_api_id, odds in reply.items():
+                self._odds.put(_odds_key(int(match_api_id), window), odds)
+                result[int(match_api_id)] = odds
+        return result
+
+    async def get_fixture_odds(
+            self,
+            home_team_api_id: int,
+            away_team_api_id: int,
+            league_id: int,
+            as_of: date | None = None,
+            kind: GoalModelKind = "poisson",
+    ) -> dict | None:
+        """The method getting win likelihood of a hypothetical fixture.
+        The league's model is trained on matches before `as_of` taken from
+        the in-memory match history. Fitted models are cached by their
+        training window, so a hit needs neither the database nor the worker.
+        While the worker is unavailable the league's last fitted model
+        answers, with the odds marked stale.
+
+        Args:
+            home_team_api_id (int): The id of the home team.
+            away_team_api_id (int): The id of the away team.
+            league_id (int): The id of the league whose model prices the fixture.
+            as_of (date | None): Only matches before this date are used, all if None.
+            kind (GoalModelKind): The goal model pricing the fixture.
+
+        Raises:
+            OddsUnavailable: If the worker is unavailable and there is no model to fall back on.
+
+        Returns:
+            dict | None: The odds, None if the league has no model for the teams.
+        """
+        try:
+            model = await self._get_model(league_id, as_of, kind)
+        except OddsUnavailable:
+            if odds := self._stale_odds(home_team_api_id, away_team_api_id, league_id, kind):
+                return odds
+            raise
+        if model is None or home_team_api_id not in model or away_team_api_id not in model:
+            return None
+        return model.odds(home_team_api_id, away_team_api_id)
+
+    async def get_model_odds(self, match_api_id: int, kind: GoalModelKind) -> dict | None:
+        """The method getting win likelihood of a match from the league's
+        model as of the match date.
+
+        Args:
+            match_api_id (int): match_api_id of the match of which we are predicting odds
+            kind (GoalModelKind): The goal model pricing the match.
+
+        Returns:
+            dict | None: The odds, None if there is no such match or model.
+        """
+        history = self._history
+        row = np.flatnonzero(history.match_api_id == match_api_id)
+        if not len(row):
+            return None
+        row = row[0]
+        return await self.get_fixture_odds(
+            int(history.home_team_api_id[row]),
+            int(history.away_team_api_id[row]),
+            int(history.league_id[row]),
+            history.date[row].item(),
+            kind,
+        )
+
+    async def _get_model(self, league_id: int, as_of: date | None, kind: GoalModelKind) -> GoalModel | None:
+        """Getting the league's goal model as of a date, fitting it on a cache miss.
+
+        The Poisson model is trained on the latest season only. The
+        Dixon-Coles model is trained on the whole league history with time
+        decay, warm-started from the league's previously fitted model.
+
+        Args:
+            league_id (int): The id of the league.
+            as_of (date | None): Only matches before this date are used, all if None.
+            kind (GoalModelKind): The goal model.
+
+        Returns:
+            GoalModel | None: The model, None if the league has no played matches.
+        """
+        history = self._history
+        rows = np.flatnonzero((history.league_id == league_id) & history.played)
+        if as_of is not None:
+            rows = rows[history.date[rows] < np.datetime64(as_of, "D")]
+        if not len(rows):
+            return None
+        if kind == "poisson":
+            rows = rows[history.season[rows] == history.season[rows[-1]]]
+
+        # the rows are date ordered, so the match count and the last date
+        # identify the training window
+        last_date = history.date[rows[-1]]
+        key = (kind, league_id, len(rows), last_date.item())
+        if (model := self._models.get(key)) is not None:
+            return model
+
+        window = [
+            history.home_team_api_id[rows],
+            history.away_team_api_id[rows],
+            history.home_team_goal[rows],
+            history.away_team_goal[rows],
+        ]
+        payload: dict[str, Any] = {"model": kind}
+        if kind == "dixon_coles":
+            window.append((last_date - history.date[rows]).astype(np.int64))
+            payload["decay"] = config.ODDS_DECAY_RATE
+            if previous := self._models.get((kind, league_id)):
+                payload["init"] = {"params": previous.params}
+        payload["window"] = np.column_stack(window).astype(np.int32)
+
+        coefficients = await self._rpc_client.call(payload, message_type="fit", shard_key=str(league_id))
+        if not coefficients:
+            return None
+        model = GoalModel(coefficients["teams"], coefficients["params"])
+        self._models.put(key, model)
+        # the league's last fitted model warm-starts the next Dixon-Coles
+        # fit and answers while the worker is unavailable
+        self._models.put((kind, league_id), model)
+        return model
+
+    def _stale_odds(
+            self,
+            home_team_api_id: int,
+            away_team_api_id: int,
+            league_id: int,
+            kind: GoalModelKind,
+    ) -> dict | None:
+        """Getting odds from the league's last fitted model, marked stale.
+
+        Args:
+            home_team_api_id (int): The id of the home team.
+            away_team_api_id (int): The id of the away team.
+            league_id (int): The id of the league.
+            kind (GoalModelKind): The goal model.
+
+        Returns:
+            dict | None: The odds, None if no model of the league knows the teams.
+        """
+        model = self._models.get((kind, league_id))
+        if model is None or home_team_api_id not in model or away_team_api_id not in model:
+            return None
+        return {**model.odds(home_team_api_id, away_team_api_id), "stale": True}
+
+
+def _window_array(matches: Iterable[Any]) -> np.ndarray:
+    """Packing match records into (home_id, away_id, home_goals, away_goals) rows.
+
+    Args:
+        matches (Iterable[Any]): The match records.
+
+    Returns:
+        np.ndarray: The rows as a (n, 4) int32 array.
+    """
+    return np.array(
+        [[match.home_team_api_id, match.away_team_api_id, match.home_team_goal, match.away_team_goal]
+         for match in matches],
+        dtype=np.int32,
+    ).reshape(-1, 4)
+
+
+def _odds_key(match_api_id: int, window: np.ndarray) -> tuple[int, bytes]:
+    """Building the odds cache key of a match priced on a training window.
+
+    Args:
+        match_api_id (int): The match_api_id of the match.
+        window (np.ndarray): The window as packed by `_window_array`.
+
+    Returns:
+        tuple[int, bytes]: The match_api_id and the digest of the window.
+    """
+    return match_api_id, hashlib.sha1(window.tobytes()).digest()
@@ -1,8 +1,9 @@
 """Module containing Player Attributes service implementation."""
 
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
 from src.core.repositories.iplayer_attributes import IPlayerAttributesRepository
+from src.infrastructure.indexes.player_similarity import PlayerSimilarityIndex
 from src.infrastructure.services.iplayer_attributes import IPlayerAttributesService
 
 
@@ -10,14 +11,17 @@ class PlayerAttributesService(IPlayerAttributesService):
     """A class implementing protocol of Player Attributes service."""
 
     _repository: IPlayerAttributesRepository
+    _similarity_index: PlayerSimilarityIndex
 
-    def __init__(self, repository: IPlayerAttributesRepository):
+    def __init__(self, repository: IPlayerAttributesRepository, similarity_index: PlayerSimilarityIndex):
         """The initializer of the `Player Attributes service`.
 
             Args:
                 repository (IPlayerAttributesRepository): The reference to the repository.
+                similarity_index (PlayerSimilarityIndex): The reference to the similarity index.
             """
         self._repository = repository
+        self._similarity_index = similarity_index
 
     async def get_by_player_api_id(self, player_api_id: int) -> Any | None:
         """The abstract getting players attributes by their player_api_id.
@@ -29,3 +33,61 @@ class PlayerAttributesService(IPlayerAttributesService):
             Any | None: The players attributes.
         """
         return await self._repository.get_by_player_api_id(player_api_id)
+
+    def get_history(
+            self,
+            player_api_ids: Iterable[int],
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> AsyncIterator[dict]:
+        """The abstract streaming attribute histories of players.
+
+        Args:
+            player_api_ids (Iterable[int]): The player_api_ids of the players.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            AsyncIterator[dict]: Columnar histories, one per player.
+        """
+        return self._repository.get_history(player_api_ids, attrs, resolution)
+
+    async def get_player_history(
+            self,
+            player_api_id: int,
+            attrs: Iterable[str],
+            resolution: str,
+    ) -> dict | None:
+        """The abstract getting the attribute history of a player.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            attrs (Iterable[str]): The attribute columns to return.
+            resolution (str): One of "raw", "month" or "season".
+
+        Returns:
+            dict | None: The columnar history, None if the player has no attributes.
+        """
+        return await self._repository.get_player_history(player_api_id, attrs, resolution)
+
+    async def get_similar(
+            self,
+            player_api_id: int,
+            k: int,
+            attrs: Iterable[str] | None,
+            metric: str,
+    ) -> Iterable[Any] | None:
+        """The abstract getting players with the most similar skills.
+
+        Args:
+            player_api_id (int): The player_api_id of the player.
+            k (int): The number of similar players.
+            attrs (Iterable[str] | None): The skills to compare, all by default.
+            metric (str): "cosine" similarity or "euclidean" distance.
+
+        Returns:
+            Iterable[Any] | None: The most similar players, best first.
+        """
+        if result := self._similarity_index.similar([player_api_id], k, attrs, metric):
+            return result[0]
+        return None
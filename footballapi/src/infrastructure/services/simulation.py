@@ -0,0 +1,94 @@
+"""Module containing season simulation service implementation."""
+
+import hashlib
+from typing import Any
+
+import numpy as np
+
+from src.infrastructure.indexes.match_history import MatchHistory, season_start
+from src.infrastructure.services.isimulation import ISimulationService
+from src.transports.itransport import IOddsTransport
+from src.utils.cache import LRUCache
+
+
+class SimulationService(ISimulationService):
+    """A class implementing the season simulation service.
+
+    The played matches and the remaining fixtures are taken from the match
+    history and simulated by the odds worker. Results are cached per
+    league, season, stage, number of simulations and digest of the
+    simulated matches, so a corrected result gets a new entry.
+    """
+
+    relegated: int = 3
+
+    _history: MatchHistory
+    _rpc_client: IOddsTransport
+    _cache: LRUCache
+
+    def __init__(self, history: MatchHistory, rpc_client: IOddsTransport, cache: LRUCache):
+        """The initializer of the `simulation service`.
+
+        Args:
+            history (MatchHistory): The reference to the match history.
+            rpc_client (IOddsTransport): The reference to the odds transport.
+            cache (LRUCache): The reference to the simulation results cache.
+        """
+        self._history = history
+        self._rpc_client = rpc_client
+        self._cache = cache
+
+    async def simulate(self, league_id: int, season: str, after_stage: int, n: int) -> Any | None:
+        """The abstract simulating the rest of a league season.
+
+        Args:
+            league_id (int): The id of the league.
+            season (str): The season in the format "YYYY/YYYY".
+            after_stage (int): The last stage treated as played.
+            n (int): The number of simulated seasons.
+
+        Returns:
+            Any | None: Title, relegation and finishing position probabilities,
+                or None if nothing was played in the season by the stage.
+        """
+        history = self._history
+        start = season_start(season)
+        in_season = (history.league_id == league_id) & (history.season == start)
+        played = np.flatnonzero(in_season & (history.stage <= after_stage) & history.played)
+        remaining = np.flatnonzero(in_season & (history.stage > after_stage))
+        if not len(played):
+            return None
+
+        results = np.column_stack([
+            history.home_team_api_id[played],
+            history.away_team_api_id[played],
+            history.home_team_goal[played],
+            history.away_team_goal[played],
+        ]).astype(np.int32)
+        fixtures = np.column_stack([
+            history.home_team_api_id[remaining],
+            history.away_team_api_id[remaining],
+        ]).astype(np.int32)
+
+        digest = hashlib.sha1(results.tobytes() + fixtures.tobytes()).digest()
+        key = (league_id, start, after_stage, n, digest)
+        if (cached := self._cache.get(key)) is not None:
+            return cached
+
+        payload = {
+            "played": results,
+            "fixtures": fixtures,
+            "n": n,
+            "relegated": self.relegated,
+        }
+        result = await self._rpc_client.call(payload, message_type="simulate", shard_key=str(league_id))
+        result = {
+            "league_id": league_id,
+            "season": f"{start}/{start + 1}",
+            "after_stage": after_stage,
+            "simulations": n,
+            "remaining_fixtures": len(remaining),
+            **result,
+        }
+        self._cache.put(key, result)
+        return result
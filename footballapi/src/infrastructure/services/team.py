@@ -1,23 +1,32 @@
 """Module containing team service implementation."""
 
+from datetime import date
 from typing import Any, Iterable
 
 from src.core.repositories.iteam import ITeamRepository
+from src.infrastructure.indexes.elo import EloEngine
+from src.infrastructure.indexes.team_form import TeamFormIndex
 from src.infrastructure.services.iteam import ITeamService
 
 
 class TeamService(ITeamService):
     """A class implementing protocol of team service."""
     _repository: ITeamRepository
+    _elo: EloEngine
+    _form: TeamFormIndex
 
-    def __init__(self, repository: ITeamRepository):
+    def __init__(self, repository: ITeamRepository, elo: EloEngine, form: TeamFormIndex):
         """The initializer of the `team service`.
 
         Args:
             repository (ITeamRepository): The reference to the repository.
+            elo (EloEngine): The reference to the Elo engine.
+            form (TeamFormIndex): The reference to the team form index.
         """
 
         self._repository = repository
+        self._elo = elo
+        self._form = form
 
     async def get_all_teams(self) -> Iterable[Any]:
         """The abstract getting all teams from the data storage.
@@ -69,4 +78,28 @@ class TeamService(ITeamService):
         Returns:
             Any | None: The requested stats.
         """
-        return await self._repository.get_stats(team_api_id)
\ No newline at end of file
+        return await self._repository.get_stats(team_api_id)
+
+    async def get_elo(self, team_api_id: int) -> Any | None:
+        """The abstract getting the Elo rating history of a team.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+
+        Returns:
+            Any | None: The current rating and the rating after every match.
+        """
+        return self._elo.team(team_api_id)
+
+    async def get_form(self, team_api_id: int, n: int, as_of: date | None = None) -> Any | None:
+        """The abstract getting the last results of a team.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+            n (int): The number of results.
+            as_of (date | None): Only matches before this date are used, all if None.
+
+        Returns:
+            Any | None: The results, latest first, and their totals.
+        """
+        return self._form.form(team_api_id, n, as_of)
@@ -1,8 +1,12 @@
 """Module containing Team Attributes service implementation."""
 
-from typing import Any
+from datetime import date
+from typing import Any, Iterable
+
+import numpy as np
 
 from src.core.repositories.iteam_attributes import ITeamAttributesRepository
+from src.infrastructure.indexes.team_similarity import TeamSimilarityIndex
 from src.infrastructure.services.iteam_attributes import ITeamAttributesService
 
 
@@ -10,14 +14,17 @@ class TeamAttributesService(ITeamAttributesService):
     """A class implementing protocol of card service."""
 
     _repository: ITeamAttributesRepository
+    _similarity_index: TeamSimilarityIndex
 
-    def __init__(self, repository: ITeamAttributesRepository):
+    def __init__(self, repository: ITeamAttributesRepository, similarity_index: TeamSimilarityIndex):
         """The initializer of the `Team Attributes service`.
 
             Args:
                 repository (ITeamAttributesRepository): The reference to the repository.
+                similarity_index (TeamSimilarityIndex): The reference to the similarity index.
             """
         self._repository = repository
+        self._similarity_index = similarity_index
 
     async def get_by_team_api_id(self, team_api_id: int) -> Any | None:
         """The abstract getting a teams attributes by its team_api_id.
@@ -29,3 +36,25 @@ class TeamAttributesService(ITeamAttributesService):
             Any | None: The player's attributes.
         """
         return await self._repository.get_by_team_api_id(team_api_id)
+
+    async def get_similar(
+            self,
+            team_api_id: int,
+            date: date | None,
+            k: int,
+            metric: str,
+    ) -> Iterable[Any] | None:
+        """The abstract getting teams with the most similar tactics as of a date.
+
+        Args:
+            team_api_id (int): The team_api_id of the team.
+            date (date | None): The as-of date, the newest attributes if None.
+            k (int): The number of similar teams.
+            metric (str): "cosine" similarity or "euclidean" distance.
+
+        Returns:
+            Iterable[Any] | None: The most similar teams, best first.
+        """
+        return self._similarity_index.similar(
+            team_api_id, np.datetime64(date) if date else None, k, metric
+        )
@@ -1,10 +1,12 @@
 """Main module of the app"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse
 
 from src.api.routers.country import router as country_router
 from src.api.routers.league import router as league_router
@@ -16,9 +18,13 @@ from src.api.routers.player_attributes import router as player_attributes_router
 from src.api.routers.team import router as team_router
 from src.api.routers.odds import router as odds_router
 from src.api.routers.team_attributes import router as team_attributes_router
+from src.config import config
 from src.container import Container
-from src.db import database, init_db
-from src.rabbitmq import OddsRpcClient
+from src.db import database, init_db, run_migrations
+from src.infrastructure.jobs.precompute import precompute_periodically
+from src.infrastructure.indexes.refresher import refresh_all, refresh_periodically
+from src.transports.admission import OddsRequestShed
+from src.transports.breaker import OddsUnavailable
 
 container = Container()
 container.wire(modules=[
@@ -39,9 +45,32 @@ container.wire(modules=[
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
     await init_db()
+    await run_migrations()
     await database.connect()
     await Container.rpc_client().connect()
+    # Engines following the match history subscribe to it when created.
+    Container.elo_engine()
+    Container.standings_index()
+    Container.team_form_index()
+    indexes = [
+        Container.match_history(),
+        Container.player_similarity_index(),
+        Container.team_similarity_index(),
+    ]
+    await refresh_all(indexes)
+    refresher = asyncio.create_task(refresh_periodically(indexes, config.INDEX_REFRESH_INTERVAL))
+    tasks = [refresher]
+    if config.ODDS_PRECOMPUTE_DATES:
+        tasks.append(asyncio.create_task(precompute_periodically(
+            Container.odds_service,
+            config.ODDS_PRECOMPUTE_DATES,
+            config.ODDS_PRECOMPUTE_INTERVAL,
+            config.ODDS_PRECOMPUTE_FROM,
+        )))
     yield
+    for task in tasks:
+        task.cancel()
+    await Container.rpc_client().close()
     await database.disconnect()
 
 
@@ -73,3 +102,25 @@ async def http_exception_handle_logging(
         Response: The HTTP response.
     """
     return await http_exception_handler(request, exception)
+
+
+@app.exception_handler(OddsUnavailable)
+@app.exception_handler(OddsRequestShed)
+async def odds_unavailable_handle(
+    request: Request,
+    exception: OddsUnavailable | OddsRequestShed,
+) -> Response:
+    """A function failing fast while the odds workers are unavailable or busy.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        exception (OddsUnavailable | OddsRequestShed): A related exception.
+
+    Returns:
+        Response: The 503 HTTP response.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exception)},
+        headers={"Retry-After": str(int(config.ODDS_BREAKER_OPEN_FOR))},
+    )
@@ -0,0 +1,3 @@
+-- As-of lookups of player ratings (latest row before a date).
+CREATE INDEX IF NOT EXISTS player_attributes_player_api_id_date_idx
+    ON "Player_Attributes" (player_api_id, date DESC);
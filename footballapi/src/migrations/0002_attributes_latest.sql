@@ -0,0 +1,107 @@
+-- Composite indexes for per-entity, date ordered reads of the attribute time series.
+-- They also cover the ratings and the numeric tactics, so as-of lookups are index-only.
+DROP INDEX IF EXISTS player_attributes_player_api_id_date_idx;
+CREATE INDEX IF NOT EXISTS player_attributes_player_api_id_date_idx
+    ON "Player_Attributes" (player_api_id, date DESC) INCLUDE (overall_rating, potential);
+DROP INDEX IF EXISTS team_attributes_team_api_id_date_idx;
+CREATE INDEX IF NOT EXISTS team_attributes_team_api_id_date_idx
+    ON "Team_Attributes" (team_api_id, date DESC) INCLUDE (
+        "buildUpPlaySpeed", "buildUpPlayDribbling", "buildUpPlayPassing",
+        "chanceCreationPassing", "chanceCreationCrossing", "chanceCreationShooting",
+        "defencePressure", "defenceAggression", "defenceTeamWidth"
+    );
+
+-- Latest attribute row per player / team, keyed by the api id.
+CREATE TABLE IF NOT EXISTS "Player_Attributes_Latest" (LIKE "Player_Attributes" INCLUDING DEFAULTS);
+ALTER TABLE "Player_Attributes_Latest" ADD PRIMARY KEY (player_api_id);
+
+INSERT INTO "Player_Attributes_Latest"
+SELECT DISTINCT ON (pa.player_api_id) pa.*
+FROM "Player_Attributes" pa
+WHERE pa.player_api_id IS NOT NULL
+ORDER BY pa.player_api_id, pa.date DESC, pa.id DESC;
+
+CREATE TABLE IF NOT EXISTS "Team_Attributes_Latest" (LIKE "Team_Attributes" INCLUDING DEFAULTS);
+ALTER TABLE "Team_Attributes_Latest" ADD PRIMARY KEY (team_api_id);
+
+INSERT INTO "Team_Attributes_Latest"
+SELECT DISTINCT ON (ta.team_api_id) ta.*
+FROM "Team_Attributes" ta
+WHERE ta.team_api_id IS NOT NULL
+ORDER BY ta.team_api_id, ta.date DESC, ta.id DESC;
+
+-- Refresh on ingest: every statement touching the attribute tables recomputes
+-- the latest row of the affected players / teams, both the ids of the rows
+-- before an update and after it, so rows moved to another id are accounted for.
+-- Transition tables are only read in the branch of the firing operation.
+CREATE OR REPLACE FUNCTION refresh_player_attributes_latest() RETURNS trigger AS $$
+DECLARE
+    changed integer[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT player_api_id) INTO changed FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT player_api_id) INTO changed FROM old_rows;
+    ELSE
+        SELECT array_agg(player_api_id) INTO changed
+        FROM (SELECT player_api_id FROM new_rows UNION SELECT player_api_id FROM old_rows) ids;
+    END IF;
+
+    DELETE FROM "Player_Attributes_Latest" l
+    WHERE l.player_api_id = ANY (changed);
+
+    INSERT INTO "Player_Attributes_Latest"
+    SELECT DISTINCT ON (pa.player_api_id) pa.*
+    FROM "Player_Attributes" pa
+    WHERE pa.player_api_id = ANY (changed)
+    ORDER BY pa.player_api_id, pa.date DESC, pa.id DESC;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION refresh_team_attributes_latest() RETURNS trigger AS $$
+DECLARE
+    changed integer[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT team_api_id) INTO changed FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT team_api_id) INTO changed FROM old_rows;
+    ELSE
+        SELECT array_agg(team_api_id) INTO changed
+        FROM (SELECT team_api_id FROM new_rows UNION SELECT team_api_id FROM old_rows) ids;
+    END IF;
+
+    DELETE FROM "Team_Attributes_Latest" l
+    WHERE l.team_api_id = ANY (changed);
+
+    INSERT INTO "Team_Attributes_Latest"
+    SELECT DISTINCT ON (ta.team_api_id) ta.*
+    FROM "Team_Attributes" ta
+    WHERE ta.team_api_id = ANY (changed)
+    ORDER BY ta.team_api_id, ta.date DESC, ta.id DESC;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER player_attributes_latest_insert
+    AFTER INSERT ON "Player_Attributes" REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_player_attributes_latest();
+CREATE TRIGGER player_attributes_latest_update
+    AFTER UPDATE ON "Player_Attributes" REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_player_attributes_latest();
+CREATE TRIGGER player_attributes_latest_delete
+    AFTER DELETE ON "Player_Attributes" REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_player_attributes_latest();
+
+CREATE TRIGGER team_attributes_latest_insert
+    AFTER INSERT ON "Team_Attributes" REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_team_attributes_latest();
+CREATE TRIGGER team_attributes_latest_update
+    AFTER UPDATE ON "Team_Attributes" REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_team_attributes_latest();
+CREATE TRIGGER team_attributes_latest_delete
+    AFTER DELETE ON "Team_Attributes" REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_team_attributes_latest();
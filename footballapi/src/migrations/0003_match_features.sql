@@ -0,0 +1,20 @@
+-- Per-match features written by the feature store job, one row per match.
+CREATE TABLE IF NOT EXISTS "Match_Features" (
+    match_api_id INTEGER PRIMARY KEY,
+    league_id INTEGER,
+    season TEXT,
+    date TEXT,
+    home_form DOUBLE PRECISION,
+    away_form DOUBLE PRECISION,
+    home_goals_for DOUBLE PRECISION,
+    home_goals_against DOUBLE PRECISION,
+    away_goals_for DOUBLE PRECISION,
+    away_goals_against DOUBLE PRECISION,
+    home_rating DOUBLE PRECISION,
+    away_rating DOUBLE PRECISION,
+    home_rest_days DOUBLE PRECISION,
+    away_rest_days DOUBLE PRECISION
+);
+
+CREATE INDEX IF NOT EXISTS match_features_league_id_season_idx
+    ON "Match_Features" (league_id, season);
@@ -0,0 +1,12 @@
+-- Starting lineup rating aggregates as of the match date, written by the lineup strength job.
+CREATE TABLE IF NOT EXISTS "Lineup_Strength" (
+    match_api_id INTEGER PRIMARY KEY,
+    home_rating_mean DOUBLE PRECISION,
+    home_rating_min DOUBLE PRECISION,
+    home_rating_max DOUBLE PRECISION,
+    home_rated INTEGER,
+    away_rating_mean DOUBLE PRECISION,
+    away_rating_min DOUBLE PRECISION,
+    away_rating_max DOUBLE PRECISION,
+    away_rated INTEGER
+);
@@ -1,26 +1,62 @@
 import asyncio
-import json
 import uuid
-from typing import MutableMapping
+from typing import Any, MutableMapping, Self
 
 from aio_pika import Message, connect
 from aio_pika.abc import (
-    AbstractChannel, AbstractConnection, AbstractIncomingMessage, AbstractQueue,
+    AbstractChannel, AbstractConnection, AbstractExchange, AbstractIncomingMessage, AbstractQueue,
 )
 from aiormq import AMQPConnectionError
 
 from src.config import config
+from src.transports.admission import AdmissionController, OddsRequestShed
+from src.transports.breaker import CircuitBreaker, CircuitOpen, OddsUnavailable
+from src.transports.itransport import IOddsTransport, OddsWorkerError
+from src.utils.rpc_codec import CONTENT_TYPE, ERROR_HEADER, PAYLOAD_VERSION, VERSION_HEADER, decode, encode
 
+# model fits and season simulations take long by design, so only these
+# count as slow calls against the circuit breaker
+TIMED_TYPES = {None, "odds", "batch"}
+
+
+class OddsRpcClient(IOddsTransport):
+    """RPC to the oddscalc workers through RabbitMQ.
+
+    With `ODDS_EXCHANGE` set, requests go to a consistent-hash exchange
+    (the rabbitmq_consistent_hash_exchange plugin) keyed by the shard key,
+    so one league's requests land on the same worker while the set of
+    workers doesn't change. Otherwise they go to the shared `rpc_queue`.
+
+    Requests carry an AMQP priority, which the workers' priority queues
+    honour. Background requests, those given a priority below
+    `ODDS_PRIORITY`, are shed while the interactive traffic is overloaded.
+
+    Interactive requests go through a circuit breaker and give up after
+    `ODDS_RPC_TIMEOUT`, so while the workers are down or slow requests
+    fail fast with `OddsUnavailable` instead of piling up on futures.
+    Background requests are refused while the circuit isn't closed.
+    A request the engine failed on raises `OddsWorkerError`; the worker
+    did answer, so it doesn't count against the breaker.
+    """
 
-class OddsRpcClient:
     connection: AbstractConnection
     channel: AbstractChannel
     callback_queue: AbstractQueue
+    exchange: AbstractExchange
 
     def __init__(self) -> None:
         self.futures: MutableMapping[str, asyncio.Future] = {}
+        self.admission = AdmissionController(config.ODDS_SHED_IN_FLIGHT, config.ODDS_SHED_LATENCY)
+        self.breaker = CircuitBreaker(
+            config.ODDS_BREAKER_FAILURE_RATE,
+            config.ODDS_BREAKER_SLOW_CALL,
+            window=config.ODDS_BREAKER_WINDOW,
+            min_calls=config.ODDS_BREAKER_MIN_CALLS,
+            open_for=config.ODDS_BREAKER_OPEN_FOR,
+            probes=config.ODDS_BREAKER_PROBES,
+        )
 
-    async def connect(self, retries: int = 5, delay: int = 5) -> "OddsRpcClient":
+    async def connect(self, retries: int = 5, delay: int = 5) -> Self:
         conn_successful = False
         for attempt in range(retries):
             try:
@@ -37,6 +73,12 @@ class OddsRpcClient:
         self.channel = await self.connection.channel()
         self.callback_queue = await self.channel.declare_queue(exclusive=True)
         await self.callback_queue.consume(self.on_response, no_ack=True)
+        if config.ODDS_EXCHANGE:
+            self.exchange = await self.channel.declare_exchange(
+                config.ODDS_EXCHANGE, type="x-consistent-hash", durable=True,
+            )
+        else:
+            self.exchange = self.channel.default_exchange
         return self
 
     async def on_response(self, message: AbstractIncomingMessage) -> None:
@@ -44,27 +86,69 @@ class OddsRpcClient:
             print(f"Bad message {message!r}")
             return
 
-        future: asyncio.Future = self.futures.pop(message.correlation_id)
-        future.set_result(message.body)
+        # the caller may have given up already, e.g. on a timeout
+        future = self.futures.pop(message.correlation_id, None)
+        if future is None or future.done():
+            return
+        future.set_result(message)
+
+    async def call(
+            self,
+            data: Any,
+            message_type: str | None = None,
+            shard_key: str | None = None,
+            priority: int | None = None,
+    ) -> Any:
+        priority = config.ODDS_PRIORITY if priority is None else priority
+        interactive = priority >= config.ODDS_PRIORITY
+        if not interactive:
+            # probing a half-open circuit is left to interactive requests
+            if self.breaker.state != "closed":
+                raise CircuitOpen("The odds workers are unavailable")
+            if not self.admission.admit():
+                raise OddsRequestShed("The odds workers are busy with interactive requests")
 
-    async def call(self, data: str) -> dict:
+        permit = self.breaker.acquire() if interactive else None
         correlation_id = str(uuid.uuid4())
         loop = asyncio.get_running_loop()
         future = loop.create_future()
         self.futures[correlation_id] = future
-        await self.channel.default_exchange.publish(
-            Message(
-                str(data).encode(),
-                content_type="text/plain",
-                correlation_id=correlation_id,
-                reply_to=self.callback_queue.name,
-            ),
-            routing_key="rpc_queue",
-        )
-        result = await future
-        result = result.decode()
-        result = result.replace("\'", "\"")
-        result = json.loads(result)
-        #print(result.decode())
-        return result
-        #return str(await future)
+        started = self.admission.started() if interactive else None
+        # None while the call is abandoned, e.g. by a disconnected client
+        failed = None
+        try:
+            await self.exchange.publish(
+                Message(
+                    encode(data),
+                    content_type=CONTENT_TYPE,
+                    headers={VERSION_HEADER: PAYLOAD_VERSION},
+                    correlation_id=correlation_id,
+                    reply_to=self.callback_queue.name,
+                    type=message_type,
+                    priority=priority,
+                ),
+                # requests without a key are spread over the workers
+                routing_key=(shard_key or correlation_id) if config.ODDS_EXCHANGE else "rpc_queue",
+            )
+            try:
+                reply: AbstractIncomingMessage = await asyncio.wait_for(future, config.ODDS_RPC_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise OddsUnavailable("The odds workers didn't answer in time") from None
+            failed = False
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.futures.pop(correlation_id, None)
+            if started is not None:
+                self.admission.finished(started)
+            if permit is not None:
+                self.breaker.release(permit, failed, timed=message_type in TIMED_TYPES)
+        if (error := (reply.headers or {}).get(ERROR_HEADER)) is not None:
+            if isinstance(error, bytes):
+                error = error.decode()
+            raise OddsWorkerError(f"Odds worker error: {error}")
+        return decode(reply.body, reply.content_type, reply.headers)
+
+    async def close(self) -> None:
+        await self.connection.close()
@@ -0,0 +1,72 @@
+"""Module containing admission control of background odds requests."""
+
+import time
+from collections import deque
+
+
+class OddsRequestShed(Exception):
+    """An exception raised when a background request is shed under load."""
+
+
+class AdmissionController:
+    """A class deciding whether background odds requests may be sent.
+
+    Interactive requests are always sent and tracked: how many are in flight
+    and how long the ones finished within the last `window` seconds took.
+    While either is over its threshold, background requests are shed so
+    they don't queue in front of the workers.
+    """
+
+    def __init__(self, max_in_flight: int, max_latency: float, window: float = 10.0) -> None:
+        """The initializer of the controller.
+
+        Args:
+            max_in_flight (int): The interactive requests in flight above which background ones are shed.
+            max_latency (float): The mean recent interactive latency in seconds above which background ones are shed.
+            window (float): The seconds of interactive latencies taken into account.
+        """
+        self.max_in_flight = max_in_flight
+        self.max_latency = max_latency
+        self.window = window
+        self.in_flight = 0
+        self._latencies: deque[tuple[float, float]] = deque()
+
+    def started(self) -> float:
+        """Recording an interactive request being sent.
+
+        Returns:
+            float: The start time to pass to `finished`.
+        """
+        self.in_flight += 1
+        return time.monotonic()
+
+    def finished(self, started: float) -> None:
+        """Recording an interactive request being answered or abandoned.
+
+        Args:
+            started (float): The time returned by `started`.
+        """
+        self.in_flight -= 1
+        now = time.monotonic()
+        self._latencies.append((now, now - started))
+
+    def latency(self) -> float:
+        """Getting the mean latency of the recent interactive requests.
+
+        Returns:
+            float: The mean latency in seconds, 0 without recent requests.
+        """
+        horizon = time.monotonic() - self.window
+        while self._latencies and self._latencies[0][0] < horizon:
+            self._latencies.popleft()
+        if not self._latencies:
+            return 0.0
+        return sum(latency for _, latency in self._latencies) / len(self._latencies)
+
+    def admit(self) -> bool:
+        """Deciding whether a background request may be sent now.
+
+        Returns:
+            bool: False while the interactive traffic is over a threshold.
+        """
+        return self.in_flight <= self.max_in_flight and self.latency() <= self.max_latency
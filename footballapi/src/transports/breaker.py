@@ -0,0 +1,135 @@
+"""Module containing the circuit breaker of odds requests."""
+
+import logging
+import time
+from collections import deque
+from typing import Literal, NamedTuple
+
+
+class OddsUnavailable(Exception):
+    """An exception raised when the odds engine can't answer in time."""
+
+
+class CircuitOpen(OddsUnavailable):
+    """An exception raised instead of sending a request while the circuit is open."""
+
+
+class Permit(NamedTuple):
+    """A call let through by the breaker."""
+    started: float
+    # the number of state changes before the call, so late outcomes are told apart
+    epoch: int
+    # whether it probes the half-open circuit
+    probe: bool
+
+
+class CircuitBreaker:
+    """A class failing odds requests fast while the workers are down or slow.
+
+    The outcomes of the last `window` calls are kept, a call failing or
+    taking longer than `slow_call` seconds counting as bad. Once at least
+    `min_calls` are known and the share of bad ones reaches `failure_rate`,
+    the circuit opens and calls are refused for `open_for` seconds. Then it
+    is half-open: up to `probes` calls go through, and the first outcome
+    closes the circuit again or reopens it. Calls finishing after the state
+    they were let through in has changed say nothing about the new one, so
+    their outcomes are dropped.
+    """
+
+    state: Literal["closed", "open", "half_open"]
+
+    def __init__(
+            self,
+            failure_rate: float,
+            slow_call: float,
+            window: int = 20,
+            min_calls: int = 10,
+            open_for: float = 15.0,
+            probes: int = 1,
+    ) -> None:
+        """The initializer of the breaker.
+
+        Args:
+            failure_rate (float): The share of bad calls opening the circuit.
+            slow_call (float): The seconds above which a call counts as bad.
+            window (int): The number of recent calls taken into account.
+            min_calls (int): The number of calls needed before the circuit can open.
+            open_for (float): The seconds the circuit stays open before probing.
+            probes (int): The calls let through at once while half-open.
+        """
+        self.failure_rate = failure_rate
+        self.slow_call = slow_call
+        self.min_calls = min_calls
+        self.open_for = open_for
+        self.probes = probes
+        self.state = "closed"
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probing = 0
+        self._epoch = 0
+
+    def allows(self) -> bool:
+        """Checking whether a call would be let through, without taking a probe.
+
+        Returns:
+            bool: False while the circuit is open or its probes are taken.
+        """
+        if self.state == "open" and time.monotonic() - self._opened_at >= self.open_for:
+            self._transition("half_open")
+        return self.state == "closed" or (self.state == "half_open" and self._probing < self.probes)
+
+    def acquire(self) -> Permit:
+        """Letting a call through or refusing it.
+
+        Raises:
+            CircuitOpen: While the circuit is open or its probes are taken.
+
+        Returns:
+            Permit: The permit to pass to `release`.
+        """
+        if not self.allows():
+            raise CircuitOpen("The odds workers are unavailable")
+        probe = self.state == "half_open"
+        if probe:
+            self._probing += 1
+        return Permit(time.monotonic(), self._epoch, probe)
+
+    def release(self, permit: Permit, failed: bool | None, timed: bool = True) -> None:
+        """Recording the outcome of a call let through by `acquire`.
+
+        Args:
+            permit (Permit): The permit returned by `acquire`.
+            failed (bool | None): Whether the call failed, None if it was
+                abandoned by the caller and says nothing about the workers.
+            timed (bool): Whether a slow call counts as bad, False for
+                calls which are expected to take long.
+        """
+        if permit.epoch != self._epoch:
+            return
+        if permit.probe:
+            self._probing = max(self._probing - 1, 0)
+        if failed is None:
+            return
+        bad = failed or (timed and time.monotonic() - permit.started > self.slow_call)
+        if permit.probe:
+            self._transition("open" if bad else "closed")
+        elif self.state == "closed":
+            self._outcomes.append(bad)
+            if len(self._outcomes) >= self.min_calls and \
+                    sum(self._outcomes) >= self.failure_rate * len(self._outcomes):
+                self._transition("open")
+
+    def _transition(self, state: Literal["closed", "open", "half_open"]) -> None:
+        """Moving the circuit to another state.
+
+        Args:
+            state (Literal["closed", "open", "half_open"]): The new state.
+        """
+        if state == "open":
+            self._opened_at = time.monotonic()
+        if state != "half_open":
+            self._outcomes.clear()
+            self._probing = 0
+        self._epoch += 1
+        logging.warning("Odds circuit %s -> %s", self.state, state)
+        self.state = state
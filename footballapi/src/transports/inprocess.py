@@ -0,0 +1,60 @@
+"""Module containing the in-process odds transport."""
+
+import asyncio
+import importlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Self
+
+from src.config import config
+from src.transports.itransport import IOddsTransport
+
+
+class InProcessOddsTransport(IOddsTransport):
+    """A class running the odds engine in a local process pool.
+
+    The engine is the oddscalc worker's `engine` module, imported from
+    `ODDS_ENGINE_PATH`. Payloads are handed to the pool as Python objects,
+    with no broker hop and no encoding.
+    """
+
+    engine: ModuleType
+    pool: ProcessPoolExecutor
+
+    async def connect(self) -> Self:
+        """The method importing the engine and starting the process pool.
+
+        Returns:
+            Self: The connected transport.
+        """
+        if config.ODDS_ENGINE_PATH and config.ODDS_ENGINE_PATH not in sys.path:
+            sys.path.append(config.ODDS_ENGINE_PATH)
+        self.engine = importlib.import_module("engine")
+        self.pool = ProcessPoolExecutor(max_workers=config.ODDS_ENGINE_WORKERS)
+        return self
+
+    async def call(
+            self,
+            data: Any,
+            message_type: str | None = None,
+            shard_key: str | None = None,
+            priority: int | None = None,
+    ) -> Any:
+        """The method running a computation of the odds engine in the pool.
+
+        Args:
+            data (Any): The payload.
+            message_type (str | None): The computation, e.g. "odds", "batch", "fit" or "simulate".
+            shard_key (str | None): Unused, there is a single engine.
+            priority (int | None): Unused, requests are not queued.
+
+        Returns:
+            Any: The engine's reply.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, self.engine.compute, message_type, data)
+
+    async def close(self) -> None:
+        """The method shutting the process pool down."""
+        self.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,50 @@
+"""Module containing odds transport abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Self
+
+
+class OddsWorkerError(RuntimeError):
+    """An error raised by the odds engine while computing a request."""
+
+
+class IOddsTransport(ABC):
+    """An abstract class representing protocol of odds transports.
+
+    A transport delivers a payload to the odds engine, which runs the
+    computation named by the message type, and returns the engine's reply.
+    """
+
+    @abstractmethod
+    async def connect(self) -> Self:
+        """The abstract preparing the transport for calls.
+
+        Returns:
+            Self: The connected transport.
+        """
+
+    @abstractmethod
+    async def call(
+            self,
+            data: Any,
+            message_type: str | None = None,
+            shard_key: str | None = None,
+            priority: int | None = None,
+    ) -> Any:
+        """The abstract running a computation of the odds engine.
+
+        Args:
+            data (Any): The payload.
+            message_type (str | None): The computation, e.g. "odds", "batch", "fit" or "simulate".
+            shard_key (str | None): The key, usually the league id, keeping related
+                requests on the same worker where the transport has several.
+            priority (int | None): The priority against other requests, higher first,
+                where the transport queues them; None for interactive requests.
+
+        Returns:
+            Any: The decoded reply.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """The abstract releasing the resources of the transport."""
@@ -0,0 +1,118 @@
+"""Module containing the Unix socket odds transport."""
+
+import asyncio
+import itertools
+import struct
+from typing import Any, MutableMapping, Self
+
+from src.config import config
+from src.transports.itransport import IOddsTransport, OddsWorkerError
+from src.utils.rpc_codec import decode, encode
+
+HEADER = struct.Struct(">I")
+
+
+class UnixSocketOddsTransport(IOddsTransport):
+    """A class calling the odds worker over a Unix socket.
+
+    Frames are a 4-byte big-endian length followed by a version 1 payload.
+    Requests are [request_id, message_type, payload] and replies
+    [request_id, result, error]; one connection carries concurrent calls.
+    When the connection is lost the pending calls fail with ConnectionError
+    and the next call reconnects, failing at once if the worker is down.
+    """
+
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+    def __init__(self) -> None:
+        self.futures: MutableMapping[int, asyncio.Future] = {}
+        self._ids = itertools.count()
+        self._receiver: asyncio.Task | None = None
+        self._reconnecting = asyncio.Lock()
+
+    async def connect(self, retries: int = 5, delay: int = 5) -> Self:
+        """The method connecting to the worker's socket.
+
+        Args:
+            retries (int): The number of connection attempts.
+            delay (int): The seconds between attempts.
+
+        Raises:
+            ConnectionError: If the worker could not be reached.
+
+        Returns:
+            Self: The connected transport.
+        """
+        for attempt in range(retries):
+            try:
+                self.reader, self.writer = await asyncio.open_unix_connection(config.ODDS_SOCKET_PATH)
+                break
+            except OSError as e:
+                print(f"Attempt {attempt + 1} failed: {e}")
+                await asyncio.sleep(delay)
+        else:
+            raise ConnectionError("Could not connect to the odds worker socket after several retries")
+
+        self._receiver = asyncio.create_task(self._receive())
+        return self
+
+    async def _receive(self) -> None:
+        """Resolving the futures of calls as their replies arrive."""
+        try:
+            while True:
+                (length,) = HEADER.unpack(await self.reader.readexactly(HEADER.size))
+                request_id, result, error = decode(await self.reader.readexactly(length))
+                future = self.futures.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(OddsWorkerError(f"Odds worker error: {error}"))
+        except (asyncio.IncompleteReadError, OSError) as e:
+            for future in self.futures.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"The odds worker connection was lost: {e!r}"))
+            self.futures.clear()
+            self.writer.close()
+
+    async def call(
+            self,
+            data: Any,
+            message_type: str | None = None,
+            shard_key: str | None = None,
+            priority: int | None = None,
+    ) -> Any:
+        """The method running a computation of the odds engine in the worker.
+
+        Args:
+            data (Any): The payload.
+            message_type (str | None): The computation, e.g. "odds", "batch", "fit" or "simulate".
+            shard_key (str | None): Unused, there is a single engine.
+            priority (int | None): Unused, requests are not queued.
+
+        Returns:
+            Any: The decoded reply.
+        """
+        if self._receiver is None or self._receiver.done():
+            async with self._reconnecting:
+                if self._receiver is None or self._receiver.done():
+                    await self.connect(retries=1, delay=0)
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self.futures[request_id] = future
+        body = encode([request_id, message_type, data])
+        self.writer.write(HEADER.pack(len(body)) + body)
+        try:
+            await self.writer.drain()
+            return await future
+        finally:
+            self.futures.pop(request_id, None)
+
+    async def close(self) -> None:
+        """The method closing the connection."""
+        if self._receiver is not None:
+            self._receiver.cancel()
+        self.writer.close()
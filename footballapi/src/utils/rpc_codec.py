@@ -0,0 +1,49 @@
+"""Encoding of the RPC payloads exchanged with the odds worker.
+
+Version 1 payloads are msgpack documents. NumPy arrays, like the training
+windows of (home_id, away_id, home_goals, away_goals) rows, travel packed
+as an extension type holding their dtype, shape and raw bytes.
+Plain text payloads are the legacy JSON format and are still accepted.
+"""
+
+import json
+from typing import Any
+
+import msgpack
+import numpy as np
+
+PAYLOAD_VERSION = 1
+CONTENT_TYPE = "application/msgpack"
+VERSION_HEADER = "x-payload-version"
+# set on replies to requests the engine failed on, holding the error
+ERROR_HEADER = "x-error"
+NDARRAY_EXT = 1
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        obj = np.ascontiguousarray(obj)
+        return msgpack.ExtType(NDARRAY_EXT, msgpack.packb([obj.dtype.str, list(obj.shape), obj.tobytes()]))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot encode {type(obj)!r}")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == NDARRAY_EXT:
+        dtype, shape, buffer = msgpack.unpackb(data)
+        return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+    return msgpack.ExtType(code, data)
+
+
+def encode(payload: Any) -> bytes:
+    return msgpack.packb(payload, default=_default, use_bin_type=True)
+
+
+def decode(body: bytes, content_type: str | None = CONTENT_TYPE, headers: dict | None = None) -> Any:
+    if content_type != CONTENT_TYPE:
+        return json.loads(body.decode())
+    version = (headers or {}).get(VERSION_HEADER, PAYLOAD_VERSION)
+    if version != PAYLOAD_VERSION:
+        raise ValueError(f"Unsupported payload version {version!r}")
+    return msgpack.unpackb(body, ext_hook=_ext_hook, strict_map_key=False)
@@ -0,0 +1,58 @@
+"""Module containing in-memory caches."""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """A class implementing a size bounded least recently used cache."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """The initializer of the cache.
+
+        Args:
+            maxsize (int): The number of entries kept.
+        """
+        self.maxsize = maxsize
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Getting an entry and marking it as recently used.
+
+        Args:
+            key (Hashable): The key of the entry.
+            default (Any): The value returned on a miss.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        if key not in self._items:
+            return default
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """Getting the entries without marking them as used.
+
+        Returns:
+            list[tuple[Hashable, Any]]: The entries, the most recently used first.
+        """
+        return list(reversed(self._items.items()))
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Storing an entry, evicting the least recently used one when full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to store.
+        """
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
@@ -1,6 +1,6 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,18 @@ class AppConfig(BaseConfig):
     RABBITMQ_PORT: Optional[str] = None
     RABBITMQ_DEFAULT_USER: Optional[str] = None
     RABBITMQ_DEFAULT_PASS: Optional[str] = None
+    SIMULATION_WORKERS: Optional[int] = None
+    ENGINE: Literal["numpy", "statsmodels"] = "numpy"
+    TRANSPORT: Literal["amqp", "unix"] = "amqp"
+    SOCKET_PATH: str = "/tmp/oddscalc.sock"
+    EXCHANGE: Optional[str] = "odds.shards"
+    SHARD_WEIGHT: int = 1
+    RESULT_CACHE_SIZE: int = 256
+    MAX_PRIORITY: int = 10
+    PREFETCH_COUNT: Optional[int] = None
+    SNAPSHOT_PATH: Optional[str] = None
+    SNAPSHOT_INTERVAL: float = 300.0
+    SNAPSHOT_SIZE: int = 4096
 
 
 config = AppConfig()
@@ -0,0 +1,107 @@
+import numpy as np
+
+# per day; a match a year old weighs about half as much as today's
+DEFAULT_DECAY = 0.0019
+
+
+def _unpack(x: np.ndarray, n_teams: int):
+    return x[0], x[1], x[2:2 + n_teams], x[2 + n_teams:2 + 2 * n_teams], x[-1]
+
+
+def _negative_log_likelihood(x, home_index, away_index, home_goals, away_goals, weights, n_teams):
+    """Weighted Dixon-Coles negative log likelihood and its gradient.
+
+    Sum-to-zero of the attack and defence strengths is enforced with a penalty.
+    """
+    intercept, home, attack, defence, rho = _unpack(x, n_teams)
+    home_rate = np.exp(intercept + home + attack[home_index] + defence[away_index])
+    away_rate = np.exp(intercept + attack[away_index] + defence[home_index])
+
+    # low score dependence, only the 0-0, 0-1, 1-0 and 1-1 results are adjusted
+    low = (home_goals <= 1) & (away_goals <= 1)
+    nil_nil = low & (home_goals == 0) & (away_goals == 0)
+    nil_one = low & (home_goals == 0) & (away_goals == 1)
+    one_nil = low & (home_goals == 1) & (away_goals == 0)
+    one_one = low & (home_goals == 1) & (away_goals == 1)
+    tau = np.ones_like(home_rate)
+    tau[nil_nil] = 1 - home_rate[nil_nil] * away_rate[nil_nil] * rho
+    tau[nil_one] = 1 + home_rate[nil_one] * rho
+    tau[one_nil] = 1 + away_rate[one_nil] * rho
+    tau[one_one] = 1 - rho
+    tau = np.maximum(tau, 1e-10)
+
+    log_likelihood = (np.log(tau) + home_goals * np.log(home_rate) - home_rate
+                      + away_goals * np.log(away_rate) - away_rate)
+
+    # derivatives by the log rates and by rho
+    d_home = home_goals - home_rate
+    d_away = away_goals - away_rate
+    d_rho = np.zeros_like(home_rate)
+    product = home_rate * away_rate
+    d_home[nil_nil] -= product[nil_nil] * rho / tau[nil_nil]
+    d_away[nil_nil] -= product[nil_nil] * rho / tau[nil_nil]
+    d_rho[nil_nil] = -product[nil_nil] / tau[nil_nil]
+    d_home[nil_one] += home_rate[nil_one] * rho / tau[nil_one]
+    d_rho[nil_one] = home_rate[nil_one] / tau[nil_one]
+    d_away[one_nil] += away_rate[one_nil] * rho / tau[one_nil]
+    d_rho[one_nil] = away_rate[one_nil] / tau[one_nil]
+    d_rho[one_one] = -1 / tau[one_one]
+
+    d_home, d_away, d_rho = weights * d_home, weights * d_away, weights * d_rho
+    gradient = np.concatenate([
+        [d_home.sum() + d_away.sum(), d_home.sum()],
+        np.bincount(home_index, d_home, n_teams) + np.bincount(away_index, d_away, n_teams),
+        np.bincount(away_index, d_home, n_teams) + np.bincount(home_index, d_away, n_teams),
+        [d_rho.sum()],
+    ])
+
+    penalty = attack.sum() ** 2 + defence.sum() ** 2
+    gradient = -gradient
+    gradient[2:2 + n_teams] += 2 * attack.sum()
+    gradient[2 + n_teams:2 + 2 * n_teams] += 2 * defence.sum()
+    return -(weights * log_likelihood).sum() + penalty, gradient
+
+
+def fit_dixon_coles(data: dict) -> dict:
+    """Fits a time-decayed Dixon-Coles model and returns its coefficients.
+
+    Every match is weighted by exp(-decay * days_ago). The fit starts from the
+    coefficients in "init" when given, usually the previous matchday's fit,
+    so it converges in a few iterations. The coefficients use the same names
+    as the Poisson model's ("team[T.<id>]" and "opponent[T.<id>]") plus "rho".
+
+    data: {"window": [[home, away, home_goals, away_goals, days_ago], ...],
+           "decay": float, "init": {"params": {...}} | None}
+    """
+    # scipy is only needed here, so the worker starts without it
+    from scipy.optimize import minimize
+
+    window = np.asarray(data["window"], dtype=np.float64).reshape(-1, 5)
+    if not len(window):
+        return {}
+    decay = data.get("decay", DEFAULT_DECAY)
+
+    teams, index = np.unique(window[:, :2].astype(np.int64), return_inverse=True)
+    index = index.reshape(-1, 2)
+    n_teams = len(teams)
+
+    x0 = np.zeros(2 * n_teams + 3)
+    x0[1] = 0.25
+    if init := (data.get("init") or {}).get("params"):
+        x0[0] = init.get("Intercept", 0.0)
+        x0[1] = init.get("home", x0[1])
+        x0[2:2 + n_teams] = [init.get(f"team[T.{team}]", 0.0) for team in teams]
+        x0[2 + n_teams:2 + 2 * n_teams] = [init.get(f"opponent[T.{team}]", 0.0) for team in teams]
+        x0[-1] = init.get("rho", 0.0)
+
+    bounds = [(None, None)] * (2 * n_teams + 2) + [(-0.2, 0.2)]
+    result = minimize(
+        _negative_log_likelihood, x0, method="L-BFGS-B", jac=True, bounds=bounds,
+        args=(index[:, 0], index[:, 1], window[:, 2], window[:, 3], np.exp(-decay * window[:, 4]), n_teams),
+    )
+
+    intercept, home, attack, defence, rho = _unpack(result.x, n_teams)
+    params = {"Intercept": float(intercept), "home": float(home), "rho": float(rho)}
+    params.update({f"team[T.{team}]": float(value) for team, value in zip(teams.tolist(), attack)})
+    params.update({f"opponent[T.{team}]": float(value) for team, value in zip(teams.tolist(), defence)})
+    return {"teams": teams.tolist(), "params": params, "iterations": int(result.nit)}
@@ -0,0 +1,63 @@
+"""The odds engine: every computation the worker offers, callable without a broker.
+
+`compute` runs in a process pool of the AMQP or Unix socket worker, or
+directly in the API's own process pool when it runs the engine in-process.
+"""
+
+import numpy as np
+
+from batch import price_fixtures
+from dixon_coles import fit_dixon_coles
+from model import fit_coefficients, fit_poisson_model, simulate_match
+from simulation import simulate_season
+
+
+def legacy_odds_payload(rows: list[dict]) -> dict:
+    # the legacy payload is a list of Match rows, the priced match first
+    return {
+        "fixture": [rows[0]["home_team_api_id"], rows[0]["away_team_api_id"]],
+        "window": [[row["home_team_api_id"], row["away_team_api_id"], row["home_team_goal"], row["away_team_goal"]]
+                   for row in rows[1:]],
+    }
+
+
+def calc_odds(data: dict | list) -> dict:
+    if not data:
+        return {}
+    if isinstance(data, list):
+        data = legacy_odds_payload(data)
+
+    hometeam, awayteam = (int(team) for team in data["fixture"])
+
+    poisson_model = fit_poisson_model(np.asarray(data["window"], dtype=np.int64).reshape(-1, 4))
+
+    decyzja = simulate_match(poisson_model, hometeam, awayteam, max_goals=10)
+
+    return_dict = {"home_team": float(np.sum(np.tril(decyzja, -1))), "draw": float(np.sum(np.diag(decyzja))),
+                   "away_team": float(np.sum(np.triu(decyzja, 1)))}
+
+    return return_dict
+
+
+fitters = {
+    "poisson": fit_coefficients,
+    "dixon_coles": fit_dixon_coles,
+}
+
+
+def calc_fit(data: dict) -> dict:
+    return fitters[data.get("model", "poisson")](data)
+
+
+handlers = {
+    None: calc_odds,
+    "odds": calc_odds,
+    "batch": price_fixtures,
+    "fit": calc_fit,
+    "simulate": simulate_season,
+}
+
+
+def compute(message_type: str | None, data) -> dict:
+    """Runs the computation requested by a message type on a decoded payload."""
+    return handlers[message_type](data)
@@ -0,0 +1,65 @@
+"""The goal model with NumPy only, the slim engine's replacement for statsmodels.
+
+The design matrix follows the formula "goals ~ home + team + opponent" with
+the team ids as numeric columns, like statsmodels builds it from the data
+frame, so the fitted coefficients carry the same names and values.
+"""
+
+import numpy as np
+
+PARAM_NAMES = ("Intercept", "home", "team", "opponent")
+
+
+def goal_model_design(window: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Design matrix and goals of a training window, one row per team and match.
+
+    window: [[home, away, home_goals, away_goals], ...]
+    """
+    window = np.asarray(window, dtype=np.int64).reshape(-1, 4)
+    n = len(window)
+    team = np.concatenate([window[:, 0], window[:, 1]])
+    opponent = np.concatenate([window[:, 1], window[:, 0]])
+    home = np.concatenate([np.ones(n), np.zeros(n)])
+    goals = np.concatenate([window[:, 2], window[:, 3]]).astype(np.float64)
+    return np.column_stack([np.ones(2 * n), home, team, opponent]).astype(np.float64), goals
+
+
+def poisson_deviance(y: np.ndarray, mu: np.ndarray) -> float:
+    ratio = np.where(y > 0, y / mu, 1.0)
+    return float(2 * np.sum(y * np.log(ratio) - (y - mu)))
+
+
+def fit_poisson_irls(X: np.ndarray, y: np.ndarray, max_iter: int = 100, tol: float = 1e-8) -> np.ndarray:
+    """Fits a log link Poisson GLM by iteratively reweighted least squares.
+
+    Starts, like statsmodels, from mu = (y + mean(y)) / 2 and stops once the
+    deviance changes by less than tol. Every step is a weighted least squares
+    solve with the weights mu and the working response eta + (y - mu) / mu.
+    """
+    mu = (y + y.mean()) / 2
+    eta = np.log(mu)
+    deviance = poisson_deviance(y, mu)
+    beta = np.zeros(X.shape[1])
+    for _ in range(max_iter):
+        sqrt_weights = np.sqrt(mu)
+        z = eta + (y - mu) / mu
+        beta = np.linalg.lstsq(X * sqrt_weights[:, None], z * sqrt_weights, rcond=None)[0]
+        eta = X @ beta
+        mu = np.exp(eta)
+        previous, deviance = deviance, poisson_deviance(y, mu)
+        if abs(deviance - previous) <= tol:
+            break
+    return beta
+
+
+def fit_goal_model(window: np.ndarray) -> dict[str, float]:
+    """Fits the goal model on a training window and returns its coefficients by name."""
+    X, y = goal_model_design(window)
+    return {name: float(value) for name, value in zip(PARAM_NAMES, fit_poisson_irls(X, y))}
+
+
+def poisson_pmf(k, mu) -> np.ndarray:
+    """Poisson probabilities of the goal counts k at the rates mu, broadcast together."""
+    k = np.asarray(k, dtype=np.int64)
+    log_factorial = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, k.max() + 1)))])
+    return np.exp(k * np.log(mu) - mu - log_factorial[k])
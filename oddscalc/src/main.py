@@ -1,67 +1,96 @@
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
 
-import numpy as np
-import pandas as pd
-import statsmodels.api as sm
-import statsmodels.formula.api as smf
 from aio_pika import Message, connect
 from aio_pika.abc import AbstractIncomingMessage
 from aiormq import AMQPConnectionError
-from scipy.stats import poisson
 
+import socket_server
+from cache import LRUCache
+from codec import CONTENT_TYPE, ERROR_HEADER, PAYLOAD_VERSION, VERSION_HEADER, decode, encode
 from config import config
+from engine import compute
+from snapshot import Snapshot, save_snapshot
+
+pool: ProcessPoolExecutor
+
+# Sharded routing sends a league's requests to the same worker, so refits
+# on an unchanged window are answered from here. Simulations are random.
+CACHED_TYPES = {None, "odds", "batch", "fit"}
+results = LRUCache(maxsize=config.RESULT_CACHE_SIZE)
+# the results of the previous run, decoded when first requested again
+snapshot = Snapshot.empty()
+
+
+async def respond(message: AbstractIncomingMessage):
+    data = decode(message.body, message.content_type, message.headers)
+
+    key = (message.type, hashlib.sha1(message.body).digest())
+    if (result := results.get(key)) is None and (result := snapshot.get(key)) is not None:
+        results.put(key, result)
+    if result is None:
+        # CPU heavy, so it runs in the process pool instead of the event loop
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(pool, compute, message.type, data)
+        if message.type in CACHED_TYPES:
+            results.put(key, result)
+    return result
+
+
+async def process(exchange, message: AbstractIncomingMessage) -> None:
+    try:
+        async with message.process(requeue=False):
+            assert message.reply_to is not None
+            # a request the engine fails on is answered with the error, so the
+            # caller doesn't wait for a reply that never comes
+            headers = {}
+            try:
+                result = await respond(message)
+            except Exception as e:
+                logging.exception("Processing error for message %r", message)
+                result, headers = None, {ERROR_HEADER: repr(e)}
+            if message.content_type == CONTENT_TYPE:
+                reply = Message(
+                    body=encode(result),
+                    content_type=CONTENT_TYPE,
+                    headers={VERSION_HEADER: PAYLOAD_VERSION, **headers},
+                    correlation_id=message.correlation_id,
+                )
+            else:
+                reply = Message(
+                    body=json.dumps(result).encode(),
+                    content_type="application/json",
+                    headers=headers,
+                    correlation_id=message.correlation_id,
+                )
+            await exchange.publish(reply, routing_key=message.reply_to, )
+            print("Request complete")
+    except Exception:
+        logging.exception("Processing error for message %r", message)
+
+
+async def save_periodically(path: str, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            save_snapshot(path, results, config.SNAPSHOT_SIZE)
+        except Exception:
+            logging.exception("Saving the snapshot to %s failed", path)
 
 
-async def simulate_match(foot_model, homeTeam, awayTeam, max_goals=10):
-    home_goals_avg = foot_model.predict(pd.DataFrame(data={'team': homeTeam,
-                                                           'opponent': awayTeam, 'home': 1},
-                                                     index=[1])).values[0]
-    away_goals_avg = foot_model.predict(pd.DataFrame(data={'team': awayTeam,
-                                                           'opponent': homeTeam, 'home': 0},
-                                                     index=[1])).values[0]
-    team_pred = [[poisson.pmf(i, team_avg) for i in range(0, max_goals + 1)] for team_avg in
-                 [home_goals_avg, away_goals_avg]]
-    return (np.outer(np.array(team_pred[0]), np.array(team_pred[1])))
-
-
-async def calc_odds(data: str) -> dict:
-    # data = data.decode('utf-8')
-    if not data:
-        return {}
-    df = pd.read_json(data)
-
-    hometeam = df['home_team_api_id'].iloc[0]
-    awayteam = df['away_team_api_id'].iloc[0]
-
-
-    df = df.drop(0)  # drop mecz dla ktorego liczymy szanse
-    df = df[["home_team_api_id", "away_team_api_id", "home_team_goal", "away_team_goal"]]
-    df = df.rename(columns={'home_team_goal': 'HomeGoals', 'away_team_goal': 'AwayGoals'})
-
-    print(df)
-
-    goal_model_data = pd.concat([df[['home_team_api_id', 'away_team_api_id', 'HomeGoals']].assign(home=1).rename(
-        columns={'home_team_api_id': 'team', 'away_team_api_id': 'opponent', 'HomeGoals': 'goals'}),
-        df[['away_team_api_id', 'home_team_api_id', 'AwayGoals']].assign(home=0).rename(
-            columns={'away_team_api_id': 'team', 'home_team_api_id': 'opponent', 'AwayGoals': 'goals'})])
-
-    poisson_model = smf.glm(formula="goals ~ home + team + opponent", data=goal_model_data,
-                            family=sm.families.Poisson()).fit()
-
-    decyzja = await simulate_match(poisson_model, hometeam, awayteam, max_goals=10)
-    print(f"{hometeam} win: {np.sum(np.tril(decyzja, -1))}")
-    print(f"remis: {np.sum(np.diag(decyzja))}")
-    print(f"{awayteam} win: {np.sum(np.triu(decyzja, 1))}")
-    print(f"suma: {np.sum(np.tril(decyzja, -1)) + np.sum(np.diag(decyzja)) + np.sum(np.triu(decyzja, 1))}")
-
-    return_dict = {"home_team": float(np.sum(np.tril(decyzja, -1))), "draw": float(np.sum(np.diag(decyzja))),
-                   "away_team": float(np.sum(np.triu(decyzja, 1)))}
-
-    return return_dict
+async def main(retries: int = 5, delay: int = 5) -> None:
+    global pool, snapshot
+    pool = ProcessPoolExecutor(max_workers=config.SIMULATION_WORKERS)
 
+    if config.TRANSPORT == "unix":
+        await socket_server.serve(config.SOCKET_PATH, pool)
+        return
 
-async def main(retries: int = 5, delay: int = 5) -> None:
     conn_successful = False
     connection = None
     for attempt in range(retries):
@@ -78,29 +107,46 @@ async def main(retries: int = 5, delay: int = 5) -> None:
         raise ConnectionError("Could not connect to RabbitMQ after several retries")
 
     channel = await connection.channel()
+    # only as many unacknowledged messages as the pool runs at once, so the
+    # rest wait in the broker where higher priorities overtake them
+    await channel.set_qos(prefetch_count=config.PREFETCH_COUNT or config.SIMULATION_WORKERS or os.cpu_count())
     exchange = channel.default_exchange
 
-    queue = await channel.declare_queue("rpc_queue")
+    arguments = {"x-max-priority": config.MAX_PRIORITY}
+    if config.EXCHANGE:
+        # every worker binds its own queue to the consistent-hash exchange;
+        # the queue goes away with the worker, and the ring rebalances
+        shards = await channel.declare_exchange(config.EXCHANGE, type="x-consistent-hash", durable=True)
+        queue = await channel.declare_queue(exclusive=True, arguments=arguments)
+        await queue.bind(shards, routing_key=str(config.SHARD_WEIGHT))
+    else:
+        queue = await channel.declare_queue("rpc_queue", arguments=arguments)
+    if config.SNAPSHOT_PATH:
+        snapshot = Snapshot.load(config.SNAPSHOT_PATH)
+        print(f" [x] Loaded {len(snapshot)} results from the snapshot")
+        saver = asyncio.create_task(save_periodically(config.SNAPSHOT_PATH, config.SNAPSHOT_INTERVAL))
+        # docker stop sends SIGTERM; cancelling main saves the snapshot on the way out
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
     print(" [x] Awaiting RPC requests")
-    async with queue.iterator() as qiterator:
-        message: AbstractIncomingMessage
-        async for message in qiterator:
-            try:
-                async with message.process(requeue=False):
-                    assert message.reply_to is not None
-                    data = message.body.decode()
-
-                    response = str(await calc_odds(data)).encode()
-                    await exchange.publish(
-                        Message(
-                            body=response,
-                            correlation_id=message.correlation_id,
-                        ), routing_key=message.reply_to, )
-                    print("Request complete")
-            except Exception:
-                logging.exception("Processing error for message %r", message)
+    # every message is handled in its own task, so a simulation running in
+    # the process pool doesn't hold up the odds requests queued behind it
+    tasks = set()
+    try:
+        async with queue.iterator() as qiterator:
+            message: AbstractIncomingMessage
+            async for message in qiterator:
+                task = asyncio.create_task(process(exchange, message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+    finally:
+        if config.SNAPSHOT_PATH:
+            saver.cancel()
+            print(f" [x] Saved {save_snapshot(config.SNAPSHOT_PATH, results, config.SNAPSHOT_SIZE)} results to the snapshot")
 
 
 if __name__ == "__main__":
     # time.sleep(10)
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except asyncio.CancelledError:
+        pass
@@ -0,0 +1,94 @@
+import numpy as np
+
+from config import config
+from glm import fit_goal_model, poisson_pmf
+
+
+def goal_model_data(df):
+    """Reshapes matches into one row per team and match, as the goal model expects.
+
+    df has the columns home_team_api_id, away_team_api_id, HomeGoals and AwayGoals.
+    """
+    import pandas as pd
+
+    return pd.concat([df[['home_team_api_id', 'away_team_api_id', 'HomeGoals']].assign(home=1).rename(
+        columns={'home_team_api_id': 'team', 'away_team_api_id': 'opponent', 'HomeGoals': 'goals'}),
+        df[['away_team_api_id', 'home_team_api_id', 'AwayGoals']].assign(home=0).rename(
+            columns={'away_team_api_id': 'team', 'home_team_api_id': 'opponent', 'AwayGoals': 'goals'})])
+
+
+def fit_statsmodels_model(window: np.ndarray) -> dict[str, float]:
+    """Fits the goal model with statsmodels, imported only when this engine is chosen."""
+    import pandas as pd
+    import statsmodels.api as sm
+    import statsmodels.formula.api as smf
+
+    df = pd.DataFrame(np.asarray(window, dtype=np.int64).reshape(-1, 4),
+                      columns=["home_team_api_id", "away_team_api_id", "HomeGoals", "AwayGoals"])
+    foot_model = smf.glm(formula="goals ~ home + team + opponent", data=goal_model_data(df),
+                         family=sm.families.Poisson()).fit()
+    return {name: float(value) for name, value in foot_model.params.items()}
+
+
+def fit_poisson_model(window: np.ndarray) -> dict[str, float]:
+    """Fits the Poisson goal model on previous matches, [[home, away, home_goals, away_goals], ...].
+
+    The coefficients keep their formula names, "Intercept", "home", "team" and
+    "opponent". `ENGINE` picks the NumPy IRLS fit or the statsmodels GLM.
+    """
+    if config.ENGINE == "statsmodels":
+        return fit_statsmodels_model(window)
+    return fit_goal_model(window)
+
+
+def goal_rates(params: dict[str, float], home_teams, away_teams) -> tuple[np.ndarray, np.ndarray]:
+    """Predicts expected home and away goals of many fixtures at once."""
+    home_teams = np.asarray(home_teams, dtype=np.float64)
+    away_teams = np.asarray(away_teams, dtype=np.float64)
+    intercept, team, opponent = params["Intercept"], params["team"], params["opponent"]
+    home_avg = np.exp(intercept + params["home"] + team * home_teams + opponent * away_teams)
+    away_avg = np.exp(intercept + team * away_teams + opponent * home_teams)
+    return home_avg, away_avg
+
+
+def simulate_match(params: dict[str, float], homeTeam, awayTeam, max_goals=10):
+    home_goals_avg, away_goals_avg = goal_rates(params, [homeTeam], [awayTeam])
+    goals = np.arange(0, max_goals + 1)
+    return np.outer(poisson_pmf(goals, home_goals_avg[0]), poisson_pmf(goals, away_goals_avg[0]))
+
+
+def outcome_probabilities(home_avg, away_avg, max_goals=10) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Home win, draw and away win probabilities of many fixtures at once.
+
+    These are the Skellam probabilities of the goal difference being positive,
+    zero or negative, with the goals of each side truncated at max_goals.
+    """
+    goals = np.arange(max_goals + 1)
+    home_pmf = poisson_pmf(goals[None, :], np.asarray(home_avg)[:, None])
+    away_pmf = poisson_pmf(goals[None, :], np.asarray(away_avg)[:, None])
+    scores = home_pmf[:, :, None] * away_pmf[:, None, :]
+    return (np.tril(scores, -1).sum(axis=(1, 2)), np.trace(scores, axis1=1, axis2=2),
+            np.triu(scores, 1).sum(axis=(1, 2)))
+
+
+def model_coefficients(params: dict[str, float], teams) -> dict:
+    """Coefficients of a fitted goal model, so it can be evaluated without the engine.
+
+    The params keep their formula names ("Intercept", "home", "team", "opponent")
+    and the expected goals are exp of their sum weighted by the fixture's values.
+    """
+    return {
+        "teams": [int(team) for team in teams],
+        "params": {name: float(value) for name, value in params.items()},
+    }
+
+
+def fit_coefficients(data: dict) -> dict:
+    """Fits the goal model on a training window and returns its coefficients.
+
+    data: {"window": [[home, away, home_goals, away_goals], ...]}
+    """
+    window = np.asarray(data["window"], dtype=np.int64).reshape(-1, 4)
+    if not len(window):
+        return {}
+    return model_coefficients(fit_poisson_model(window), np.unique(window[:, :2]))
@@ -0,0 +1,69 @@
+import numpy as np
+
+from model import fit_poisson_model, goal_rates
+
+
+def simulate_season(data: dict) -> dict:
+    """Monte Carlo simulation of the rest of a season.
+
+    The goal model is fitted once on the played matches, then goals of every
+    remaining fixture are drawn for all simulations at once and the points
+    tables are accumulated with scatter-adds (bincount) over (simulation, team).
+
+    data: {"played": [[home, away, home_goals, away_goals], ...],
+           "fixtures": [[home, away], ...], "n": int, "relegated": int, "seed": int}
+    """
+    played = np.asarray(data["played"], dtype=np.int64).reshape(-1, 4)
+    fixtures = np.asarray(data["fixtures"], dtype=np.int64).reshape(-1, 2)
+    n = int(data["n"])
+    rng = np.random.default_rng(data.get("seed"))
+
+    teams, team_index = np.unique(np.concatenate([played[:, :2].ravel(), fixtures.ravel()]), return_inverse=True)
+    n_teams = len(teams)
+    played_teams = team_index[:played.size // 2].reshape(-1, 2)
+    fixture_teams = team_index[played.size // 2:].reshape(-1, 2)
+
+    home_goals, away_goals = played[:, 2], played[:, 3]
+    base_points = (np.bincount(played_teams[:, 0], 3 * (home_goals > away_goals) + (home_goals == away_goals), n_teams)
+                   + np.bincount(played_teams[:, 1], 3 * (away_goals > home_goals) + (home_goals == away_goals), n_teams))
+    base_difference = (np.bincount(played_teams[:, 0], home_goals - away_goals, n_teams)
+                       + np.bincount(played_teams[:, 1], away_goals - home_goals, n_teams))
+
+    points = np.tile(base_points, (n, 1))
+    difference = np.tile(base_difference, (n, 1))
+    if len(fixtures):
+        home_avg, away_avg = goal_rates(fit_poisson_model(played), fixtures[:, 0], fixtures[:, 1])
+
+        simulated_home = rng.poisson(home_avg, size=(n, len(fixtures)))
+        simulated_away = rng.poisson(away_avg, size=(n, len(fixtures)))
+        home_points = 3 * (simulated_home > simulated_away) + (simulated_home == simulated_away)
+        away_points = 3 * (simulated_away > simulated_home) + (simulated_home == simulated_away)
+
+        offsets = (np.arange(n) * n_teams)[:, None]
+        home_slots = (offsets + fixture_teams[:, 0]).ravel()
+        away_slots = (offsets + fixture_teams[:, 1]).ravel()
+        points += (np.bincount(home_slots, home_points.ravel(), n * n_teams)
+                   + np.bincount(away_slots, away_points.ravel(), n * n_teams)).reshape(n, n_teams).astype(np.int64)
+        goal_difference = (simulated_home - simulated_away).ravel()
+        difference += (np.bincount(home_slots, goal_difference, n * n_teams)
+                       - np.bincount(away_slots, goal_difference, n * n_teams)).reshape(n, n_teams).astype(np.int64)
+
+    # points, then goal difference, then a coin toss
+    keys = points * 10000 + difference + rng.random((n, n_teams))
+    ranking = np.argsort(-keys, axis=1)
+    positions = np.empty_like(ranking)
+    np.put_along_axis(positions, ranking, np.arange(n_teams)[None, :], axis=1)
+    position_counts = np.bincount((np.arange(n_teams)[None, :] * n_teams + positions).ravel(),
+                                  minlength=n_teams * n_teams).reshape(n_teams, n_teams)
+    position_probabilities = position_counts / n
+    relegated = int(data.get("relegated", 3))
+
+    return {"teams": [
+        {"team_api_id": int(teams[t]),
+         "points": int(base_points[t]),
+         "expected_points": float(points[:, t].mean()),
+         "title": float(position_probabilities[t, 0]),
+         "relegation": float(position_probabilities[t, n_teams - relegated:].sum()) if relegated else 0.0,
+         "positions": position_probabilities[t].tolist()}
+        for t in np.argsort(-points.mean(axis=0))
+    ]}
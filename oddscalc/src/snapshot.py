@@ -0,0 +1,132 @@
+"""Snapshots of the worker's result cache, so a restarted worker starts hot.
+
+The cache keys are (message type, sha1 of the request body); for fits the
+body is the league's training window, so the hash stands for the league,
+season and date it was cut at. A snapshot in the `SNAPSHOT_PATH` directory is
+
+    index.npz         types (S8), digests (uint8, n x 20) and offsets (int64, n + 1) of the entries
+    results-<id>.npy  the msgpack encoded results back to back, as one uint8 array
+
+The results file is memory-mapped on load and an entry is decoded only when
+its key is first requested. A new results file is written next to the old
+one and the index replaced atomically, so a reader never sees a half
+written snapshot.
+
+Scaled workers share the directory. Their shards are rebalanced on every
+redeploy, so each worker loads every worker's results, and a save merges
+the worker's cache into the snapshot currently on disk rather than
+replacing it. Results files the index no longer points at are removed
+once they are older than `STALE_AFTER` seconds, so a file another worker
+has just written but not yet indexed is kept.
+"""
+
+import glob
+import logging
+import os
+import time
+import uuid
+from typing import Any, Hashable, Iterable
+
+import numpy as np
+
+from cache import LRUCache
+from codec import decode, encode
+
+INDEX = "index.npz"
+STALE_AFTER = 60.0
+
+
+class Snapshot:
+    """A memory-mapped snapshot answering the keys it holds."""
+
+    def __init__(
+            self,
+            types: np.ndarray,
+            digests: np.ndarray,
+            offsets: np.ndarray,
+            blob: np.ndarray,
+    ) -> None:
+        self._offsets = offsets
+        self._blob = blob
+        raw_digests = digests.tobytes()
+        self._rows = {
+            (kind.decode() or None, raw_digests[20 * row:20 * (row + 1)]): row
+            for row, kind in enumerate(types.tolist())
+        }
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @classmethod
+    def load(cls, path: str) -> "Snapshot":
+        """Memory-maps the snapshot in a directory, an empty one if there is none."""
+        try:
+            with np.load(os.path.join(path, INDEX)) as index:
+                types, digests, offsets = index["types"], index["digests"], index["offsets"]
+                blob_name = str(index["blob"])
+                blob = np.load(os.path.join(path, blob_name), mmap_mode="r")
+        except FileNotFoundError:
+            return cls.empty()
+        except (OSError, ValueError, KeyError):
+            logging.exception("Ignoring the unreadable snapshot in %s", path)
+            return cls.empty()
+        return cls(types, digests, offsets, blob)
+
+    @classmethod
+    def empty(cls) -> "Snapshot":
+        return cls(np.empty(0, "S8"), np.empty((0, 20), np.uint8), np.zeros(1, np.int64), np.empty(0, np.uint8))
+
+    def raw(self, key: Hashable) -> bytes | None:
+        if (row := self._rows.get(key)) is None:
+            return None
+        return self._blob[self._offsets[row]:self._offsets[row + 1]].tobytes()
+
+    def get(self, key: Hashable) -> Any:
+        """The cached result of a key, None if the snapshot doesn't hold it."""
+        body = self.raw(key)
+        return None if body is None else decode(body)
+
+    def keys(self) -> Iterable[Hashable]:
+        return self._rows.keys()
+
+
+def save_snapshot(path: str, results: LRUCache, size: int) -> int:
+    """Merges the cached results into the snapshot directory.
+
+    The cache's entries come first, most recently used first, then the
+    entries of the snapshot on disk, saved by any of the workers, not in
+    the cache, up to `size` entries. Returns the number of entries written.
+    """
+    entries = [(key, encode(result)) for key, result in results.items()][:size]
+    seen = {key for key, _ in entries}
+    snapshot = Snapshot.load(path)
+    for key in snapshot.keys():
+        if len(entries) >= size:
+            break
+        if key not in seen:
+            entries.append((key, snapshot.raw(key)))
+    if not entries:
+        return 0
+
+    os.makedirs(path, exist_ok=True)
+    blob_name = f"results-{uuid.uuid4().hex}.npy"
+    np.save(os.path.join(path, blob_name), np.frombuffer(b"".join(body for _, body in entries), dtype=np.uint8))
+    index = os.path.join(path, f"{INDEX}.{uuid.uuid4().hex}.tmp")
+    with open(index, "wb") as file:
+        np.savez(
+            file,
+            types=np.array([(kind or "").encode() for (kind, _), _ in entries], dtype="S8"),
+            digests=np.frombuffer(b"".join(digest for (_, digest), _ in entries), dtype=np.uint8).reshape(-1, 20),
+            offsets=np.concatenate([[0], np.cumsum([len(body) for _, body in entries], dtype=np.int64)]),
+            blob=np.array(blob_name),
+        )
+    os.replace(index, os.path.join(path, INDEX))
+
+    # files still mapped by a running worker stay readable until it unmaps them
+    for name in glob.glob(os.path.join(path, "results-*.npy")):
+        try:
+            if os.path.basename(name) != blob_name and time.time() - os.path.getmtime(name) > STALE_AFTER:
+                os.remove(name)
+        except FileNotFoundError:
+            pass
+    return len(entries)
@@ -0,0 +1,62 @@
+"""The odds worker served over a Unix socket, for single-node deployments.
+
+Frames are a 4-byte big-endian length followed by a version 1 payload
+(see codec). Requests are [request_id, message_type, payload] and
+replies [request_id, result, error]. Requests on one connection are
+handled concurrently and may be answered out of order.
+"""
+
+import asyncio
+import logging
+import os
+import struct
+from concurrent.futures import Executor
+
+from codec import decode, encode
+from engine import compute
+
+HEADER = struct.Struct(">I")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+    return await reader.readexactly(length)
+
+
+def frame(payload) -> bytes:
+    body = encode(payload)
+    return HEADER.pack(len(body)) + body
+
+
+async def handle_request(writer: asyncio.StreamWriter, pool: Executor, request: bytes) -> None:
+    request_id, message_type, data = decode(request)
+    loop = asyncio.get_running_loop()
+    try:
+        reply = [request_id, await loop.run_in_executor(pool, compute, message_type, data), None]
+    except Exception as e:
+        logging.exception("Processing error for request %r", request_id)
+        reply = [request_id, None, repr(e)]
+    writer.write(frame(reply))
+    await writer.drain()
+
+
+async def serve(path: str, pool: Executor) -> None:
+    if os.path.exists(path):
+        os.unlink(path)
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = set()
+        try:
+            while True:
+                task = asyncio.create_task(handle_request(writer, pool, await read_frame(reader)))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_unix_server(handle_connection, path)
+    print(f" [x] Awaiting requests on {path}")
+    async with server:
+        await server.serve_forever()